@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.api.deps import get_db, require_admin
+from app.cache.redis_l2 import CATALOG_VERSION, redis_l2_cache
 from app.models.raw_skill import RawSkill
 from app.schemas.admin_skill import AdminSkillCreate
 from app.schemas.skill_validation_report import SkillValidationReport
@@ -57,6 +58,7 @@ async def approve_skill(
         pass
     
     await db.commit()
+    await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
     return skill
 
 
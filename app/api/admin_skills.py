@@ -9,11 +9,13 @@ from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, require_admin
+from app.cache.redis_l2 import CATALOG_VERSION, redis_l2_cache
 from app.models.skill_trust_audit import SkillTrustAudit
 from app.schemas.api_key import TrustAuditItem, TrustOverrideRequest
 from app.schemas.skill import SkillDetail
 from app.schemas.admin_skill import AdminSkillCreate, AdminSkillUpdate
 from app.repos.admin_skill_repo import AdminSkillRepo
+from app.repos.public_skill_search_repo import refresh_public_skill_search
 from app.repos.skill_repo import SkillRepo
 
 router = APIRouter()
@@ -33,6 +35,7 @@ async def create_skill(
         await db.rollback()
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     await db.commit()
+    await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
     return skill
 
 
@@ -57,6 +60,7 @@ async def update_skill(
         await db.rollback()
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     await db.commit()
+    await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
     return updated_skill
 
 
@@ -75,7 +79,9 @@ async def delete_skill(
         raise HTTPException(status_code=404, detail="Skill not found")
     
     await db.delete(skill)
+    await refresh_public_skill_search(db, [id])
     await db.commit()
+    await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
     return {"status": "deleted"}
 
 
@@ -132,7 +138,9 @@ async def override_skill_trust(
             after=after,
         )
     )
+    await refresh_public_skill_search(db, [skill.id])
     await db.commit()
+    await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
     await db.refresh(skill)
     return skill
 
@@ -9,10 +9,15 @@ PUBLIC_DETAIL_CACHE = "public, max-age=60, s-maxage=120, stale-while-revalidate=
 # Taxonomy-like endpoints that change rarely.
 PUBLIC_TAXONOMY_CACHE = "public, max-age=300, s-maxage=600, stale-while-revalidate=3600"
 
-# Redis L2 TTLs (seconds)
-REDIS_TTL_SEARCH = 30
-REDIS_TTL_DETAIL = 120
-REDIS_TTL_TAXONOMY = 600
+# Redis L2 TTLs (seconds): fresh for TTL, then served stale (and refreshed) for STALE more.
+# Writers bump namespace versions on change (see `RedisL2Cache.key_for_request`), so these
+# only bound memory use and data the writers do not track, not visibility of edits.
+REDIS_TTL_SEARCH = 3600
+REDIS_TTL_DETAIL = 6 * 3600
+REDIS_TTL_TAXONOMY = 6 * 3600
+REDIS_STALE_SEARCH = 900
+REDIS_STALE_DETAIL = 3600
+REDIS_STALE_TAXONOMY = 3600
 
 
 def set_public_cache(response: Response, cache_control: str) -> None:
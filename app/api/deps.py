@@ -7,7 +7,7 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import AsyncSessionLocal
+from app.db.session import AsyncSessionLocal, ReadSessionLocal
 from app.models.api_key import ApiKey
 from app.repos.api_key_repo import ApiKeyRepo, build_api_key_header_candidates
 from app.settings import get_settings
@@ -27,6 +27,18 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Read-only database session dependency (replica when DATABASE_READ_URL is set).
+
+    Only for public GET endpoints; anything that writes must use `get_db`.
+    """
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 async def require_admin(token: Annotated[str, Depends(oauth2_scheme)]) -> dict:
     """Verify admin token."""
     payload = decode_token(token)
@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_db, require_api_key, require_api_scope
 from app.models.api_key import ApiKey
 from app.repos.api_key_repo import ApiKeyRepo
-from app.repos.public_filters import is_public_skill_url
+from app.repos.pagination import page_count
 from app.repos.skill_repo import SkillRepo
 from app.schemas.api_key import ApiKeyUsagePoint, ApiKeyUsageResponse
 from app.schemas.common import Page
@@ -30,6 +30,10 @@ async def developer_list_skills(
     sort: str = "popularity",
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque keyset cursor from a previous `next_cursor` (overrides `page`).",
+    ),
 ):
     """Public skill list for external developers (API key required)."""
     _ = api_key
@@ -41,10 +45,18 @@ async def developer_list_skills(
         sort=sort,
         page=page,
         size=size,
+        cursor=cursor,
+    )
+    page_slice = await repo.list_skills(query)
+    return Page(
+        items=page_slice.scalars(),
+        total=page_slice.total,
+        page=page,
+        size=size,
+        pages=page_count(page_slice.total, size),
+        total_estimated=page_slice.total_estimated,
+        next_cursor=page_slice.next_cursor,
     )
-    items, total = await repo.list_skills(query)
-    pages = (total + size - 1) // size if total > 0 else 0
-    return Page(items=items, total=int(total), page=page, size=size, pages=pages)
 
 
 @router.get("/skills/{id}", response_model=SkillDetail)
@@ -59,7 +71,7 @@ async def developer_get_skill(
     skill = await repo.get_skill(id)
     if not skill:
         raise HTTPException(status_code=404, detail="Skill not found")
-    if not skill.is_official or not skill.is_verified or not is_public_skill_url(skill.url):
+    if not skill.is_public:
         raise HTTPException(status_code=404, detail="Skill not found")
     return skill
 
@@ -10,9 +10,12 @@ from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
+from app.cache.redis_l2 import POPULARITY_VERSION, redis_l2_cache
 from app.models.skill_event import SkillEvent
 from app.models.skill_popularity import SkillPopularity
+from app.repos.public_skill_search_repo import refresh_public_skill_popularity
 from app.schemas.event import EventPayload
+from app.settings import get_settings
 
 router = APIRouter()
 
@@ -110,7 +113,13 @@ async def track_event(
 
     popularity.score = float(popularity.views + (popularity.uses * 10) + (popularity.favorites * 50))
     await db.flush()
+    await refresh_public_skill_popularity(db, [payload.skill_id])
     event_id = str(event.id)
     await db.commit()
+    # Cached lists/rankings show these counters; refresh them at most once per window.
+    await redis_l2_cache.bump_namespaces_debounced(
+        POPULARITY_VERSION,
+        window_seconds=get_settings().cache_popularity_bump_debounce_seconds,
+    )
 
     return {"status": "accepted", "event_id": event_id, "counted": True}
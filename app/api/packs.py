@@ -10,17 +10,19 @@ from sqlalchemy import case, desc, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_db
+from app.api.deps import get_read_db
 from app.api.cache_headers import (
     PUBLIC_DETAIL_CACHE,
     PUBLIC_SEARCH_CACHE,
+    REDIS_STALE_DETAIL,
+    REDIS_STALE_SEARCH,
     REDIS_TTL_DETAIL,
     REDIS_TTL_SEARCH,
     set_public_cache,
 )
-from app.models.skill import Skill
-from app.repos.public_filters import public_skill_conditions
-from app.api.response_cache import set_cached_response, try_cached_response
+from app.models.public_skill_search import PublicSkillSearch
+from app.repos.pagination import fetch_page, page_count
+from app.api.response_cache import cached_json_response
 from app.schemas.common import Page
 from app.schemas.pack import PackListItem, PackDetail
 from app.schemas.skill import SkillListItem
@@ -41,21 +43,27 @@ def _repo_full_name_from_pack_id(pack_id: str) -> str:
     return repo_full_name
 
 
-def _repo_full_name_expr():
-    """
-    Extract owner/repo from canonical GitHub skill doc URL.
-    We only query rows passing `public_skill_conditions()`, so URL format is stable.
-    """
-    p = func.split_part(Skill.url, "https://github.com/", 2)
-    owner = func.split_part(p, "/", 1)
-    repo = func.split_part(p, "/", 2)
-    return func.concat(owner, literal("/"), repo)
-
-
 def _repo_url_expr(repo_full_name):
     return func.concat(literal("https://github.com/"), repo_full_name)
 
 
+def _pack_columns():
+    """Aggregate columns of a pack row over `public_skill_search` (owner/repo is precomputed)."""
+    repo_full_name = PublicSkillSearch.repo_full_name
+    return (
+        repo_full_name.label("repo_full_name"),
+        _repo_url_expr(repo_full_name).label("repo_url"),
+        func.count(PublicSkillSearch.skill_id).label("skill_count"),
+        func.max(PublicSkillSearch.updated_at).label("updated_at"),
+        func.sum(
+            case((PublicSkillSearch.url.ilike("%/.claude/skills/%/SKILL.md"), 1), else_=0)
+        ).label("dotclaude_skill_count"),
+        func.sum(
+            case((PublicSkillSearch.url.ilike("%/skills/%/SKILL.md"), 1), else_=0)
+        ).label("skills_dir_skill_count"),
+    )
+
+
 def _skill_list_page_payload(page_result: Page[SkillListItem]) -> dict:
     return {
         "items": [SkillListItem.model_validate(item).model_dump(mode="json") for item in page_result.items],
@@ -63,6 +71,8 @@ def _skill_list_page_payload(page_result: Page[SkillListItem]) -> dict:
         "page": page_result.page,
         "size": page_result.size,
         "pages": page_result.pages,
+        "total_estimated": page_result.total_estimated,
+        "next_cursor": page_result.next_cursor,
     }
 
 
@@ -70,87 +80,68 @@ def _skill_list_page_payload(page_result: Page[SkillListItem]) -> dict:
 async def list_packs(
     request: Request,
     response: Response,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     q: Optional[str] = None,
     sort: str = "skills",
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
 ):
     set_public_cache(response, PUBLIC_SEARCH_CACHE)
-    cached = await try_cached_response(
-        request=request,
-        namespace="packs:list",
-        cache_control=PUBLIC_SEARCH_CACHE,
-    )
-    if cached is not None:
-        return cached
-    repo_full_name = _repo_full_name_expr().label("repo_full_name")
-    repo_url = _repo_url_expr(repo_full_name).label("repo_url")
-
-    dotclaude_count = func.sum(
-        case((Skill.url.ilike("%/.claude/skills/%/SKILL.md"), 1), else_=0)
-    ).label("dotclaude_skill_count")
-    skills_dir_count = func.sum(
-        case((Skill.url.ilike("%/skills/%/SKILL.md"), 1), else_=0)
-    ).label("skills_dir_skill_count")
-
-    base = (
-        select(
-            repo_full_name,
-            repo_url,
-            func.count(Skill.id).label("skill_count"),
-            func.max(Skill.updated_at).label("updated_at"),
-            dotclaude_count,
-            skills_dir_count,
-        )
-        .where(*public_skill_conditions())
-        .group_by(repo_full_name, repo_url)
-    )
 
-    if q:
-        needle = q.strip()
-        if needle:
-            base = base.having(repo_full_name.ilike(f"%{needle}%"))
-
-    # Count total packs
-    total = (await db.execute(select(func.count()).select_from(base.subquery()))).scalar_one()
-
-    # Sorting
-    if sort == "updated":
-        base = base.order_by(desc(func.max(Skill.updated_at)))
-    else:
-        # Default: by number of skills, then by recency
-        base = base.order_by(desc(func.count(Skill.id)), desc(func.max(Skill.updated_at)))
-
-    base = base.offset((page - 1) * size).limit(size)
-    rows = (await db.execute(base)).all()
-
-    items: list[PackListItem] = []
-    for row in rows:
-        repo_full_name_value = str(row.repo_full_name)
-        items.append(
-            PackListItem(
-                id=_pack_id_from_repo_full_name(repo_full_name_value),
-                repo_full_name=repo_full_name_value,
-                repo_url=str(row.repo_url),
-                skill_count=int(row.skill_count or 0),
-                updated_at=row.updated_at,
-                dotclaude_skill_count=int(row.dotclaude_skill_count or 0),
-                skills_dir_skill_count=int(row.skills_dir_skill_count or 0),
+    async def build(session: AsyncSession) -> dict:
+        repo_full_name = PublicSkillSearch.repo_full_name
+        base = select(*_pack_columns()).group_by(repo_full_name)
+
+        if q:
+            needle = q.strip()
+            if needle:
+                base = base.where(repo_full_name.ilike(f"%{needle}%"))
+
+        # Sorting
+        latest_update = func.max(PublicSkillSearch.updated_at)
+        if sort == "updated":
+            base = base.order_by(desc(latest_update))
+        else:
+            # Default: by number of skills, then by recency
+            base = base.order_by(desc(func.count(PublicSkillSearch.skill_id)), desc(latest_update))
+
+        page_slice = await fetch_page(session, base, page=page, size=size)
+
+        items: list[PackListItem] = []
+        for row in page_slice.rows:
+            repo_full_name_value = str(row.repo_full_name)
+            items.append(
+                PackListItem(
+                    id=_pack_id_from_repo_full_name(repo_full_name_value),
+                    repo_full_name=repo_full_name_value,
+                    repo_url=str(row.repo_url),
+                    skill_count=int(row.skill_count or 0),
+                    updated_at=row.updated_at,
+                    dotclaude_skill_count=int(row.dotclaude_skill_count or 0),
+                    skills_dir_skill_count=int(row.skills_dir_skill_count or 0),
+                )
             )
+
+        page_result = Page(
+            items=items,
+            total=page_slice.total,
+            page=page,
+            size=size,
+            pages=page_count(page_slice.total, size),
+            total_estimated=page_slice.total_estimated,
         )
+        return page_result.model_dump(mode="json")
 
-    pages = (int(total or 0) + size - 1) // size
-    page_result = Page(items=items, total=int(total or 0), page=page, size=size, pages=pages)
-    payload = page_result.model_dump(mode="json")
-    await set_cached_response(
+    return await cached_json_response(
         request=request,
+        response=response,
+        db=db,
         namespace="packs:list",
-        payload=payload,
+        cache_control=PUBLIC_SEARCH_CACHE,
         ttl_seconds=REDIS_TTL_SEARCH,
+        stale_seconds=REDIS_STALE_SEARCH,
+        build_payload=build,
     )
-    response.headers["X-Cache"] = "MISS"
-    return payload
 
 
 @router.get("/{id}", response_model=PackDetail)
@@ -158,75 +149,53 @@ async def get_pack(
     request: Request,
     response: Response,
     id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ):
     set_public_cache(response, PUBLIC_DETAIL_CACHE)
-    cached = await try_cached_response(
-        request=request,
-        namespace="packs:detail",
-        cache_control=PUBLIC_DETAIL_CACHE,
-    )
-    if cached is not None:
-        return cached
-    repo_full_name_value = _repo_full_name_from_pack_id(id)
-    repo_full_name = _repo_full_name_expr().label("repo_full_name")
-    repo_url = _repo_url_expr(repo_full_name).label("repo_url")
-
-    dotclaude_count = func.sum(
-        case((Skill.url.ilike("%/.claude/skills/%/SKILL.md"), 1), else_=0)
-    ).label("dotclaude_skill_count")
-    skills_dir_count = func.sum(
-        case((Skill.url.ilike("%/skills/%/SKILL.md"), 1), else_=0)
-    ).label("skills_dir_skill_count")
-
-    stmt = (
-        select(
-            repo_full_name,
-            repo_url,
-            func.count(Skill.id).label("skill_count"),
-            func.max(Skill.updated_at).label("updated_at"),
-            dotclaude_count,
-            skills_dir_count,
+
+    async def build(session: AsyncSession) -> dict:
+        repo_full_name_value = _repo_full_name_from_pack_id(id)
+        stmt = (
+            select(*_pack_columns())
+            .where(PublicSkillSearch.repo_full_name == repo_full_name_value)
+            .group_by(PublicSkillSearch.repo_full_name)
         )
-        .where(*public_skill_conditions())
-        .group_by(repo_full_name, repo_url)
-        .having(repo_full_name == repo_full_name_value)
-        .limit(1)
-    )
-    row = (await db.execute(stmt)).first()
-    if not row:
-        raise HTTPException(status_code=404, detail="Pack not found")
+        row = (await session.execute(stmt)).first()
+        if not row:
+            raise HTTPException(status_code=404, detail="Pack not found")
+
+        # Optional description: use the most recently updated skill description as a placeholder.
+        desc_stmt = (
+            select(PublicSkillSearch.description)
+            .where(PublicSkillSearch.repo_full_name == repo_full_name_value)
+            .order_by(PublicSkillSearch.updated_at.desc())
+            .limit(1)
+        )
+        description = (await session.execute(desc_stmt)).scalar_one_or_none()
+
+        repo_full_name_str = str(row.repo_full_name)
+        result = PackDetail(
+            id=_pack_id_from_repo_full_name(repo_full_name_str),
+            repo_full_name=repo_full_name_str,
+            repo_url=str(row.repo_url),
+            skill_count=int(row.skill_count or 0),
+            updated_at=row.updated_at,
+            dotclaude_skill_count=int(row.dotclaude_skill_count or 0),
+            skills_dir_skill_count=int(row.skills_dir_skill_count or 0),
+            description=description,
+        )
+        return result.model_dump(mode="json")
 
-    # Optional description: use the most recently updated skill description as a placeholder.
-    desc_stmt = (
-        select(Skill.description)
-        .where(*public_skill_conditions())
-        .where(repo_full_name == repo_full_name_value)
-        .order_by(Skill.updated_at.desc())
-        .limit(1)
-    )
-    description = (await db.execute(desc_stmt)).scalar_one_or_none()
-
-    repo_full_name_str = str(row.repo_full_name)
-    result = PackDetail(
-        id=_pack_id_from_repo_full_name(repo_full_name_str),
-        repo_full_name=repo_full_name_str,
-        repo_url=str(row.repo_url),
-        skill_count=int(row.skill_count or 0),
-        updated_at=row.updated_at,
-        dotclaude_skill_count=int(row.dotclaude_skill_count or 0),
-        skills_dir_skill_count=int(row.skills_dir_skill_count or 0),
-        description=description,
-    )
-    payload = result.model_dump(mode="json")
-    await set_cached_response(
+    return await cached_json_response(
         request=request,
+        response=response,
+        db=db,
         namespace="packs:detail",
-        payload=payload,
+        cache_control=PUBLIC_DETAIL_CACHE,
         ttl_seconds=REDIS_TTL_DETAIL,
+        stale_seconds=REDIS_STALE_DETAIL,
+        build_payload=build,
     )
-    response.headers["X-Cache"] = "MISS"
-    return payload
 
 
 @router.get("/{id}/skills", response_model=Page[SkillListItem])
@@ -234,45 +203,41 @@ async def list_pack_skills(
     request: Request,
     response: Response,
     id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
 ):
     set_public_cache(response, PUBLIC_SEARCH_CACHE)
-    cached = await try_cached_response(
-        request=request,
-        namespace="packs:skills",
-        cache_control=PUBLIC_SEARCH_CACHE,
-    )
-    if cached is not None:
-        return cached
-    repo_full_name_value = _repo_full_name_from_pack_id(id)
-    repo_full_name = _repo_full_name_expr()
-
-    stmt = (
-        select(Skill)
-        .where(*public_skill_conditions())
-        .where(repo_full_name == repo_full_name_value)
-        .order_by(Skill.updated_at.desc())
-    )
 
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total = (await db.execute(count_stmt)).scalar_one()
+    async def build(session: AsyncSession) -> dict:
+        repo_full_name_value = _repo_full_name_from_pack_id(id)
+        stmt = (
+            select(PublicSkillSearch)
+            .where(PublicSkillSearch.repo_full_name == repo_full_name_value)
+            .order_by(PublicSkillSearch.updated_at.desc(), PublicSkillSearch.skill_id.desc())
+        )
 
-    stmt = stmt.offset((page - 1) * size).limit(size)
-    # Avoid async lazy-load during Pydantic serialization (MissingGreenlet).
-    # SkillListItem reads `views/stars/score` via Skill.popularity.
-    stmt = stmt.options(selectinload(Skill.category), selectinload(Skill.popularity))
-    rows = (await db.execute(stmt)).scalars().all()
+        # Avoid async lazy-load during Pydantic serialization (MissingGreenlet).
+        stmt = stmt.options(selectinload(PublicSkillSearch.category))
+        page_slice = await fetch_page(session, stmt, page=page, size=size)
+
+        page_result = Page(
+            items=page_slice.scalars(),
+            total=page_slice.total,
+            page=page,
+            size=size,
+            pages=page_count(page_slice.total, size),
+            total_estimated=page_slice.total_estimated,
+        )
+        return _skill_list_page_payload(page_result)
 
-    pages = (int(total or 0) + size - 1) // size
-    page_result = Page(items=rows, total=int(total or 0), page=page, size=size, pages=pages)
-    payload = _skill_list_page_payload(page_result)
-    await set_cached_response(
+    return await cached_json_response(
         request=request,
+        response=response,
+        db=db,
         namespace="packs:skills",
-        payload=payload,
+        cache_control=PUBLIC_SEARCH_CACHE,
         ttl_seconds=REDIS_TTL_SEARCH,
+        stale_seconds=REDIS_STALE_SEARCH,
+        build_payload=build,
     )
-    response.headers["X-Cache"] = "MISS"
-    return payload
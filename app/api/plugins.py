@@ -9,10 +9,16 @@ from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
-from app.api.cache_headers import PUBLIC_SEARCH_CACHE, REDIS_TTL_SEARCH, set_public_cache
+from app.api.deps import get_read_db
+from app.api.cache_headers import (
+    PUBLIC_SEARCH_CACHE,
+    REDIS_STALE_SEARCH,
+    REDIS_TTL_SEARCH,
+    set_public_cache,
+)
 from app.ingest.sources import SOURCES
-from app.api.response_cache import set_cached_response, try_cached_response
+from app.api.response_cache import cached_json_response
+from app.repos.pagination import page_count
 from app.repos.skill_repo import SkillRepo
 from app.schemas.common import Page
 from app.schemas.skill import SkillListItem, SkillQuery
@@ -44,6 +50,8 @@ def _skill_list_page_payload(page_result: Page[SkillListItem]) -> dict:
         "page": page_result.page,
         "size": page_result.size,
         "pages": page_result.pages,
+        "total_estimated": page_result.total_estimated,
+        "next_cursor": page_result.next_cursor,
     }
 
 
@@ -51,50 +59,54 @@ def _skill_list_page_payload(page_result: Page[SkillListItem]) -> dict:
 async def list_plugins(
     request: Request,
     response: Response,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     q: Optional[str] = None,
     category: Optional[str] = None,
     tags: Optional[list[str]] = Query(None),
     sort: str = "popularity",
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque keyset cursor from a previous `next_cursor` (overrides `page`).",
+    ),
 ):
     """List plugin-marketplace items (as Skill cards) with filtering."""
     set_public_cache(response, PUBLIC_SEARCH_CACHE)
-    cached = await try_cached_response(
+
+    async def build(session: AsyncSession) -> dict:
+        repo = SkillRepo(session)
+        query = SkillQuery(
+            q=q,
+            category_slug=category,
+            tag_slugs=tags,
+            sort=sort,
+            page=page,
+            size=size,
+            cursor=cursor,
+        )
+        page_slice = await repo.list_skills_from_source_names(
+            query,
+            source_names=_default_plugin_source_names(),
+        )
+        page_result = Page(
+            items=page_slice.scalars(),
+            total=page_slice.total,
+            page=page,
+            size=size,
+            pages=page_count(page_slice.total, size),
+            total_estimated=page_slice.total_estimated,
+            next_cursor=page_slice.next_cursor,
+        )
+        return _skill_list_page_payload(page_result)
+
+    return await cached_json_response(
         request=request,
+        response=response,
+        db=db,
         namespace="plugins:list",
         cache_control=PUBLIC_SEARCH_CACHE,
-    )
-    if cached is not None:
-        return cached
-    repo = SkillRepo(db)
-    query = SkillQuery(
-        q=q,
-        category_slug=category,
-        tag_slugs=tags,
-        sort=sort,
-        page=page,
-        size=size,
-    )
-    items, total = await repo.list_skills_from_source_names(
-        query,
-        source_names=_default_plugin_source_names(),
-    )
-    total_pages = (total + size - 1) // size
-    page_result = Page(
-        items=items,
-        total=total,
-        page=page,
-        size=size,
-        pages=total_pages,
-    )
-    payload = _skill_list_page_payload(page_result)
-    await set_cached_response(
-        request=request,
-        namespace="plugins:list",
-        payload=payload,
         ttl_seconds=REDIS_TTL_SEARCH,
+        stale_seconds=REDIS_STALE_SEARCH,
+        build_payload=build,
     )
-    response.headers["X-Cache"] = "MISS"
-    return payload
@@ -5,30 +5,21 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
-from app.api.cache_headers import PUBLIC_SEARCH_CACHE, REDIS_TTL_SEARCH, set_public_cache
+from app.api.deps import get_read_db
+from app.api.cache_headers import (
+    PUBLIC_SEARCH_CACHE,
+    REDIS_STALE_SEARCH,
+    REDIS_TTL_SEARCH,
+    set_public_cache,
+)
 from app.schemas.ranking import RankingItem
 from app.repos.ranking_repo import RankingRepo
-from app.api.response_cache import set_cached_response, try_cached_response
+from app.api.response_cache import cached_json_response
 
 router = APIRouter()
 
 
-@router.get("/top10", response_model=list[RankingItem])
-async def get_top10(
-    request: Request,
-    response: Response,
-    db: Annotated[AsyncSession, Depends(get_db)],
-):
-    """Get global top 10 skills."""
-    set_public_cache(response, PUBLIC_SEARCH_CACHE)
-    cached = await try_cached_response(
-        request=request,
-        namespace="rankings:top10",
-        cache_control=PUBLIC_SEARCH_CACHE,
-    )
-    if cached is not None:
-        return cached
+async def _top10_payload(db: AsyncSession) -> list[dict]:
     repo = RankingRepo(db)
     skills = await repo.get_top10_global()
     
@@ -47,12 +38,24 @@ async def get_top10(
         )
         for i, s in enumerate(skills)
     ]
-    payload_json = [item.model_dump(mode="json") for item in payload]
-    await set_cached_response(
+    return [item.model_dump(mode="json") for item in payload]
+
+
+@router.get("/top10", response_model=list[RankingItem])
+async def get_top10(
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+):
+    """Get global top 10 skills."""
+    set_public_cache(response, PUBLIC_SEARCH_CACHE)
+    return await cached_json_response(
         request=request,
+        response=response,
+        db=db,
         namespace="rankings:top10",
-        payload=payload_json,
+        cache_control=PUBLIC_SEARCH_CACHE,
         ttl_seconds=REDIS_TTL_SEARCH,
+        stale_seconds=REDIS_STALE_SEARCH,
+        build_payload=_top10_payload,
     )
-    response.headers["X-Cache"] = "MISS"
-    return payload_json
@@ -1,44 +1,351 @@
-"""Helpers to read/write shared API response cache (Redis L2)."""
+"""Helpers to read/write the API response cache (in-process L1 + shared Redis L2).
+
+`cached_json_response` looks up L1 -> L2 -> DB and implements stale-while-revalidate:
+- L1 hit: serve the body cached in this worker (`X-Cache: HIT, l1`)
+- fresh L2 hit: serve the cached payload (`X-Cache: HIT, redis-l2`) and keep it in L1
+  for at most the rest of its soft TTL
+- stale hit (past the soft TTL, before the hard TTL): serve it (`X-Cache: STALE, redis-l2`)
+  and refresh the entry in the background with a fresh DB session
+- miss: compute once per key and process (single-flight); with `REDIS_CACHE_LOCK_ENABLED`
+  a short Redis lock also coalesces the recompute across replicas
+
+Entries hold the final body bytes, rendered once and compressed once (gzip, plus brotli
+when installed; `app/cache/response_body.py`). Hits send those bytes with the encoding the
+client accepts, without JSON decoding, re-serialization or per-request compression.
+Each entry carries a strong ETag of its body; a matching `If-None-Match` gets
+`304 Not Modified` straight from L1/L2 (no body, no DB). Misses are served from the entry
+they just stored, so the first response after an expiry or version bump already carries
+the ETag (and a client still holding it gets a 304 when the data did not change).
+
+Keys embed the namespace versions (`RedisL2Cache.key_for_request`): writers call
+`redis_l2_cache.bump_namespaces(...)` after committing, and every cached response built on
+the old data becomes unreachable at once, in L1 and L2. With a read replica, entries
+(re)built within `DATABASE_READ_MAX_LAG_SECONDS` of a bump are built on the primary, so a
+lagging replica cannot store its pre-bump data under the new version.
+
+Every L2 write and version bump is announced on the Redis invalidation channel so other
+workers drop their L1 copy / pick up the new version (`listen_for_invalidations`, started in
+the app lifespan).
+"""
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.memory_l1 import response_l1_cache
+from app.cache.redis_l2 import CacheEntry, redis_l2_cache
+from app.cache.response_body import (
+    COMPRESS_MIN_SIZE,
+    accepted_encodings,
+    body_etag,
+    encode_body,
+    entity_tag,
+    matching_entity_tag,
+    render_json,
+    select_body,
+)
+from app.db.session import AsyncSessionLocal, ReadSessionLocal, has_read_replica
+from app.settings import get_settings
+
+logger = logging.getLogger(__name__)
 
-from fastapi import Request
-from fastapi.responses import JSONResponse
+PayloadBuilder = Callable[[AsyncSession], Awaitable[Any]]
 
-from app.cache.redis_l2 import redis_l2_cache
+# key -> payload future of the computation currently running in this process
+_inflight: dict[str, asyncio.Future] = {}
+# Strong references to background refresh tasks (otherwise they can be garbage collected).
+_refresh_tasks: set[asyncio.Task] = set()
 
+LOCK_POLL_INTERVAL_SECONDS = 0.05
 
-async def try_cached_response(
+
+def _cached_body(
+    entry: CacheEntry,
     *,
-    request: Request,
-    namespace: str,
+    accepted: list[str],
+    if_none_match: Optional[str],
     cache_control: str,
-) -> Optional[JSONResponse]:
-    """Return JSONResponse when Redis L2 has a cached payload."""
-    if not redis_l2_cache.enabled():
-        return None
-    key = redis_l2_cache.key_for_request(namespace=namespace, request=request)
-    payload = await redis_l2_cache.get_json(key)
-    if payload is None:
-        return None
-    response = JSONResponse(content=payload)
+    x_cache: str,
+) -> Optional[Response]:
+    """Response with stored bytes as-is (no JSON decode/encode, no per-request compression),
+    or `304 Not Modified` when the client's validator still matches.
+    """
+    matched = matching_entity_tag(if_none_match, entry.etag)
+    if matched is not None:
+        response = Response(status_code=304)
+        response.headers["ETag"] = matched
+    else:
+        selected = select_body(entry.bodies, accepted)
+        if selected is None:
+            return None
+        content_encoding, body = selected
+        response = Response(content=body, media_type="application/json")
+        if content_encoding:
+            # GZipMiddleware passes responses that already have a Content-Encoding through.
+            response.headers["Content-Encoding"] = content_encoding
+        if entry.etag:
+            response.headers["ETag"] = entity_tag(entry.etag, content_encoding)
+    response.headers["Vary"] = "Accept-Encoding"
     response.headers["Cache-Control"] = cache_control
-    response.headers["X-Cache"] = "HIT, redis-l2"
+    response.headers["X-Cache"] = x_cache
     return response
 
 
-async def set_cached_response(
+async def _encode_payload(payload: Any) -> Optional[CacheEntry]:
+    try:
+        body = render_json(payload)
+    except (TypeError, ValueError) as exc:
+        logger.warning("Response cache skipped a payload that is not plain JSON: %s", exc)
+        return None
+    if len(body) < COMPRESS_MIN_SIZE:
+        bodies = encode_body(body)
+    else:
+        # Compression runs once per (re)computation; keep it off the event loop.
+        bodies = await asyncio.to_thread(encode_body, body)
+    return CacheEntry(
+        bodies=bodies, stale=False, encodings=tuple(sorted(bodies)), etag=body_etag(body)
+    )
+
+
+def _entry_payload(entry: CacheEntry) -> Optional[Any]:
+    selected = select_body(entry.bodies, [])
+    return json.loads(selected[1]) if selected is not None else None
+
+
+async def _wait_for_other_replica(key: str, wait_ms: int) -> Optional[CacheEntry]:
+    deadline = asyncio.get_running_loop().time() + max(wait_ms, 0) / 1000.0
+    while asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(LOCK_POLL_INTERVAL_SECONDS)
+        entry = await redis_l2_cache.get_entry(key)
+        if entry is not None and not entry.stale and entry.bodies:
+            return entry
+    return None
+
+
+def _rebuild_on_primary() -> bool:
+    return has_read_replica() and redis_l2_cache.versions_changed_within(
+        get_settings().database_read_max_lag_seconds
+    )
+
+
+async def _build(db: Optional[AsyncSession], build_payload: PayloadBuilder) -> Any:
+    """`build_payload` on the primary right after a version bump (the replica may not have
+    replayed the bumping commit yet), else on `db` (a new read session when None).
+    """
+    if _rebuild_on_primary():
+        async with AsyncSessionLocal() as session:
+            return await build_payload(session)
+    if db is None:
+        async with ReadSessionLocal() as session:
+            return await build_payload(session)
+    return await build_payload(db)
+
+
+async def _compute_and_store(
+    key: str,
+    db: Optional[AsyncSession],
+    build_payload: PayloadBuilder,
     *,
-    request: Request,
-    namespace: str,
-    payload: Any,
     ttl_seconds: int,
+    stale_seconds: int,
+) -> tuple[Any, Optional[CacheEntry]]:
+    """`(payload, stored entry)`; the entry is None when the payload could not be cached."""
+    settings = get_settings()
+    token: Optional[str] = None
+    if settings.redis_cache_lock_enabled:
+        token = await redis_l2_cache.acquire_lock(key, settings.redis_cache_lock_ttl_ms)
+        if token is None:
+            # Another replica is recomputing this key: wait briefly for its result.
+            entry = await _wait_for_other_replica(key, settings.redis_cache_lock_wait_ms)
+            if entry is not None:
+                return _entry_payload(entry), entry
+    try:
+        payload = await _build(db, build_payload)
+        entry = await _encode_payload(payload)
+        if entry is None:
+            return payload, None
+        await redis_l2_cache.set_entry(
+            key,
+            entry.bodies,
+            soft_ttl_seconds=ttl_seconds,
+            hard_ttl_seconds=ttl_seconds + stale_seconds,
+            etag=entry.etag,
+        )
+        response_l1_cache.set(key, entry, ttl_seconds=ttl_seconds)
+        await redis_l2_cache.publish_invalidation(keys=[key])
+        return payload, entry
+    finally:
+        await redis_l2_cache.release_lock(key, token)
+
+
+async def _single_flight(
+    key: str,
+    db: Optional[AsyncSession],
+    build_payload: PayloadBuilder,
+    *,
+    ttl_seconds: int,
+    stale_seconds: int,
+) -> tuple[Any, Optional[CacheEntry]]:
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        return await asyncio.shield(inflight)
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await _compute_and_store(
+            key, db, build_payload, ttl_seconds=ttl_seconds, stale_seconds=stale_seconds
+        )
+        future.set_result(result)
+        return result
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        # Followers see the same error (e.g. 404) as the leader.
+        future.set_exception(exc)
+        future.exception()
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+
+async def _refresh_in_background(
+    key: str,
+    build_payload: PayloadBuilder,
+    *,
+    ttl_seconds: int,
+    stale_seconds: int,
 ) -> None:
-    """Write payload to Redis L2 if enabled."""
-    if not redis_l2_cache.enabled():
+    try:
+        await _single_flight(
+            key, None, build_payload, ttl_seconds=ttl_seconds, stale_seconds=stale_seconds
+        )
+    except Exception as exc:
+        logger.warning("Background cache refresh failed for %s: %s", key, exc)
+
+
+def _schedule_refresh(
+    key: str,
+    build_payload: PayloadBuilder,
+    *,
+    ttl_seconds: int,
+    stale_seconds: int,
+) -> None:
+    if key in _inflight:
         return
-    key = redis_l2_cache.key_for_request(namespace=namespace, request=request)
-    await redis_l2_cache.set_json(key, payload, ttl_seconds)
+    task = asyncio.create_task(
+        _refresh_in_background(
+            key, build_payload, ttl_seconds=ttl_seconds, stale_seconds=stale_seconds
+        )
+    )
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+
+async def cached_json_response(
+    *,
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    namespace: str,
+    cache_control: str,
+    ttl_seconds: int,
+    stale_seconds: int,
+    build_payload: PayloadBuilder,
+) -> Any:
+    """Serve `build_payload(db)` through Redis L2 with SWR + request coalescing.
+
+    `build_payload` must only use the session it is given: stale entries are refreshed
+    after the response is sent, with a session the refresh task opens itself.
+    Hits and misses return the stored pre-encoded body (gzip/br when the client accepts
+    it) with its ETag, so `build_payload` must return the final JSON-ready payload. Only
+    payloads that cannot be cached (not plain JSON) are returned raw.
+    """
+    key = (
+        await redis_l2_cache.key_for_request(namespace=namespace, request=request)
+        if redis_l2_cache.enabled()
+        else None
+    )
+    headers = request.headers if request is not None else {}
+    accepted = accepted_encodings(headers.get("accept-encoding"))
+    if_none_match = headers.get("if-none-match")
+    if not key:
+        payload = await build_payload(db)
+        entry = await _encode_payload(payload)
+        served = (
+            _cached_body(
+                entry,
+                accepted=accepted,
+                if_none_match=if_none_match,
+                cache_control=cache_control,
+                x_cache="MISS",
+            )
+            if entry is not None
+            else None
+        )
+        if served is not None:
+            return served
+        response.headers["X-Cache"] = "MISS"
+        return payload
+
+    local = response_l1_cache.get(key)
+    if local is not None:
+        hit = _cached_body(
+            local,
+            accepted=accepted,
+            if_none_match=if_none_match,
+            cache_control=cache_control,
+            x_cache="HIT, l1",
+        )
+        if hit is not None:
+            return hit
+
+    entry = await redis_l2_cache.get_entry(key, encodings=accepted)
+    if entry is not None:
+        hit = _cached_body(
+            entry,
+            accepted=accepted,
+            if_none_match=if_none_match,
+            cache_control=cache_control,
+            x_cache="STALE, redis-l2" if entry.stale else "HIT, redis-l2",
+        )
+        if hit is not None:
+            if entry.stale:
+                _schedule_refresh(
+                    key, build_payload, ttl_seconds=ttl_seconds, stale_seconds=stale_seconds
+                )
+            else:
+                response_l1_cache.set(key, entry, ttl_seconds=entry.fresh_for)
+            return hit
+
+    payload, entry = await _single_flight(
+        key, db, build_payload, ttl_seconds=ttl_seconds, stale_seconds=stale_seconds
+    )
+    if entry is not None:
+        served = _cached_body(
+            entry,
+            accepted=accepted,
+            if_none_match=if_none_match,
+            cache_control=cache_control,
+            x_cache="MISS",
+        )
+        if served is not None:
+            return served
+    response.headers["X-Cache"] = "MISS"
+    return payload
+
+
+def _drop_l1_entries(keys: list[str], prefixes: list[str]) -> None:
+    response_l1_cache.invalidate(keys=keys, prefixes=prefixes)
+
 
+async def listen_for_invalidations() -> None:
+    """Apply version bumps and evict L1 entries announced by other processes (until cancelled)."""
+    await redis_l2_cache.listen_invalidations(_drop_l1_entries)
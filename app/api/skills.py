@@ -5,33 +5,48 @@ import uuid
 from typing import Annotated, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
-from sqlalchemy import case, desc, func, literal, or_, select
+from sqlalchemy import func, literal, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_db
+from app.api.deps import get_read_db
 from app.api.cache_headers import (
     PUBLIC_DETAIL_CACHE,
     PUBLIC_SEARCH_CACHE,
+    REDIS_STALE_DETAIL,
+    REDIS_STALE_SEARCH,
     REDIS_TTL_DETAIL,
     REDIS_TTL_SEARCH,
     set_public_cache,
 )
-from app.models.category import Category
+from app.models.public_skill_search import PublicSkillSearch
 from app.models.skill import Skill
-from app.models.skill_popularity import SkillPopularity
-from app.models.skill_tag import SkillTag
-from app.models.tag import Tag
-from app.repos.public_filters import is_public_skill_url, public_skill_conditions
-from app.repos.skill_repo import SkillRepo
-from app.api.response_cache import set_cached_response, try_cached_response
+from app.repos.pagination import (
+    SortKey,
+    cursor_depth,
+    cursor_scope,
+    fetch_page,
+    order_by_keys,
+    page_count,
+)
+from app.repos.search_filters import build_public_search_keyword_search
+from app.repos.skill_repo import PUBLIC_TRUST_SCORE_RANK, SkillRepo, public_skill_sort_keys
+from app.api.response_cache import cached_json_response
+from app.cache.hit_log import search_hit_log
+from app.cache.query_embeddings import query_embedding_cache
+from app.llm.embeddings import embed_text, embeddings_enabled
 from app.schemas.common import Page
 from app.schemas.skill import SkillDetail, SkillListItem
+from app.settings import get_settings
 
 router = APIRouter()
 
 SearchMode = Literal["keyword", "vector", "hybrid"]
 
+# pgvector defaults hnsw.ef_search to 40 and rejects values above 1000.
+HNSW_EF_SEARCH_MIN = 40
+HNSW_EF_SEARCH_MAX = 1000
+
 
 def _parse_search_weights(mode: SearchMode, raw_weights: Optional[str]) -> tuple[float, float]:
     """Parse and normalize keyword/vector weights."""
@@ -128,11 +143,61 @@ def _resolve_active_mode(
     return requested_mode, False
 
 
+def _vector_candidate_limit(page: int, size: int, configured: int, depth: int = 0) -> int:
+    """Return how many ANN neighbours to fetch so the requested page stays covered.
+
+    `depth` is the number of rows a cursor has already served (`cursor_depth`); cursor
+    requests arrive with page=1, so without it a crawl would stop at the configured K.
+    The configured default is capped at the HNSW ceiling; a page that lies beyond it
+    is rejected with 422 rather than silently served from a truncated candidate set.
+    """
+    configured_limit = min(int(configured or 0), HNSW_EF_SEARCH_MAX)
+    limit = max(configured_limit, page * size, depth + size, 1)
+    if limit > HNSW_EF_SEARCH_MAX:
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                f"Vector and hybrid search cover the top {HNSW_EF_SEARCH_MAX} matches; "
+                "narrow the query or use mode=keyword to page deeper."
+            ),
+        )
+    return limit
+
+
+def _hnsw_ef_search(candidate_limit: int, filtered: bool = False) -> int:
+    """HNSW returns at most ef_search rows per scan, so keep it >= the candidate limit.
+
+    Filters run on the rows the index scan yields, so filtered searches scan the widest
+    candidate list to still fill `candidate_limit`.
+    """
+    if filtered:
+        return HNSW_EF_SEARCH_MAX
+    return min(max(candidate_limit, HNSW_EF_SEARCH_MIN), HNSW_EF_SEARCH_MAX)
+
+
+def _search_cursor_scope(
+    query_text: str,
+    active_mode: SearchMode,
+    keyword_weight: float,
+    vector_weight: float,
+    category: Optional[str] = None,
+    tags: Optional[list[str]] = None,
+) -> str:
+    """Bind relevance cursors to the query and filters that produced their scores."""
+    return cursor_scope(
+        "skills:search",
+        query_text,
+        active_mode,
+        f"{keyword_weight:.6f}",
+        f"{vector_weight:.6f}",
+        category,
+        sorted(tags or []),
+    )
+
+
 def is_public_skill(skill: Skill) -> bool:
-    """Apply public visibility policy to a loaded skill row."""
-    if not skill.is_official or not skill.is_verified:
-        return False
-    return is_public_skill_url(skill.url)
+    """Public visibility of a loaded skill row (precomputed on write)."""
+    return bool(skill.is_public)
 
 
 def _skill_list_page_payload(page_result: Page[SkillListItem]) -> dict:
@@ -143,6 +208,8 @@ def _skill_list_page_payload(page_result: Page[SkillListItem]) -> dict:
         "page": page_result.page,
         "size": page_result.size,
         "pages": page_result.pages,
+        "total_estimated": page_result.total_estimated,
+        "next_cursor": page_result.next_cursor,
     }
 
 
@@ -157,6 +224,7 @@ async def _list_skills_impl(
     size: int,
     mode: SearchMode,
     weights: Optional[str],
+    cursor: Optional[str] = None,
 ) -> Page[SkillListItem]:
     query_text = (q or "").strip()
     keyword_weight, vector_weight = _parse_search_weights(mode, weights)
@@ -165,11 +233,9 @@ async def _list_skills_impl(
     fallback_to_keyword = False
     active_mode: SearchMode = mode
 
-    if query_text and mode in {"vector", "hybrid"}:
-        from app.llm.embeddings import generate_embedding
-
+    if query_text and mode in {"vector", "hybrid"} and embeddings_enabled():
         try:
-            query_embedding = generate_embedding(query_text)
+            query_embedding = await query_embedding_cache.get_or_compute(query_text, embed_text)
         except Exception:
             query_embedding = None
 
@@ -184,139 +250,105 @@ async def _list_skills_impl(
     keyword_match = literal(True)
     keyword_score_expr = literal(0.0)
     if query_text:
-        like = f"%{query_text}%"
-        name_match = Skill.name.ilike(like)
-        slug_match = Skill.slug.ilike(like)
-        description_match = Skill.description.ilike(like)
-        summary_match = Skill.summary.ilike(like)
-        content_match = Skill.content.ilike(like)
-        tag_match = (
-            select(SkillTag.skill_id)
-            .join(Tag, SkillTag.tag_id == Tag.id)
-            .where(
-                SkillTag.skill_id == Skill.id,
-                or_(Tag.name.ilike(like), Tag.slug.ilike(like)),
-            )
-            .exists()
-        )
-        keyword_match = or_(
-            name_match,
-            slug_match,
-            description_match,
-            summary_match,
-            content_match,
-            tag_match,
-        )
-        keyword_score_expr = (
-            case((name_match, 1.00), else_=0.0)
-            + case((slug_match, 0.90), else_=0.0)
-            + case((summary_match, 0.75), else_=0.0)
-            + case((description_match, 0.65), else_=0.0)
-            + case((tag_match, 0.80), else_=0.0)
-            + case((content_match, 0.20), else_=0.0)
+        keyword_search = build_public_search_keyword_search(query_text)
+        keyword_match = keyword_search.match
+        keyword_score_expr = keyword_search.score
+
+    # Every `public_skill_search` row is public; visibility was decided when it was written.
+    filters = [
+        or_(
+            PublicSkillSearch.trust_level.is_(None),
+            PublicSkillSearch.trust_level != "limited",
+            PublicSkillSearch.trust_score >= 35.0,
         )
+    ]
+    if category:
+        filters.append(PublicSkillSearch.category_slug == category)
+    if tags:
+        filters.append(PublicSkillSearch.tag_slugs.overlap(tags))
 
+    # Vector relevance is computed only for the top-K nearest neighbours returned by the
+    # HNSW index; keyword/trust/popularity re-ranking then runs on that candidate set.
+    # The filters apply inside the candidate query, so K counts only rows that can be served.
     vector_score_expr = literal(0.0)
+    vector_candidates = None
     if query_text and query_embedding:
-        vector_score_expr = func.coalesce(
-            1.0 / (1.0 + Skill.embedding.l2_distance(query_embedding)),
-            0.0,
+        candidate_limit = _vector_candidate_limit(
+            page, size, get_settings().vector_search_candidates, depth=cursor_depth(cursor)
+        )
+        distance_expr = PublicSkillSearch.embedding.l2_distance(query_embedding)
+        vector_candidates = (
+            select(PublicSkillSearch.skill_id.label("skill_id"), distance_expr.label("distance"))
+            .where(PublicSkillSearch.embedding.is_not(None), *filters)
+            .order_by(distance_expr)
+            .limit(candidate_limit)
+            .subquery("vector_candidates")
         )
+        vector_score_expr = func.coalesce(1.0 / (1.0 + vector_candidates.c.distance), 0.0)
+        ef_search = _hnsw_ef_search(candidate_limit, filtered=bool(category or tags))
+        await db.execute(text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
 
     combined_score_expr = (
         (keyword_score_expr * keyword_weight) + (vector_score_expr * vector_weight)
     ).label("combined_score")
-    popularity_score_expr = func.coalesce(SkillPopularity.score, 0.0).label("popularity_score")
-    trust_rank_expr = case(
-        (Skill.trust_level == "ok", 2),
-        (Skill.trust_level == "warning", 1),
-        else_=0,
-    ).label("trust_rank")
-    trust_score_expr = func.coalesce(Skill.trust_score, 0.0).label("trust_score_rank")
-
-    stmt = (
-        select(
-            Skill,
-            keyword_score_expr.label("keyword_score"),
-            vector_score_expr.label("vector_score"),
-            combined_score_expr,
-            popularity_score_expr,
-            trust_rank_expr,
-            trust_score_expr,
-        )
-        .where(*public_skill_conditions())
-        .where(
-            or_(
-                Skill.trust_level.is_(None),
-                Skill.trust_level != "limited",
-                Skill.trust_score >= 35.0,
-            )
-        )
-        .outerjoin(Skill.popularity)
-    )
-
-    if category:
-        stmt = stmt.join(Skill.category).where(Category.slug == category)
-    if tags:
-        tag_filter_exists = (
-            select(SkillTag.skill_id)
-            .join(Tag, SkillTag.tag_id == Tag.id)
-            .where(
-                SkillTag.skill_id == Skill.id,
-                Tag.slug.in_(tags),
-            )
-            .exists()
-        )
-        stmt = stmt.where(tag_filter_exists)
+    popularity_score_expr = PublicSkillSearch.popularity_score.label("popularity_score")
+    trust_rank_expr = PublicSkillSearch.trust_rank.label("trust_rank")
+    trust_score_expr = PUBLIC_TRUST_SCORE_RANK.label("trust_score_rank")
+
+    stmt = select(
+        PublicSkillSearch,
+        keyword_score_expr.label("keyword_score"),
+        vector_score_expr.label("vector_score"),
+        combined_score_expr,
+        popularity_score_expr,
+        trust_rank_expr,
+        trust_score_expr,
+    ).where(*filters)
 
     if query_text:
-        if active_mode == "keyword":
+        if active_mode == "keyword" or vector_candidates is None:
             stmt = stmt.where(keyword_match)
         elif active_mode == "vector":
-            stmt = stmt.where(Skill.embedding.is_not(None))
-        else:
-            stmt = stmt.where(or_(keyword_match, Skill.embedding.is_not(None)))
-
-        stmt = stmt.order_by(
-            desc(combined_score_expr),
-            desc(trust_rank_expr),
-            desc(trust_score_expr),
-            desc(popularity_score_expr),
-            desc(Skill.updated_at),
-            Skill.id.asc(),
-        )
-    else:
-        if sort == "newest":
-            stmt = stmt.order_by(desc(Skill.created_at), desc(Skill.updated_at), Skill.id.asc())
-        elif sort == "oldest":
-            stmt = stmt.order_by(Skill.created_at.asc(), Skill.id.asc())
+            stmt = stmt.join(
+                vector_candidates, vector_candidates.c.skill_id == PublicSkillSearch.skill_id
+            )
         else:
-            stmt = stmt.order_by(
-                desc(popularity_score_expr),
-                desc(trust_rank_expr),
-                desc(trust_score_expr),
-                desc(Skill.updated_at),
-                Skill.id.asc(),
+            stmt = stmt.outerjoin(
+                vector_candidates, vector_candidates.c.skill_id == PublicSkillSearch.skill_id
+            ).where(
+                or_(keyword_match, vector_candidates.c.skill_id.is_not(None))
             )
 
-    count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-    total = int((await db.execute(count_stmt)).scalar_one() or 0)
-    total_pages = (total + size - 1) // size if total > 0 else 0
-
-    stmt = (
-        stmt.offset((page - 1) * size)
-        .limit(size)
-        .options(
-            selectinload(Skill.category),
-            selectinload(Skill.tag_associations).selectinload(SkillTag.tag),
-            selectinload(Skill.popularity),
-            selectinload(Skill.source_links),
+        sort_keys = [
+            SortKey(combined_score_expr, descending=True),
+            SortKey(trust_rank_expr, descending=True),
+            SortKey(trust_score_expr, descending=True),
+            SortKey(popularity_score_expr, descending=True),
+            SortKey(PublicSkillSearch.updated_at, descending=True),
+            SortKey(PublicSkillSearch.skill_id, descending=True),
+        ]
+        scope = _search_cursor_scope(
+            query_text, active_mode, keyword_weight, vector_weight, category, tags
         )
+    else:
+        # Single-direction orders backed by projection indexes (see `public_skill_sort_keys`).
+        sort_keys = public_skill_sort_keys(sort)
+        scope = cursor_scope(f"skills:{sort}", category, sorted(tags or []))
+    stmt = stmt.order_by(*order_by_keys(sort_keys))
+
+    stmt = stmt.options(selectinload(PublicSkillSearch.category))
+    page_slice = await fetch_page(
+        db,
+        stmt,
+        page=page,
+        size=size,
+        sort_keys=sort_keys,
+        cursor=cursor,
+        cursor_scope=scope,
     )
-    rows = (await db.execute(stmt)).all()
 
-    items: list[Skill] = []
-    for row in rows:
+    items: list[PublicSkillSearch] = []
+    for row in page_slice.rows:
         skill = row[0]
         keyword_score_value = float(row[1] or 0.0)
         vector_score_value = float(row[2] or 0.0)
@@ -333,10 +365,12 @@ async def _list_skills_impl(
 
     return Page(
         items=items,
-        total=total,
+        total=page_slice.total,
         page=page,
         size=size,
-        pages=total_pages,
+        pages=page_count(page_slice.total, size),
+        total_estimated=page_slice.total_estimated,
+        next_cursor=page_slice.next_cursor,
     )
 
 
@@ -344,7 +378,7 @@ async def _list_skills_impl(
 async def list_skills(
     request: Request,
     response: Response,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     q: Optional[str] = None,
     category: Optional[str] = None,
     tags: Optional[list[str]] = Query(None),
@@ -357,37 +391,43 @@ async def list_skills(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque keyset cursor from a previous `next_cursor` (overrides `page`).",
+    ),
 ):
     """List skills with keyword/vector/hybrid search options."""
     set_public_cache(response, PUBLIC_SEARCH_CACHE)
-    cached = await try_cached_response(
-        request=request,
-        namespace="skills:list",
-        cache_control=PUBLIC_SEARCH_CACHE,
-    )
-    if cached is not None:
-        return cached
     effective_size = limit if limit is not None else size
-    page_result = await _list_skills_impl(
-        db,
-        q=q,
-        category=category,
-        tags=tags,
-        sort=sort,
-        page=page,
-        size=effective_size,
-        mode=mode,
-        weights=weights,
-    )
-    payload = _skill_list_page_payload(page_result)
-    await set_cached_response(
+    if q and cursor is None:
+        # Most requested searches are re-warmed by the worker after data changes.
+        search_hit_log.record_request(request)
+
+    async def build(session: AsyncSession) -> dict:
+        page_result = await _list_skills_impl(
+            session,
+            q=q,
+            category=category,
+            tags=tags,
+            sort=sort,
+            page=page,
+            size=effective_size,
+            mode=mode,
+            weights=weights,
+            cursor=cursor,
+        )
+        return _skill_list_page_payload(page_result)
+
+    return await cached_json_response(
         request=request,
+        response=response,
+        db=db,
         namespace="skills:list",
-        payload=payload,
+        cache_control=PUBLIC_SEARCH_CACHE,
         ttl_seconds=REDIS_TTL_SEARCH,
+        stale_seconds=REDIS_STALE_SEARCH,
+        build_payload=build,
     )
-    response.headers["X-Cache"] = "MISS"
-    return payload
 
 
 @router.get("/search/ai", response_model=Page[SkillListItem])
@@ -395,39 +435,37 @@ async def ai_search_skills(
     request: Request,
     response: Response,
     q: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
 ):
     """Backward-compatible endpoint for semantic search."""
     set_public_cache(response, PUBLIC_SEARCH_CACHE)
-    cached = await try_cached_response(
+
+    async def build(session: AsyncSession) -> dict:
+        page_result = await _list_skills_impl(
+            session,
+            q=q,
+            category=None,
+            tags=None,
+            sort="popularity",
+            page=page,
+            size=size,
+            mode="hybrid",
+            weights=None,
+        )
+        return _skill_list_page_payload(page_result)
+
+    return await cached_json_response(
         request=request,
+        response=response,
+        db=db,
         namespace="skills:ai-search",
         cache_control=PUBLIC_SEARCH_CACHE,
-    )
-    if cached is not None:
-        return cached
-    page_result = await _list_skills_impl(
-        db,
-        q=q,
-        category=None,
-        tags=None,
-        sort="popularity",
-        page=page,
-        size=size,
-        mode="hybrid",
-        weights=None,
-    )
-    payload = _skill_list_page_payload(page_result)
-    await set_cached_response(
-        request=request,
-        namespace="skills:ai-search",
-        payload=payload,
         ttl_seconds=REDIS_TTL_SEARCH,
+        stale_seconds=REDIS_STALE_SEARCH,
+        build_payload=build,
     )
-    response.headers["X-Cache"] = "MISS"
-    return payload
 
 
 @router.get("/{id}", response_model=SkillDetail)
@@ -435,27 +473,25 @@ async def get_skill(
     request: Request,
     response: Response,
     id: uuid.UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ):
     """Get skill details."""
     set_public_cache(response, PUBLIC_DETAIL_CACHE)
-    cached = await try_cached_response(
+
+    async def build(session: AsyncSession) -> dict:
+        repo = SkillRepo(session)
+        skill = await repo.get_skill(id)
+        if not skill or not is_public_skill(skill):
+            raise HTTPException(status_code=404, detail="Skill not found")
+        return SkillDetail.model_validate(skill).model_dump(mode="json")
+
+    return await cached_json_response(
         request=request,
+        response=response,
+        db=db,
         namespace="skills:detail",
         cache_control=PUBLIC_DETAIL_CACHE,
-    )
-    if cached is not None:
-        return cached
-    repo = SkillRepo(db)
-    skill = await repo.get_skill(id)
-    if not skill or not is_public_skill(skill):
-        raise HTTPException(status_code=404, detail="Skill not found")
-    payload = SkillDetail.model_validate(skill).model_dump(mode="json")
-    await set_cached_response(
-        request=request,
-        namespace="skills:detail",
-        payload=payload,
         ttl_seconds=REDIS_TTL_DETAIL,
+        stale_seconds=REDIS_STALE_DETAIL,
+        build_payload=build,
     )
-    response.headers["X-Cache"] = "MISS"
-    return payload
@@ -7,14 +7,19 @@ from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
-from app.api.cache_headers import PUBLIC_TAXONOMY_CACHE, REDIS_TTL_TAXONOMY, set_public_cache
+from app.api.deps import get_read_db
+from app.api.cache_headers import (
+    PUBLIC_TAXONOMY_CACHE,
+    REDIS_STALE_TAXONOMY,
+    REDIS_TTL_TAXONOMY,
+    set_public_cache,
+)
 from app.models.category import Category
 from app.models.skill import Skill
 from app.models.tag import Tag
 from app.schemas.skill import CategoryWithCount, TagBase
 from app.repos.public_filters import public_skill_conditions
-from app.api.response_cache import set_cached_response, try_cached_response
+from app.api.response_cache import cached_json_response
 
 router = APIRouter()
 
@@ -65,28 +70,26 @@ async def search_categories(
     request: Request,
     response: Response,
     q: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100,
 ) -> Any:
     """List all categories."""
     set_public_cache(response, PUBLIC_TAXONOMY_CACHE)
-    cached = await try_cached_response(
+
+    async def build(session: AsyncSession) -> list[dict[str, Any]]:
+        return await _categories_payload(q=q, db=session, skip=skip, limit=limit)
+
+    return await cached_json_response(
         request=request,
+        response=response,
+        db=db,
         namespace="taxonomy:categories",
         cache_control=PUBLIC_TAXONOMY_CACHE,
-    )
-    if cached is not None:
-        return cached
-    payload = await _categories_payload(q=q, db=db, skip=skip, limit=limit)
-    await set_cached_response(
-        request=request,
-        namespace="taxonomy:categories",
-        payload=payload,
         ttl_seconds=REDIS_TTL_TAXONOMY,
+        stale_seconds=REDIS_STALE_TAXONOMY,
+        build_payload=build,
     )
-    response.headers["X-Cache"] = "MISS"
-    return payload
 
 
 @router.get("/taxonomy/categories", response_model=list[CategoryWithCount])
@@ -94,7 +97,7 @@ async def search_categories_legacy(
     request: Request,
     response: Response,
     q: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100,
 ) -> Any:
@@ -107,40 +110,38 @@ async def search_categories_legacy(
 async def list_tags(
     request: Request,
     response: Response,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     q: Optional[str] = None,
 ):
     """List tags (optional search)."""
     set_public_cache(response, PUBLIC_TAXONOMY_CACHE)
-    cached = await try_cached_response(
-        request=request,
-        namespace="taxonomy:tags",
-        cache_control=PUBLIC_TAXONOMY_CACHE,
-    )
-    if cached is not None:
-        return cached
-    stmt = select(Tag).order_by(Tag.name).limit(100)
-    if q:
-        stmt = stmt.where(Tag.name.ilike(f"%{q}%"))
 
-    result = await db.execute(stmt)
-    tags = result.scalars().all()
-    payload = [TagBase.model_validate(tag).model_dump(mode="json") for tag in tags]
-    await set_cached_response(
+    async def build(session: AsyncSession) -> list[dict[str, Any]]:
+        stmt = select(Tag).order_by(Tag.name).limit(100)
+        if q:
+            stmt = stmt.where(Tag.name.ilike(f"%{q}%"))
+
+        result = await session.execute(stmt)
+        tags = result.scalars().all()
+        return [TagBase.model_validate(tag).model_dump(mode="json") for tag in tags]
+
+    return await cached_json_response(
         request=request,
+        response=response,
+        db=db,
         namespace="taxonomy:tags",
-        payload=payload,
+        cache_control=PUBLIC_TAXONOMY_CACHE,
         ttl_seconds=REDIS_TTL_TAXONOMY,
+        stale_seconds=REDIS_STALE_TAXONOMY,
+        build_payload=build,
     )
-    response.headers["X-Cache"] = "MISS"
-    return payload
 
 
 @router.get("/taxonomy/tags", response_model=list[TagBase])
 async def list_tags_legacy(
     request: Request,
     response: Response,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     q: Optional[str] = None,
 ):
     """Backward-compatible alias for older clients."""
@@ -0,0 +1,69 @@
+"""Request hit log used by the cache warmer to find the most requested searches.
+
+Counts are buffered per process and flushed to a Redis ZSET (`{prefix}:hitlog:{name}`) at
+most every `flush_interval_seconds`, so recording a hit never costs a Redis round trip on
+the request path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from typing import Optional
+from urllib.parse import urlencode
+
+from fastapi import Request
+
+from app.cache.redis_l2 import redis_l2_cache
+from app.settings import get_settings
+
+MAX_RECORDED_URL_LENGTH = 512
+# Sent by the cache warmer so replayed searches do not count as new hits.
+WARMER_HEADER = "X-Cache-Warmer"
+
+
+def request_target(request: Request) -> str:
+    """Path + sorted query string (same normalization as response cache keys)."""
+    query = urlencode(sorted(request.query_params.multi_items()), doseq=True)
+    return request.url.path if not query else f"{request.url.path}?{query}"
+
+
+class HitLog:
+    def __init__(self, name: str, *, flush_interval_seconds: float, keep: int) -> None:
+        self.name = name
+        self.flush_interval_seconds = flush_interval_seconds
+        self.keep = keep
+        self._pending: Counter[str] = Counter()
+        self._last_flush = time.monotonic()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def record_request(self, request: Request) -> None:
+        if WARMER_HEADER.lower() in request.headers:
+            return
+        self.record(request_target(request))
+
+    def record(self, target: str) -> None:
+        if not redis_l2_cache.enabled() or len(target) > MAX_RECORDED_URL_LENGTH:
+            return
+        self._pending[target] += 1
+        due = time.monotonic() - self._last_flush >= self.flush_interval_seconds
+        if due and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        counts, self._pending = dict(self._pending), Counter()
+        await redis_l2_cache.add_hits(self.name, counts, keep=self.keep)
+
+    async def top(self, limit: int) -> list[str]:
+        return await redis_l2_cache.top_hits(self.name, limit)
+
+
+_settings = get_settings()
+# Public skill searches (`/api/skills?q=...`), replayed by app/workers/warm_cache.py.
+search_hit_log = HitLog(
+    "search",
+    flush_interval_seconds=10.0,
+    keep=max(_settings.cache_warm_top_queries * 10, 100),
+)
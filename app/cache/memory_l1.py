@@ -0,0 +1,75 @@
+"""Per-process (per uvicorn worker) L1 cache in front of Redis L2."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+from app.settings import get_settings
+
+
+class MemoryL1Cache:
+    """Entry-count and TTL bounded LRU of encoded response bodies keyed like Redis L2."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max(int(max_entries), 0)
+        self.ttl_seconds = max(float(ttl_seconds), 0.0)
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: str, *, now: Optional[float] = None) -> Optional[Any]:
+        item = self._entries.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        expires_at, payload = item
+        if (time.monotonic() if now is None else now) >= expires_at:
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return payload
+
+    def set(
+        self, key: str, payload: Any, *, ttl_seconds: float, now: Optional[float] = None
+    ) -> None:
+        """Store for min(`ttl_seconds`, L1 TTL); never outlives the L2 soft TTL it came from."""
+        ttl = min(float(ttl_seconds), self.ttl_seconds)
+        if not self.enabled() or ttl <= 0:
+            return
+        current = time.monotonic() if now is None else now
+        self._entries[key] = (current + ttl, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *, keys: Iterable[str] = (), prefixes: Iterable[str] = ()) -> int:
+        removed = 0
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                removed += 1
+        prefix_tuple = tuple(prefixes)
+        if prefix_tuple:
+            for key in [k for k in self._entries if k.startswith(prefix_tuple)]:
+                del self._entries[key]
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+_settings = get_settings()
+response_l1_cache = MemoryL1Cache(
+    max_entries=_settings.response_l1_cache_size,
+    ttl_seconds=_settings.response_l1_ttl_seconds,
+)
@@ -0,0 +1,146 @@
+"""Cache of search-query embeddings (in-process LRU + optional Redis tier)."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+import unicodedata
+from array import array
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Optional
+
+from app.cache.redis_l2 import redis_l2_cache
+from app.llm.embeddings import embedding_model_version
+from app.settings import get_settings
+
+REDIS_NAMESPACE = "qemb"
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """Canonical form used as the cache key (NFKC, casefold, collapsed whitespace)."""
+    normalized = unicodedata.normalize("NFKC", text or "").casefold()
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+def pack_vector(vector: list[float]) -> bytes:
+    """Packed float32 bytes (384 dims -> 1536 bytes) instead of a JSON float list."""
+    packed = array("f", vector)
+    if packed.itemsize != 4:
+        raise ValueError("float32 array type unavailable")
+    return packed.tobytes()
+
+
+def unpack_vector(raw: bytes) -> Optional[list[float]]:
+    if not raw or len(raw) % 4:
+        return None
+    values = array("f")
+    values.frombytes(raw)
+    return values.tolist()
+
+
+@dataclass
+class QueryEmbeddingCacheStats:
+    l1_hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+    l1_size: int = 0
+
+
+class QueryEmbeddingCache:
+    """Normalized query -> embedding, bounded LRU in front of Redis (fail-open).
+
+    Concurrent misses for the same query share one inference.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max(int(max_entries), 0)
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._stats = QueryEmbeddingCacheStats()
+
+    def _get_local(self, key: str) -> Optional[list[float]]:
+        vector = self._entries.get(key)
+        if vector is not None:
+            self._entries.move_to_end(key)
+        return vector
+
+    def _put_local(self, key: str, vector: list[float]) -> None:
+        if self._max_entries <= 0:
+            return
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _redis_key(self, key: str) -> Optional[str]:
+        model = embedding_model_version()
+        digest = hashlib.sha1(f"{model}\n{key}".encode("utf-8")).hexdigest()
+        return redis_l2_cache.key(namespace=REDIS_NAMESPACE, suffix=digest)
+
+    async def get_or_compute(
+        self,
+        query_text: str,
+        compute: Callable[[str], Awaitable[Optional[list[float]]]],
+    ) -> Optional[list[float]]:
+        key = normalize_query(query_text)
+        if not key:
+            return None
+
+        vector = self._get_local(key)
+        if vector is not None:
+            self._stats.l1_hits += 1
+            return vector
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            vector = await self._load(key, compute)
+            future.set_result(vector)
+            return vector
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters re-raise; retrieve here so an unobserved future does not warn.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _load(
+        self,
+        key: str,
+        compute: Callable[[str], Awaitable[Optional[list[float]]]],
+    ) -> Optional[list[float]]:
+        redis_key = self._redis_key(key)
+        vector = unpack_vector(await redis_l2_cache.get_bytes(redis_key) or b"")
+        if vector is not None:
+            self._stats.l2_hits += 1
+            self._put_local(key, vector)
+            return vector
+
+        self._stats.misses += 1
+        vector = await compute(key)
+        if vector:
+            self._put_local(key, vector)
+            ttl = int(get_settings().query_embedding_cache_ttl_seconds)
+            await redis_l2_cache.set_bytes(redis_key, pack_vector(vector), ttl)
+        return vector
+
+    def stats(self) -> dict[str, int]:
+        self._stats.l1_size = len(self._entries)
+        return asdict(self._stats)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+query_embedding_cache = QueryEmbeddingCache(get_settings().query_embedding_cache_size)
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import secrets
+import time
 from dataclasses import dataclass
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Iterable, Mapping, Optional
 from urllib.parse import urlencode
 
 from fastapi import Request
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
 
 from app.settings import get_settings
 
@@ -22,20 +25,156 @@ def build_cache_key(
     namespace: str,
     path: str,
     query_items: Iterable[tuple[str, str]],
+    version: str = "",
 ) -> str:
     """Build a deterministic cache key from request path + query string."""
     normalized = sorted((k, v) for k, v in query_items)
     query = urlencode(normalized, doseq=True)
     suffix = path if not query else f"{path}?{query}"
+    if version:
+        return f"{prefix}:{namespace}:{version}:{suffix}"
     return f"{prefix}:{namespace}:{suffix}"
 
 
+# Version groups embedded in response cache keys. Writers bump a group when its data changes;
+# keys built under the old version are never read again and simply expire.
+# - catalog: skills, sources, tags, categories (parse worker, admin CRUD, trust overrides)
+# - popularity: popularity scores (event API, debounced cluster-wide; popularity worker)
+CATALOG_VERSION = "catalog"
+POPULARITY_VERSION = "popularity"
+VERSION_GROUPS = (CATALOG_VERSION, POPULARITY_VERSION)
+# Only responses *ordered* by popularity depend on the popularity group: namespace -> `sort`
+# values that order by something else. Counters merely shown on cards and detail pages may
+# lag by up to the entry TTL instead of dropping every entry on each bump.
+_POPULARITY_ORDERED_NAMESPACES: dict[str, frozenset[str]] = {
+    "rankings:top10": frozenset(),
+    "skills:list": frozenset({"newest", "oldest"}),
+    "plugins:list": frozenset({"newest", "oldest"}),
+}
+# Namespaces where a search query switches to relevance order.
+_RELEVANCE_ORDERED_WITH_QUERY = frozenset({"skills:list"})
+# How long a process trusts its copy of the versions without re-reading Redis.
+# Bumps are also pushed over the invalidation channel, so this only bounds missed messages.
+NAMESPACE_VERSION_REFRESH_SECONDS = 5.0
+
+
+def namespace_version_groups(
+    namespace: str,
+    query: Optional[Mapping[str, str]] = None,
+) -> tuple[str, ...]:
+    """Version groups a response depends on (`query`: the request's query parameters)."""
+    other_sorts = _POPULARITY_ORDERED_NAMESPACES.get(namespace)
+    if other_sorts is None:
+        return (CATALOG_VERSION,)
+    query = query or {}
+    if namespace in _RELEVANCE_ORDERED_WITH_QUERY and (query.get("q") or "").strip():
+        return (CATALOG_VERSION,)
+    if query.get("sort", "popularity") in other_sorts:
+        return (CATALOG_VERSION,)
+    return VERSION_GROUPS
+
+
+# Delete the lock only if we still own it (token match).
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+# Identifies this process on the invalidation channel (skip our own messages).
+INSTANCE_ID = secrets.token_hex(8)
+INVALIDATION_CHANNEL = "invalidate"
+INVALIDATION_RETRY_SECONDS = 5.0
+
+
+# Response entries are Redis hashes: `meta` (JSON: soft expiry + stored encodings) plus one
+# field per pre-encoded body variant (`identity`, `gzip`, `br`; see app/cache/response_body.py).
+ENTRY_META_FIELD = "meta"
+
+
+@dataclass
+class CacheEntry:
+    # Body variants that were fetched, by content encoding.
+    bodies: dict[str, bytes]
+    # Past the soft TTL: still servable, but should be refreshed in the background.
+    stale: bool
+    # Seconds until the soft TTL ends (0 when stale or unknown).
+    fresh_for: float = 0.0
+    # Variants stored for this entry (may be more than were fetched).
+    encodings: tuple[str, ...] = ()
+    # Validator of the plain body (`response_body.body_etag`); "" when unknown.
+    etag: str = ""
+
+
+def wrap_entry(
+    bodies: dict[str, bytes],
+    *,
+    soft_ttl_seconds: int,
+    etag: str = "",
+    now: Optional[float] = None,
+) -> dict[str, bytes]:
+    current = time.time() if now is None else now
+    meta = {
+        "soft_expires_at": current + soft_ttl_seconds,
+        "encodings": sorted(bodies),
+        "etag": etag,
+    }
+    return {ENTRY_META_FIELD: json.dumps(meta, separators=(",", ":")).encode("utf-8"), **bodies}
+
+
+def unwrap_entry(
+    fields: dict[str, Optional[bytes]], *, now: Optional[float] = None
+) -> Optional[CacheEntry]:
+    raw_meta = fields.get(ENTRY_META_FIELD)
+    if not raw_meta:
+        return None
+    try:
+        meta = json.loads(raw_meta)
+        soft_expires_at = float(meta.get("soft_expires_at") or 0)
+        encodings = tuple(str(item) for item in meta.get("encodings") or [])
+        etag = str(meta.get("etag") or "")
+    except (ValueError, TypeError, AttributeError):
+        return None
+    current = time.time() if now is None else now
+    return CacheEntry(
+        bodies={
+            name: value
+            for name, value in fields.items()
+            if name != ENTRY_META_FIELD and value is not None
+        },
+        stale=current >= soft_expires_at,
+        fresh_for=max(soft_expires_at - current, 0.0),
+        encodings=encodings,
+        etag=etag,
+    )
+
+
 @dataclass
 class RedisL2Config:
     enabled: bool
     url: str
     prefix: str
     timeout_ms: int
+    connect_timeout_ms: int = 500
+    max_connections: int = 64
+    health_check_interval_seconds: int = 30
+
+    def pool(self, *, decode_responses: bool) -> BlockingConnectionPool:
+        """Bounded pool; when exhausted, callers wait up to `timeout_ms` for a free connection."""
+        timeout_sec = self.timeout_ms / 1000.0
+        options: dict[str, Any] = {"encoding": "utf-8"} if decode_responses else {}
+        return BlockingConnectionPool.from_url(
+            self.url,
+            max_connections=self.max_connections,
+            timeout=timeout_sec,
+            socket_timeout=timeout_sec,
+            socket_connect_timeout=self.connect_timeout_ms / 1000.0,
+            health_check_interval=self.health_check_interval_seconds,
+            decode_responses=decode_responses,
+            **options,
+        )
 
 
 class RedisL2Cache:
@@ -43,7 +182,14 @@ class RedisL2Cache:
 
     def __init__(self) -> None:
         self._client: Optional[Redis] = None
+        # Same server, no response decoding: raw bytes values (packed float32 vectors,
+        # pre-compressed response bodies).
+        self._binary_client: Optional[Redis] = None
         self._config: Optional[RedisL2Config] = None
+        self._versions: dict[str, int] = {}
+        self._versions_fetched_at = float("-inf")
+        self._versions_changed_at = float("-inf")
+        self._pending_bumps: dict[tuple[str, ...], asyncio.Task] = {}
 
     async def init(self) -> None:
         settings = get_settings()
@@ -52,49 +198,199 @@ class RedisL2Cache:
             url=(settings.redis_url or "").strip(),
             prefix=(settings.redis_cache_prefix or "skills-marketplace").strip(),
             timeout_ms=max(50, int(settings.redis_cache_timeout_ms)),
+            connect_timeout_ms=max(50, int(settings.redis_connect_timeout_ms)),
+            max_connections=max(1, int(settings.redis_max_connections)),
+            health_check_interval_seconds=max(0, int(settings.redis_health_check_interval_seconds)),
         )
         if not self._config.enabled or not self._config.url:
             logger.info("Redis L2 cache disabled (missing REDIS_URL or disabled flag).")
             return
 
-        timeout_sec = self._config.timeout_ms / 1000.0
         try:
-            self._client = Redis.from_url(
-                self._config.url,
-                encoding="utf-8",
-                decode_responses=True,
-                socket_connect_timeout=timeout_sec,
-                socket_timeout=timeout_sec,
-            )
+            self._client = Redis.from_pool(self._config.pool(decode_responses=True))
             await self._client.ping()
-            logger.info("Redis L2 cache connected.")
+            self._binary_client = Redis.from_pool(self._config.pool(decode_responses=False))
+            logger.info(
+                "Redis L2 cache connected "
+                "(max_connections=%s per client, health_check_interval=%ss).",
+                self._config.max_connections,
+                self._config.health_check_interval_seconds,
+            )
         except Exception as exc:
             logger.warning("Redis L2 cache init failed: %s", exc)
             self._client = None
+            self._binary_client = None
 
     async def close(self) -> None:
-        if self._client is None:
-            return
-        try:
-            await self._client.aclose()
-        except Exception:
-            pass
-        finally:
-            self._client = None
+        for task in list(self._pending_bumps.values()):
+            task.cancel()
+        self._pending_bumps.clear()
+        for client in (self._client, self._binary_client):
+            if client is None:
+                continue
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+        self._client = None
+        self._binary_client = None
 
     def enabled(self) -> bool:
         return self._client is not None and self._config is not None
 
-    def key_for_request(self, *, namespace: str, request: Request) -> Optional[str]:
+    async def key_for_request(self, *, namespace: str, request: Request) -> Optional[str]:
+        """Response cache key, scoped to the current versions of the namespace's groups."""
         if self._config is None:
             return None
+        versions = await self.namespace_versions()
+        groups = namespace_version_groups(namespace, request.query_params)
+        version = ".".join(str(versions.get(group, 0)) for group in groups)
         return build_cache_key(
             prefix=self._config.prefix,
             namespace=namespace,
             path=request.url.path,
             query_items=request.query_params.multi_items(),
+            version=f"v{version}",
+        )
+
+    def _version_key(self, group: str) -> str:
+        prefix = self._config.prefix if self._config is not None else ""
+        return f"{prefix}:nsver:{group}"
+
+    def _apply_versions(self, versions: Any, *, announced: bool = True) -> None:
+        # Versions only move forward (messages can arrive after a newer MGET).
+        if not isinstance(versions, dict):
+            return
+        for group, value in versions.items():
+            try:
+                number = int(value)
+            except (TypeError, ValueError):
+                continue
+            previous = self._versions.get(str(group))
+            if number > (previous or 0):
+                self._versions[str(group)] = number
+                # The first read after startup is not a change.
+                if announced or previous is not None:
+                    self._versions_changed_at = time.monotonic()
+
+    def versions_changed_within(self, seconds: float) -> bool:
+        """Whether this process saw a version bump in the last `seconds`."""
+        return seconds > 0 and time.monotonic() - self._versions_changed_at < seconds
+
+    async def namespace_versions(self) -> dict[str, int]:
+        """Current version per group (cached per process for a few seconds)."""
+        if self._client is None:
+            return self._versions
+        now = time.monotonic()
+        if now - self._versions_fetched_at < NAMESPACE_VERSION_REFRESH_SECONDS:
+            return self._versions
+        try:
+            values = await self._client.mget([self._version_key(group) for group in VERSION_GROUPS])
+        except Exception:
+            return self._versions
+        self._versions_fetched_at = now
+        self._apply_versions(
+            {group: value or 0 for group, value in zip(VERSION_GROUPS, values)}, announced=False
+        )
+        return self._versions
+
+    async def bump_namespaces(self, *groups: str) -> None:
+        """Invalidate every cached response depending on `groups` (call after commit)."""
+        if self._client is None or not groups:
+            return
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for group in groups:
+                pipe.incr(self._version_key(group))
+            values = await pipe.execute()
+        except Exception as exc:
+            logger.warning("Redis L2 namespace bump failed for %s: %s", ",".join(groups), exc)
+            return
+        versions = dict(zip(groups, values))
+        self._apply_versions(versions)
+        channel = self._channel()
+        if not channel:
+            return
+        message = {"origin": INSTANCE_ID, "versions": versions}
+        try:
+            await self._client.publish(channel, json.dumps(message, separators=(",", ":")))
+        except Exception:
+            return
+
+    def _debounce_key(self, group_key: tuple[str, ...], kind: str) -> str:
+        prefix = self._config.prefix if self._config is not None else ""
+        return f"{prefix}:nsbump:{','.join(group_key)}:{kind}"
+
+    async def bump_namespaces_debounced(self, *groups: str, window_seconds: float) -> None:
+        """Bump at most once per `window_seconds` across all processes, with a trailing bump.
+
+        The process that wins `SET NX PX` on the window key bumps right away; later changes
+        inside the window are folded into one bump at its end, scheduled by the one process
+        that claims the window's trailing key.
+        """
+        if self._client is None or not groups:
+            return
+        group_key = tuple(groups)
+        if group_key in self._pending_bumps:
+            return
+        window_ms = max(1, int(window_seconds * 1000))
+        window_key = self._debounce_key(group_key, "window")
+        try:
+            if await self._client.set(window_key, INSTANCE_ID, nx=True, px=window_ms):
+                await self.bump_namespaces(*groups)
+                return
+            remaining_ms = max(int(await self._client.pttl(window_key)), 0)
+            trailing_key = self._debounce_key(group_key, "trailing")
+            if not await self._client.set(
+                trailing_key, INSTANCE_ID, nx=True, px=remaining_ms + window_ms
+            ):
+                return
+        except Exception as exc:
+            logger.warning("Redis L2 debounced bump failed for %s: %s", ",".join(groups), exc)
+            return
+        self._pending_bumps[group_key] = asyncio.create_task(
+            self._trailing_bump(group_key, remaining_ms / 1000.0, window_ms)
         )
 
+    async def _trailing_bump(
+        self, group_key: tuple[str, ...], delay: float, window_ms: int
+    ) -> None:
+        try:
+            await asyncio.sleep(delay)
+            try:
+                await self._client.delete(self._debounce_key(group_key, "trailing"))
+                # Opens the next window: changes right after this bump are folded again.
+                await self._client.set(
+                    self._debounce_key(group_key, "window"), INSTANCE_ID, px=window_ms
+                )
+            except Exception:
+                pass
+            await self.bump_namespaces(*group_key)
+        finally:
+            self._pending_bumps.pop(group_key, None)
+
+    def key(self, *, namespace: str, suffix: str) -> Optional[str]:
+        """Cache key for non-request entries (same prefix as response keys)."""
+        if self._config is None:
+            return None
+        return f"{self._config.prefix}:{namespace}:{suffix}"
+
+    async def get_bytes(self, key: Optional[str]) -> Optional[bytes]:
+        if self._binary_client is None or not key:
+            return None
+        try:
+            return await self._binary_client.get(key)
+        except Exception:
+            return None
+
+    async def set_bytes(self, key: Optional[str], value: bytes, ttl_seconds: int) -> None:
+        if self._binary_client is None or not key or ttl_seconds <= 0:
+            return
+        try:
+            await self._binary_client.set(key, value, ex=ttl_seconds)
+        except Exception:
+            return
+
     async def get_json(self, key: Optional[str]) -> Optional[Any]:
         if self._client is None or not key:
             return None
@@ -106,6 +402,204 @@ class RedisL2Cache:
         except Exception:
             return None
 
+    async def _get_fields(self, key: str, fields: list[str]) -> dict[str, Optional[bytes]]:
+        assert self._binary_client is not None
+        values = await self._binary_client.hmget(key, fields)
+        return dict(zip(fields, values))
+
+    async def get_entry(
+        self,
+        key: Optional[str],
+        *,
+        encodings: Iterable[str] = (),
+    ) -> Optional[CacheEntry]:
+        """Fetch an entry with the first stored variant of `encodings` (client preference order).
+
+        One HMGET in the common case; a second one only when none of the preferred variants
+        (nor `identity`) were stored.
+        """
+        if self._binary_client is None or not key:
+            return None
+        preferred = list(dict.fromkeys([*encodings, "identity"]))
+        try:
+            entry = unwrap_entry(await self._get_fields(key, [ENTRY_META_FIELD, *preferred]))
+            if entry is None or entry.bodies or not entry.encodings:
+                return entry
+            fallback = entry.encodings[0]
+            entry.bodies.update(
+                {
+                    k: v
+                    for k, v in (await self._get_fields(key, [fallback])).items()
+                    if v is not None
+                }
+            )
+            return entry
+        except Exception:
+            return None
+
+    async def get_entries(
+        self,
+        keys: list[Optional[str]],
+        *,
+        encodings: Iterable[str] = (),
+    ) -> list[Optional[CacheEntry]]:
+        """`get_entry` for many keys in one pipelined round trip (no fallback fetch)."""
+        results: list[Optional[CacheEntry]] = [None] * len(keys)
+        wanted = [(index, key) for index, key in enumerate(keys) if key]
+        if self._binary_client is None or not wanted:
+            return results
+        fields = [ENTRY_META_FIELD, *dict.fromkeys([*encodings, "identity"])]
+        try:
+            pipe = self._binary_client.pipeline(transaction=False)
+            for _, key in wanted:
+                pipe.hmget(key, fields)
+            rows = await pipe.execute()
+        except Exception:
+            return results
+        for (index, _), values in zip(wanted, rows):
+            results[index] = unwrap_entry(dict(zip(fields, values)))
+        return results
+
+    async def set_entry(
+        self,
+        key: Optional[str],
+        bodies: dict[str, bytes],
+        *,
+        soft_ttl_seconds: int,
+        hard_ttl_seconds: int,
+        etag: str = "",
+    ) -> None:
+        """Store body variants fresh for `soft_ttl_seconds`, stale until `hard_ttl_seconds`."""
+        if self._binary_client is None or not key or not bodies:
+            return
+        try:
+            pipe = self._binary_client.pipeline(transaction=True)
+            pipe.delete(key)
+            pipe.hset(key, mapping=wrap_entry(bodies, soft_ttl_seconds=soft_ttl_seconds, etag=etag))
+            pipe.expire(key, max(hard_ttl_seconds, soft_ttl_seconds))
+            await pipe.execute()
+        except Exception:
+            # Fail-open: caching errors must not impact API response flow.
+            return
+
+    async def acquire_lock(self, key: Optional[str], ttl_ms: int) -> Optional[str]:
+        """Cross-replica recompute lock (SET NX PX).
+
+        Returns the owner token, or None while another replica holds the lock. Redis errors
+        return a token as well (fail-open: the caller simply computes).
+        """
+        token = secrets.token_hex(8)
+        if self._client is None or not key:
+            return token
+        try:
+            acquired = await self._client.set(f"{key}:lock", token, nx=True, px=max(int(ttl_ms), 1))
+        except Exception:
+            return token
+        return token if acquired else None
+
+    async def release_lock(self, key: Optional[str], token: Optional[str]) -> None:
+        if self._client is None or not key or not token:
+            return
+        try:
+            await self._client.eval(_RELEASE_LOCK_SCRIPT, 1, f"{key}:lock", token)
+        except Exception:
+            return
+
+    def _channel(self) -> Optional[str]:
+        if self._config is None:
+            return None
+        return f"{self._config.prefix}:{INVALIDATION_CHANNEL}"
+
+    async def publish_invalidation(
+        self,
+        *,
+        keys: Iterable[str] = (),
+        prefixes: Iterable[str] = (),
+    ) -> None:
+        """Tell other processes to drop L1 copies of `keys` / keys under `prefixes`."""
+        channel = self._channel()
+        if self._client is None or not channel:
+            return
+        message = {"origin": INSTANCE_ID, "keys": list(keys), "prefixes": list(prefixes)}
+        if not message["keys"] and not message["prefixes"]:
+            return
+        try:
+            await self._client.publish(channel, json.dumps(message, separators=(",", ":")))
+        except Exception:
+            return
+
+    async def listen_invalidations(self, handler: Callable[[list[str], list[str]], Any]) -> None:
+        """Run forever: apply namespace version bumps and call `handler(keys, prefixes)` for
+        invalidations from other processes.
+
+        Uses a dedicated connection without the short socket timeout (pub/sub reads block).
+        Reconnects after errors; cancel the task to stop.
+        """
+        channel = self._channel()
+        if not self.enabled() or not channel or self._config is None:
+            return
+        while True:
+            client: Optional[Redis] = None
+            try:
+                client = Redis.from_url(
+                    self._config.url,
+                    encoding="utf-8",
+                    decode_responses=True,
+                    socket_connect_timeout=self._config.connect_timeout_ms / 1000.0,
+                    health_check_interval=self._config.health_check_interval_seconds,
+                )
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(channel)
+                async for message in pubsub.listen():
+                    if not isinstance(message, dict) or message.get("type") != "message":
+                        continue
+                    try:
+                        data = json.loads(message.get("data") or "{}")
+                    except ValueError:
+                        continue
+                    if not isinstance(data, dict):
+                        continue
+                    self._apply_versions(data.get("versions"))
+                    if data.get("origin") == INSTANCE_ID:
+                        continue
+                    if not data.get("keys") and not data.get("prefixes"):
+                        continue
+                    handler(list(data.get("keys") or []), list(data.get("prefixes") or []))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Redis L2 invalidation listener error: %s", exc)
+                await asyncio.sleep(INVALIDATION_RETRY_SECONDS)
+            finally:
+                if client is not None:
+                    try:
+                        await client.aclose()
+                    except Exception:
+                        pass
+
+    async def add_hits(self, name: str, counts: dict[str, int], *, keep: int) -> None:
+        """Add request counts to the `name` hit log (ZSET), keeping the `keep` most requested."""
+        key = self.key(namespace="hitlog", suffix=name)
+        if self._client is None or not key or not counts:
+            return
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for member, count in counts.items():
+                pipe.zincrby(key, count, member)
+            pipe.zremrangebyrank(key, 0, -(max(int(keep), 1) + 1))
+            await pipe.execute()
+        except Exception:
+            return
+
+    async def top_hits(self, name: str, limit: int) -> list[str]:
+        key = self.key(namespace="hitlog", suffix=name)
+        if self._client is None or not key or limit <= 0:
+            return []
+        try:
+            return list(await self._client.zrevrange(key, 0, int(limit) - 1))
+        except Exception:
+            return []
+
     async def set_json(self, key: Optional[str], payload: Any, ttl_seconds: int) -> None:
         if self._client is None or not key or ttl_seconds <= 0:
             return
@@ -0,0 +1,134 @@
+"""Pre-serialized, pre-compressed JSON response bodies for the response cache.
+
+A payload is rendered to JSON bytes once (exactly like `JSONResponse`) and compressed once
+when it is cached. Hits then send the stored bytes with a matching `Content-Encoding`;
+`GZipMiddleware` leaves responses that already carry a `Content-Encoding` untouched.
+
+Brotli needs the optional `brotli` package (`compression` extra); without it only gzip
+bodies are produced and served.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from typing import Any, Mapping, Optional, Sequence
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the optional extra
+    brotli = None
+
+IDENTITY = "identity"
+# Matches GZipMiddleware(minimum_size=1024) in app/main.py: smaller bodies stay uncompressed.
+COMPRESS_MIN_SIZE = 1024
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Encodings this process can produce, best first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def render_json(payload: Any) -> bytes:
+    """Same bytes `JSONResponse(content=payload)` would send."""
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def encode_body(body: bytes) -> dict[str, bytes]:
+    """Encoded variants to store: the plain body when small, else one per supported encoding."""
+    if len(body) < COMPRESS_MIN_SIZE:
+        return {IDENTITY: body}
+    variants = {"gzip": gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+    return variants
+
+
+def body_etag(body: bytes) -> str:
+    """Opaque validator of the plain JSON body (unquoted; see `entity_tag`)."""
+    return hashlib.sha256(body).hexdigest()[:32]
+
+
+def entity_tag(etag: str, content_encoding: Optional[str]) -> str:
+    """Strong `ETag` header value; each content coding is its own representation."""
+    if content_encoding and content_encoding != IDENTITY:
+        return f'"{etag}-{content_encoding}"'
+    return f'"{etag}"'
+
+
+def matching_entity_tag(if_none_match: Optional[str], etag: str) -> Optional[str]:
+    """The `If-None-Match` entry that matches `etag` (any coding), or None.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match.
+    """
+    if not if_none_match or not etag:
+        return None
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return entity_tag(etag, None)
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        opaque = candidate.strip('"')
+        base, _, coding = opaque.partition("-")
+        if base == etag and (not coding or coding in {"gzip", "br"}):
+            return f'"{opaque}"'
+    return None
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> list[str]:
+    """Supported encodings listed in an `Accept-Encoding` header (q=0 excluded), best first."""
+    accepted: set[str] = set()
+    for part in (accept_encoding or "").lower().split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip()
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if name == "*":
+            accepted.update(supported_encodings())
+        elif name:
+            accepted.add(name)
+    return [encoding for encoding in supported_encodings() if encoding in accepted]
+
+
+def decode_body(encoding: str, data: bytes) -> Optional[bytes]:
+    if encoding == IDENTITY:
+        return data
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(data)
+    return None
+
+
+def select_body(
+    bodies: Mapping[str, bytes],
+    accepted: Sequence[str],
+) -> Optional[tuple[Optional[str], bytes]]:
+    """Pick `(content_encoding, bytes)` for a client; `None` encoding means plain JSON.
+
+    Falls back to decompressing a stored variant for clients that accept none of them.
+    """
+    for encoding in accepted:
+        data = bodies.get(encoding)
+        if data is not None:
+            return encoding, data
+    for encoding, data in bodies.items():
+        plain = decode_body(encoding, data)
+        if plain is not None:
+            return None, plain
+    return None
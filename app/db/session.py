@@ -1,25 +1,88 @@
 """Database session and engine configuration."""
 
+import logging
 from collections.abc import AsyncGenerator
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.settings import get_settings
+from app.settings import Settings, get_settings
 
-settings = get_settings()
+logger = logging.getLogger(__name__)
+
+DB_CONNECTION_MODES = ("pooler", "direct")
+
+
+def db_connection_mode(settings: Settings) -> str:
+    mode = (settings.db_connection_mode or "").strip().lower()
+    return mode if mode in DB_CONNECTION_MODES else "pooler"
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.log_level == "DEBUG",
-    pool_pre_ping=True,
-    # Required for Supabase Transaction Pooler
-    connect_args={
+
+def connect_args(settings: Settings) -> dict[str, Any]:
+    """asyncpg connect args for the configured connection mode.
+
+    - pooler: PgBouncer / Supabase transaction pooler hand each transaction to any server
+      connection, so asyncpg must not keep prepared statements.
+    - direct: a dedicated server connection; prepared statements are cached per connection
+      and repeated queries skip parse/plan.
+    """
+    if db_connection_mode(settings) == "direct":
+        return {"statement_cache_size": max(0, int(settings.db_statement_cache_size))}
+    return {
         "prepared_statement_cache_size": 0,
         "statement_cache_size": 0,
-    },
+    }
+
+
+def engine_options(settings: Settings) -> dict[str, Any]:
+    """`create_async_engine` keyword arguments (pool sizing + connect args)."""
+    return {
+        "echo": settings.log_level == "DEBUG",
+        "pool_pre_ping": True,
+        "pool_size": max(1, int(settings.db_pool_size)),
+        "max_overflow": max(0, int(settings.db_max_overflow)),
+        "pool_timeout": max(1, int(settings.db_pool_timeout_seconds)),
+        # -1 keeps connections until they fail the pre-ping.
+        "pool_recycle": int(settings.db_pool_recycle_seconds)
+        if settings.db_pool_recycle_seconds > 0
+        else -1,
+        "connect_args": connect_args(settings),
+    }
+
+
+def pool_config_summary(settings: Settings) -> str:
+    options = engine_options(settings)
+    return (
+        f"mode={db_connection_mode(settings)} pool_size={options['pool_size']} "
+        f"max_overflow={options['max_overflow']} pool_timeout={options['pool_timeout']}s "
+        f"pool_recycle={options['pool_recycle']}s "
+        f"statement_cache_size={options['connect_args']['statement_cache_size']}"
+    )
+
+
+def log_pool_config(settings: Settings) -> None:
+    logger.info(
+        "Database pool: %s (reads: %s).",
+        pool_config_summary(settings),
+        "replica" if settings.database_read_url else "primary",
+    )
+
+
+settings = get_settings()
+
+engine = create_async_engine(settings.database_url, **engine_options(settings))
+# Public read paths; the same engine as writes when no replica is configured.
+read_engine = (
+    create_async_engine(settings.database_read_url, **engine_options(settings))
+    if settings.database_read_url
+    else engine
 )
 
 
+def has_read_replica() -> bool:
+    return read_engine is not engine
+
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -28,6 +91,14 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency to get database session."""
@@ -36,3 +107,12 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get a read-only (replica when configured) database session."""
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
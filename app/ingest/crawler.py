@@ -0,0 +1,125 @@
+"""Concurrency limits for the ingest crawler.
+
+Every request the crawler makes goes through `CrawlClient.get`: a GitHub request first
+takes a token from the rate-limit scheduler (`app/ingest/github_scheduler.py`), then any
+request holds a `CrawlLimiter.slot(url)`: the per-host limit (GitHub API,
+raw.githubusercontent.com, or one limit per other host name such as a directory site),
+then the global in-flight cap. Waiting for budget or a busy host never holds a global
+slot, so one slow site cannot starve the others.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager, nullcontext
+from typing import Any, AsyncIterator, Optional
+from urllib.parse import urlparse
+
+import httpx
+from httpx import AsyncClient
+
+from app.ingest.github_scheduler import PRIORITY_DISCOVERED, GithubScheduler
+
+GITHUB_API = "github_api"
+GITHUB_RAW = "github_raw"
+GITHUB_RAW_HOST = "raw.githubusercontent.com"
+
+
+def host_key(url: str, github_api_host: str = "api.github.com") -> str:
+    """Limit bucket for a URL: `github_api`, `github_raw` or the host name."""
+    host = (urlparse(url).netloc or "").lower()
+    if host == github_api_host:
+        return GITHUB_API
+    if host == GITHUB_RAW_HOST:
+        return GITHUB_RAW
+    return host
+
+
+class CrawlLimiter:
+    """Per-host semaphores under one global in-flight cap."""
+
+    def __init__(
+        self,
+        *,
+        max_in_flight: int = 16,
+        github_api: int = 4,
+        github_raw: int = 8,
+        per_host: int = 2,
+        github_api_host: str = "api.github.com",
+    ):
+        self.github_api_host = github_api_host.lower()
+        self._global = asyncio.Semaphore(max(1, max_in_flight))
+        self._limits = {GITHUB_API: max(1, github_api), GITHUB_RAW: max(1, github_raw)}
+        self._per_host = max(1, per_host)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "CrawlLimiter":
+        return cls(
+            max_in_flight=settings.ingest_max_in_flight,
+            github_api=settings.ingest_github_api_concurrency,
+            github_raw=settings.ingest_github_raw_concurrency,
+            per_host=settings.ingest_per_host_concurrency,
+            github_api_host=urlparse(settings.github_api_base).netloc or "api.github.com",
+        )
+
+    def limit_for(self, key: str) -> int:
+        return self._limits.get(key, self._per_host)
+
+    def _semaphore(self, key: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.limit_for(key))
+            self._semaphores[key] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold one request slot for `url` (host limit first, then the global cap)."""
+        async with self._semaphore(host_key(url, self.github_api_host)):
+            async with self._global:
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                try:
+                    yield
+                finally:
+                    self.in_flight -= 1
+
+
+class CrawlClient:
+    """The crawl's view of the HTTP client: GitHub budget, then host/global slot, then the request.
+
+    Exposes `get` like `httpx.AsyncClient`, so the scanner, the response cache and
+    `fetch_text` use it unchanged. `with_priority` gives a view whose GitHub requests
+    queue at another priority (see `app/ingest/github_scheduler.py`).
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        *,
+        limiter: Optional[CrawlLimiter] = None,
+        scheduler: Optional[GithubScheduler] = None,
+        priority: int = PRIORITY_DISCOVERED,
+    ):
+        self.client = client
+        self.limiter = limiter
+        self.scheduler = scheduler
+        self.priority = priority
+
+    def with_priority(self, priority: int) -> "CrawlClient":
+        return CrawlClient(
+            self.client, limiter=self.limiter, scheduler=self.scheduler, priority=priority
+        )
+
+    async def _limited_get(self, url: str, **kwargs: Any) -> httpx.Response:
+        slot = self.limiter.slot(url) if self.limiter is not None else nullcontext()
+        async with slot:
+            return await self.client.get(url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        if self.scheduler is None:
+            return await self._limited_get(url, **kwargs)
+        return await self.scheduler.send(
+            url, lambda: self._limited_get(url, **kwargs), self.priority
+        )
@@ -0,0 +1,130 @@
+"""Conditional GitHub API requests backed by `github_repo_cache`.
+
+The repo scanner fetches `/repos/{name}` and the recursive `/git/trees/{branch}` through
+`GithubResponseCache.get_json`: a cached response is revalidated with `If-None-Match` /
+`If-Modified-Since`, and a 304 is answered from the stored JSON. GitHub does not count
+304 responses against the rate limit, so unchanged repos cost no budget and almost no
+bandwidth.
+
+The cache is best-effort: when the database is unavailable requests are simply sent
+unconditionally.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Optional
+
+from app.db.session import AsyncSessionLocal
+from app.ingest.github_scheduler import raise_for_rate_limit
+from app.repos.github_repo_cache_repo import get_cached_response, store_cached_response
+
+REPO_FIELDS = ("full_name", "description", "default_branch", "stargazers_count", "pushed_at")
+TREE_ENTRY_FIELDS = ("path", "type", "sha")
+
+
+@dataclass
+class ConditionalRequestStats:
+    """Process-wide counters of cached GitHub API requests."""
+
+    requests: int = 0
+    conditional: int = 0
+    not_modified: int = 0
+
+    def snapshot(self) -> "ConditionalRequestStats":
+        return replace(self)
+
+    def since(self, earlier: "ConditionalRequestStats") -> "ConditionalRequestStats":
+        return ConditionalRequestStats(
+            requests=self.requests - earlier.requests,
+            conditional=self.conditional - earlier.conditional,
+            not_modified=self.not_modified - earlier.not_modified,
+        )
+
+
+github_cache_stats = ConditionalRequestStats()
+
+
+def compact_repo(data: dict[str, Any]) -> dict[str, Any]:
+    """Keep the repo fields the scanner reads."""
+    return {key: data.get(key) for key in REPO_FIELDS if key in data}
+
+
+def compact_tree(data: dict[str, Any]) -> dict[str, Any]:
+    """Keep blob entries (path/type/sha) of a recursive tree; drops urls, modes and sizes."""
+    return {
+        "sha": data.get("sha"),
+        "truncated": bool(data.get("truncated")),
+        "tree": [
+            {key: entry.get(key) for key in TREE_ENTRY_FIELDS}
+            for entry in data.get("tree", []) or []
+            if entry.get("type") == "blob"
+        ],
+    }
+
+
+class GithubResponseCache:
+    """Conditional GET of GitHub API JSON, cached in `github_repo_cache`."""
+
+    def __init__(self, session_factory: Callable = AsyncSessionLocal):
+        self._session_factory = session_factory
+
+    async def _load(self, url: str) -> Optional[tuple[Optional[str], Optional[str], dict]]:
+        try:
+            async with self._session_factory() as db:
+                entry = await get_cached_response(db, url)
+        except Exception:
+            return None
+        if (
+            entry is None
+            or not isinstance(entry.data, dict)
+            or not (entry.etag or entry.last_modified)
+        ):
+            return None
+        return entry.etag, entry.last_modified, entry.data
+
+    async def _store(
+        self, url: str, etag: Optional[str], last_modified: Optional[str], data: dict
+    ) -> None:
+        if not (etag or last_modified):
+            return
+        try:
+            async with self._session_factory() as db:
+                await store_cached_response(
+                    db, url, etag=etag, last_modified=last_modified, data=data
+                )
+                await db.commit()
+        except Exception:
+            return
+
+    async def get_json(
+        self,
+        client,
+        url: str,
+        *,
+        headers: dict[str, str],
+        compact: Optional[Callable[[dict], dict]] = None,
+    ) -> Optional[dict]:
+        """JSON body of a 200 (stored) or 304 (served from cache) response; None otherwise."""
+        cached = await self._load(url)
+        request_headers = dict(headers)
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                request_headers["If-None-Match"] = etag
+            if last_modified:
+                request_headers["If-Modified-Since"] = last_modified
+            github_cache_stats.conditional += 1
+        github_cache_stats.requests += 1
+
+        resp = await client.get(url, headers=request_headers)
+        if resp.status_code == 304 and cached is not None:
+            github_cache_stats.not_modified += 1
+            return cached[2]
+        if resp.status_code != 200:
+            raise_for_rate_limit(resp)
+            return None
+
+        data = resp.json()
+        if compact is not None:
+            data = compact(data)
+        await self._store(url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"), data)
+        return data
@@ -0,0 +1,254 @@
+"""GitHub rate-limit budgeting for the ingest crawler.
+
+Every GitHub request of a crawl takes a token from its bucket first:
+
+- `core`: REST API (repo metadata, trees); 5000/hour with a token, 60 without
+- `search`: Search API; 30/minute with a token, 10 without
+- `raw`: raw.githubusercontent.com downloads (no rate headers; local hourly budget)
+
+Buckets start from those defaults and follow `X-RateLimit-Limit/Remaining/Reset` of every
+response. Waiting requests are served by priority (official repos first), and an empty
+bucket sleeps until its reset. Rate-limited responses (403/429 with `Retry-After` or
+`X-RateLimit-Remaining: 0`) block the bucket for the indicated time and are retried.
+Waits longer than `max_wait_seconds` fail with `GithubRateLimitError`, so a starved
+repo shows up as a source error instead of silently disappearing.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import urlparse
+
+CORE = "core"
+SEARCH = "search"
+RAW = "raw"
+RAW_HOST = "raw.githubusercontent.com"
+
+# Lower runs first.
+PRIORITY_OFFICIAL = 0
+PRIORITY_DISCOVERED = 1
+PRIORITY_SEARCH = 2
+
+# GitHub asks to wait at least a minute after a secondary rate limit without Retry-After.
+SECONDARY_LIMIT_WAIT_SECONDS = 60.0
+
+
+class GithubRateLimitError(Exception):
+    """GitHub budget exhausted for longer than the scheduler may wait."""
+
+
+def bucket_for_url(url: str, api_host: str = "api.github.com") -> Optional[str]:
+    parsed = urlparse(url)
+    host = (parsed.netloc or "").lower()
+    if host == RAW_HOST:
+        return RAW
+    if host == api_host:
+        return SEARCH if "/search/" in parsed.path else CORE
+    return None
+
+
+def _header_float(headers: Any, name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def rate_limit_wait(response: Any, now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited response; None when it is not rate limited."""
+    if response.status_code not in (403, 429):
+        return None
+    now = time.time() if now is None else now
+    retry_after = _header_float(response.headers, "Retry-After")
+    if retry_after is not None:
+        return max(retry_after, 1.0)
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = _header_float(response.headers, "X-RateLimit-Reset")
+        if reset is not None:
+            return max(reset - now, 1.0)
+    if response.status_code == 429:
+        return SECONDARY_LIMIT_WAIT_SECONDS
+    return None
+
+
+def raise_for_rate_limit(response: Any) -> None:
+    wait = rate_limit_wait(response)
+    if wait is not None:
+        raise GithubRateLimitError(
+            f"GitHub rate limit [{response.status_code}] {response.url} (retry in {wait:.0f}s)"
+        )
+
+
+class RateBucket:
+    """Token bucket for one GitHub resource with a priority queue of waiting requests."""
+
+    def __init__(
+        self, name: str, limit: int, window_seconds: float, clock: Callable[[], float] = time.time
+    ):
+        self.name = name
+        self.limit = max(1, int(limit))
+        self.window_seconds = float(window_seconds)
+        self._clock = clock
+        self.remaining = self.limit
+        self.reset_at = clock() + self.window_seconds
+        self.blocked_until = 0.0
+        self.used = 0
+        self.rate_limited = 0
+        self._observed = False
+        self._waiters: list[tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._cond = asyncio.Condition()
+
+    def _refill(self, now: float) -> None:
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.window_seconds
+
+    def wait_seconds(self) -> float:
+        now = self._clock()
+        self._refill(now)
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        if self.remaining > 0:
+            return 0.0
+        return max(self.reset_at - now, 0.0)
+
+    async def acquire(self, priority: int, max_wait: float) -> None:
+        """Take one token; waits (in priority order) until the bucket has budget again."""
+        entry = (priority, next(self._seq))
+        async with self._cond:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    if self._waiters[0] != entry:
+                        await self._cond.wait()
+                        continue
+                    wait = self.wait_seconds()
+                    if wait <= 0:
+                        self.remaining -= 1
+                        self.used += 1
+                        return
+                    if wait > max_wait:
+                        raise GithubRateLimitError(
+                            f"GitHub {self.name} budget exhausted for {wait:.0f}s "
+                            f"(max wait {max_wait:.0f}s)"
+                        )
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), timeout=wait)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    async def observe(self, headers: Any) -> None:
+        """Follow GitHub's view of the budget from `X-RateLimit-*` response headers."""
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+        limit = _header_float(headers, "X-RateLimit-Limit")
+        if remaining is None or reset is None:
+            return
+        async with self._cond:
+            if limit:
+                self.limit = int(limit)
+            if not self._observed or abs(reset - self.reset_at) > 1:
+                # First response, or a new window: GitHub's count replaces the local guess.
+                self.remaining = int(remaining)
+            else:
+                # Same window: requests still in flight already took their local token.
+                self.remaining = min(self.remaining, int(remaining))
+            self.reset_at = reset
+            self._observed = True
+            self._cond.notify_all()
+
+    async def block(self, seconds: float) -> None:
+        async with self._cond:
+            self.rate_limited += 1
+            self.blocked_until = max(self.blocked_until, self._clock() + seconds)
+            self._cond.notify_all()
+
+    def status(self) -> dict[str, Any]:
+        self._refill(self._clock())
+        return {
+            "limit": int(self.limit),
+            "remaining": int(max(self.remaining, 0)),
+            "used": int(self.used),
+            "rate_limited": int(self.rate_limited),
+            "reset_at": datetime.fromtimestamp(self.reset_at, tz=timezone.utc).isoformat(),
+        }
+
+
+class GithubScheduler:
+    """Routes GitHub requests through per-resource buckets with retry on rate limits."""
+
+    def __init__(
+        self,
+        *,
+        has_token: bool,
+        raw_per_hour: int = 5000,
+        max_wait_seconds: float = 900.0,
+        max_retries: int = 2,
+        api_host: str = "api.github.com",
+        clock: Callable[[], float] = time.time,
+    ):
+        self.api_host = api_host.lower()
+        self.max_wait_seconds = float(max_wait_seconds)
+        self.max_retries = max(0, int(max_retries))
+        self._clock = clock
+        self.buckets = {
+            CORE: RateBucket(CORE, 5000 if has_token else 60, 3600, clock),
+            SEARCH: RateBucket(SEARCH, 30 if has_token else 10, 60, clock),
+            RAW: RateBucket(RAW, raw_per_hour, 3600, clock),
+        }
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "GithubScheduler":
+        return cls(
+            has_token=bool(settings.github_token),
+            raw_per_hour=settings.github_raw_requests_per_hour,
+            max_wait_seconds=settings.github_rate_limit_max_wait_seconds,
+            max_retries=settings.github_rate_limit_max_retries,
+            api_host=urlparse(settings.github_api_base).netloc or "api.github.com",
+        )
+
+    async def send(
+        self, url: str, send: Callable[[], Awaitable[Any]], priority: int = PRIORITY_DISCOVERED
+    ) -> Any:
+        """Run `send()` (one HTTP request to `url`) within its bucket's budget."""
+        bucket = self.buckets.get(bucket_for_url(url, self.api_host) or "")
+        if bucket is None:
+            return await send()
+        for _ in range(self.max_retries + 1):
+            await bucket.acquire(priority, self.max_wait_seconds)
+            response = await send()
+            await bucket.observe(response.headers)
+            wait = rate_limit_wait(response, self._clock())
+            if wait is None:
+                return response
+            await bucket.block(wait)
+        raise_for_rate_limit(response)
+        return response
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        return {name: bucket.status() for name, bucket in self.buckets.items()}
+
+
+_scheduler: Optional[GithubScheduler] = None
+_scheduler_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_github_scheduler(settings: Any) -> GithubScheduler:
+    """Process-wide scheduler (one per event loop), so budgets carry over between crawls."""
+    global _scheduler, _scheduler_loop
+    loop = asyncio.get_running_loop()
+    if _scheduler is None or _scheduler_loop is not loop:
+        _scheduler = GithubScheduler.from_settings(settings)
+        _scheduler_loop = loop
+    return _scheduler
@@ -1,26 +1,127 @@
-"""HTTP Client for ingestion."""
+"""HTTP Client for ingestion.
+
+The crawl shares one long-lived pooled client (`get_shared_http_client`): repo scans,
+SKILL.md downloads and directory pages reuse keep-alive connections instead of paying a
+TCP+TLS handshake per repo. Concurrent requests per host are capped by the crawler
+(`app/ingest/crawler.py`), which also bounds the connections opened per host.
+
+HTTP/2 needs the optional `h2` package (`http2` extra); without it the client speaks
+HTTP/1.1 with keep-alive.
+"""
+
+import asyncio
+from dataclasses import dataclass, replace
+from typing import Any, Optional
 
 import httpx
-from httpx import AsyncClient, Timeout
-from typing import Optional
+from httpx import AsyncClient, Limits, Timeout
+
+from app.settings import get_settings
+
+try:
+    import h2
+except ImportError:  # pragma: no cover - depends on the optional extra
+    h2 = None
+
+
+@dataclass
+class ConnectionStats:
+    """Process-wide request/connection counters of ingest clients."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    http2_responses: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        """Requests served on an already open connection."""
+        return max(self.requests - self.connections_opened, 0)
+
+    def snapshot(self) -> "ConnectionStats":
+        return replace(self)
+
+    def since(self, earlier: "ConnectionStats") -> "ConnectionStats":
+        return ConnectionStats(
+            requests=self.requests - earlier.requests,
+            connections_opened=self.connections_opened - earlier.connections_opened,
+            http2_responses=self.http2_responses - earlier.http2_responses,
+        )
+
+
+connection_stats = ConnectionStats()
+
+_shared_client: Optional[AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def http2_enabled(settings: Any) -> bool:
+    return bool(settings.ingest_http2) and h2 is not None
+
+
+def client_limits(settings: Any) -> Limits:
+    return Limits(
+        max_connections=max(1, settings.ingest_http_max_connections),
+        max_keepalive_connections=max(0, settings.ingest_http_max_keepalive_connections),
+        keepalive_expiry=max(0.0, float(settings.ingest_http_keepalive_expiry_seconds)),
+    )
+
+
+async def _trace(event_name: str, info: dict) -> None:
+    if event_name == "connection.connect_tcp.complete":
+        connection_stats.connections_opened += 1
+
+
+async def _on_request(request: httpx.Request) -> None:
+    request.extensions.setdefault("trace", _trace)
+
+
+async def _on_response(response: httpx.Response) -> None:
+    connection_stats.requests += 1
+    if response.http_version == "HTTP/2":
+        connection_stats.http2_responses += 1
+
 
 async def get_http_client() -> AsyncClient:
-    """Get configured HTTP client."""
+    """Create a configured pooled client; the caller owns (and closes) it."""
+    settings = get_settings()
     timeout = Timeout(30.0, connect=10.0)
     # Some directories block default http clients without a UA.
     headers = {
         "User-Agent": "agent-skills-marketplace/1.0",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
-    return AsyncClient(timeout=timeout, follow_redirects=True, headers=headers)
+    return AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        headers=headers,
+        limits=client_limits(settings),
+        http2=http2_enabled(settings),
+        event_hooks={"request": [_on_request], "response": [_on_response]},
+    )
+
+
+async def get_shared_http_client() -> AsyncClient:
+    """Long-lived client shared by the whole crawl (one per event loop)."""
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        _shared_client = await get_http_client()
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_shared_http_client() -> None:
+    global _shared_client, _shared_client_loop
+    client, _shared_client, _shared_client_loop = _shared_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
 
 async def fetch_text(url: str, client: Optional[AsyncClient] = None) -> Optional[str]:
-    """Fetch text content from URL."""
-    should_close = False
+    """Fetch text content from URL (on the shared client unless one is passed)."""
     if not client:
-        client = await get_http_client()
-        should_close = True
-        
+        client = await get_shared_http_client()
+
     try:
         response = await client.get(url)
         response.raise_for_status()
@@ -28,6 +129,3 @@ async def fetch_text(url: str, client: Optional[AsyncClient] = None) -> Optional
     except Exception as e:
         print(f"Error fetching {url}: {e}")
         return None
-    finally:
-        if should_close:
-            await client.aclose()
@@ -1,10 +1,22 @@
 """Source ingestion logic."""
 
+import asyncio
 import re
+from dataclasses import dataclass, field
 from typing import Any, Optional
 from urllib.parse import urljoin, urlparse
 
-from app.ingest.http import fetch_text, get_http_client
+from app.ingest.crawler import CrawlClient, CrawlLimiter
+from app.ingest.github_cache import GithubResponseCache
+from app.ingest.github_scheduler import (
+    PRIORITY_DISCOVERED,
+    PRIORITY_OFFICIAL,
+    PRIORITY_SEARCH,
+    GithubRateLimitError,
+    get_github_scheduler,
+)
+from app.ingest.http import fetch_text, get_shared_http_client
+from app.ingest.tree_index import TreeIndex, scan_options_hash
 from app.parsers.github_repo_scanner import extract_repo_full_name, list_repo_skills_candidates
 from app.settings import get_settings
 
@@ -324,6 +336,7 @@ async def discover_repos_from_web_directory(
         if not xml:
             continue
 
+        page_urls: list[str] = []
         for loc_url in extract_urls_from_sitemap_xml(xml):
             parsed = urlparse(loc_url)
             if parsed.netloc and parsed.netloc != host:
@@ -338,11 +351,13 @@ async def discover_repos_from_web_directory(
             page_budget -= 1
             if page_budget < 0:
                 break
+            page_urls.append(loc_url)
 
-            page_html = await fetch_text(loc_url, client)
-            if not page_html:
-                continue
-            repos.update(extract_github_repos_from_web_directory(page_html))
+        # Pages of one sitemap are fetched together; the per-host limit keeps this polite.
+        pages = await asyncio.gather(*(fetch_text(url, client) for url in page_urls))
+        for page_html in pages:
+            if page_html:
+                repos.update(extract_github_repos_from_web_directory(page_html))
 
     return sorted(repos)
 
@@ -415,7 +430,11 @@ async def discover_repos_from_github_search(source: dict[str, Any], client) -> l
                 params["order"] = "desc"
 
             search_url = f"{settings.github_api_base}{endpoint}"
-            resp = await client.get(search_url, headers=headers, params=params)
+            try:
+                resp = await client.get(search_url, headers=headers, params=params)
+            except GithubRateLimitError as exc:
+                print(f"GitHub search paused query='{query}' page={page}: {exc}")
+                break
             if resp.status_code != 200:
                 # 403/429 are common without auth (rate limit / abuse protection).
                 detail = ""
@@ -452,13 +471,114 @@ async def discover_repos_from_github_search(source: dict[str, Any], client) -> l
 
 
 async def fetch_source_content(source: dict[str, Any]) -> Optional[str]:
-    """Fetch content for a source."""
+    """Fetch content for a source (on the shared ingest client)."""
     return await fetch_text(source["url"])
 
 
-async def run_ingest_sources(progress=None, source_ids: Optional[list[str]] = None):
+@dataclass
+class _SourcePlan:
+    """What one source discovered; repos are claimed in source order before crawling."""
+
+    index: int
+    source: dict[str, Any]
+    skipped: bool = False
+    content: Optional[str] = None
+    direct_skill_urls: list[str] = field(default_factory=list)
+    discovered_repos: list[str] = field(default_factory=list)
+    repos: list[str] = field(default_factory=list)
+
+    @property
+    def source_id(self) -> str:
+        return self.source["id"]
+
+    @property
+    def source_type(self) -> str:
+        return self.source.get("type", "markdown_list")
+
+    @property
+    def max_repos(self) -> int:
+        return int(self.source.get("max_repos", 60))
+
+    @property
+    def priority(self) -> int:
+        """GitHub budget priority: curated repos, then listed/directory repos, then search."""
+        if self.source_type == "github_repo":
+            return PRIORITY_OFFICIAL
+        if self.source_type == "github_search":
+            return PRIORITY_SEARCH
+        return PRIORITY_DISCOVERED
+
+
+def _repo_scan_options(source: dict[str, Any]) -> dict[str, Any]:
+    """Scanner arguments and result tagging for a repo-scanning source type."""
+    source_type = source.get("type", "markdown_list")
+    source_id = source["id"]
+    if source_type == "markdown_list":
+        return {
+            "allowed_path_globs": source.get("allowed_path_globs")
+            or ["skills/*/SKILL.md", ".claude/skills/*/SKILL.md"],
+            "min_repo_type": str(source.get("min_repo_type", "skills_only")),
+            "max_skill_files": int(source.get("max_skill_files_per_repo", 200)),
+            "discovered_from": f"markdown_list:{source_id}",
+        }
+    if source_type == "github_repo":
+        return {
+            "allowed_path_globs": source.get("allowed_path_globs"),
+            "min_repo_type": str(source.get("min_repo_type", "skills_focused")),
+            "max_skill_files": None,
+            "discovered_from": None,
+        }
+    discovered_from = f"github_search:{source_id}"
+    if source_type == "web_directory":
+        discovered_from = urlparse(source["url"]).netloc
+    return {
+        "allowed_path_globs": source.get("allowed_path_globs"),
+        "min_repo_type": str(source.get("min_repo_type", "skills_only")),
+        "max_skill_files": None,
+        "discovered_from": discovered_from,
+    }
+
+
+def _claim_repos(plan: _SourcePlan, scanned_repos: set[str]) -> None:
+    """Assign discovered repos to `plan`, skipping repos an earlier source already claimed."""
+    if plan.skipped:
+        return
+    if plan.source_type == "github_repo":
+        repo_full_name = plan.source["repo_full_name"]
+        if repo_full_name.lower() in scanned_repos:
+            plan.skipped = True
+            return
+        scanned_repos.add(repo_full_name.lower())
+        plan.repos = [repo_full_name]
+        return
+
+    for repo_full_name in plan.discovered_repos:
+        if len(plan.repos) >= plan.max_repos:
+            break
+        if repo_full_name.lower() in scanned_repos:
+            continue
+        scanned_repos.add(repo_full_name.lower())
+        plan.repos.append(repo_full_name)
+
+
+async def run_ingest_sources(
+    progress=None,
+    source_ids: Optional[list[str]] = None,
+    client=None,
+    tree_index: Optional[TreeIndex] = None,
+):
     """Fetch all configured sources.
 
+    Runs as a bounded-parallel crawl: every source discovers its list/directory/search
+    results concurrently, discovered repos are then claimed in source order (so the
+    `scanned_repos` dedupe matches a sequential run), and repo scans and SKILL.md
+    downloads run concurrently under `CrawlLimiter` (global cap + per-host limits) and
+    the GitHub rate-limit scheduler (budget per core/search/raw, curated repos first).
+    Results are returned in source order, then repo order, then file order. Every request
+    goes through `client` (default: the long-lived shared ingest client, left open).
+    With `tree_index`, unchanged repos are skipped and only files with a new blob SHA are
+    downloaded; the caller saves `tree_index` after upserting the results.
+
     If provided, `progress` is called with a dict payload describing the current stage.
     It may be a sync or async callable.
     """
@@ -481,463 +601,231 @@ async def run_ingest_sources(progress=None, source_ids: Optional[list[str]] = No
     if requested_ids:
         sources_to_run = [s for s in SOURCES if str(s.get("id", "")).strip() in requested_ids]
 
-    client = await get_http_client()
-    results = []
+    if client is None:
+        client = await get_shared_http_client()
+    scheduler = get_github_scheduler(settings)
+    crawl_client = CrawlClient(
+        client, limiter=CrawlLimiter.from_settings(settings), scheduler=scheduler
+    )
+    # Repo/tree requests revalidate against `github_repo_cache` (304 = no rate-limit cost).
+    response_cache = GithubResponseCache() if settings.ingest_github_conditional_requests else None
     scanned_repos: set[str] = set()
-
     source_total = len(sources_to_run)
-    for idx, source in enumerate(sources_to_run, start=1):
-        source_type = source.get("type", "markdown_list")
-        source_id = source["id"]
+
+    async def _emit_source(plan: _SourcePlan, phase: str, **extra: Any) -> None:
         await _emit(
             {
-                "phase": "ingest_source_start",
-                "ingest_source_id": source_id,
-                "ingest_source_type": source_type,
-                "ingest_source_index": idx,
+                "phase": phase,
+                "ingest_source_id": plan.source_id,
+                "ingest_source_type": plan.source_type,
+                "ingest_source_index": plan.index,
                 "ingest_source_total": source_total,
+                **extra,
             }
         )
 
+    def _client(plan: _SourcePlan) -> CrawlClient:
+        return crawl_client.with_priority(plan.priority)
+
+    async def _discover(plan: _SourcePlan) -> _SourcePlan:
+        source = plan.source
+        source_type = plan.source_type
+        await _emit_source(plan, "ingest_source_start")
+
         if source_type == "markdown_list":
             list_url = str(source.get("url", "")).strip()
-            await _emit(
-                {
-                    "phase": "ingest_fetch_url",
-                    "ingest_source_id": source_id,
-                    "ingest_source_type": source_type,
-                    "ingest_source_index": idx,
-                    "ingest_source_total": source_total,
-                    "ingest_url": list_url,
-                }
-            )
-            content = await fetch_text(list_url, client)
+            await _emit_source(plan, "ingest_fetch_url", ingest_url=list_url)
+            content = await fetch_text(list_url, _client(plan))
             if not content:
-                continue
+                plan.skipped = True
+                return plan
 
             # 1) Direct SKILL.md URLs in the list (fast path, avoids repo scanning).
-            direct_skill_urls = extract_skill_md_urls_from_markdown(content)
-            for skill_url in direct_skill_urls:
-                skill_content = await fetch_text(skill_url, client)
-                if not skill_content:
-                    continue
-                results.append(
-                    {
-                        "source_id": source_id,
-                        "content": skill_content,
-                        "url": skill_url,
-                        "external_id": skill_url,
-                        "source_type": "skill_md",
-                        "discovered_from": f"markdown_list:{source_id}:direct",
-                    }
-                )
-
-            repo_scan_enabled = bool(source.get("repo_scan_enabled", True))
-            if not repo_scan_enabled:
-                await _emit(
-                    {
-                        "phase": "ingest_source_done",
-                        "ingest_source_id": source_id,
-                        "ingest_source_type": source_type,
-                        "ingest_source_index": idx,
-                        "ingest_source_total": source_total,
-                        "ingest_discovered_repos": 0,
-                    }
-                )
-                continue
+            plan.direct_skill_urls = extract_skill_md_urls_from_markdown(content)
+            if not bool(source.get("repo_scan_enabled", True)):
+                return plan
 
             # Discover repos from the list (or use explicit overrides when provided).
             override_repos = source.get("repo_full_names")
             if isinstance(override_repos, list) and override_repos:
-                repos = [str(r).strip() for r in override_repos if str(r).strip()]
+                plan.discovered_repos = [str(r).strip() for r in override_repos if str(r).strip()]
             else:
-                repos = extract_github_repos_from_markdown(content)
-
-            max_repos = int(source.get("max_repos", 60))
-            allowed_path_globs = source.get("allowed_path_globs") or ["skills/*/SKILL.md", ".claude/skills/*/SKILL.md"]
-            min_repo_type = str(source.get("min_repo_type", "skills_only"))
-            max_skill_files_per_repo = int(source.get("max_skill_files_per_repo", 200))
-
-            discovered_count = 0
-            await _emit(
-                {
-                    "phase": "ingest_discover_repos",
-                    "ingest_source_id": source_id,
-                    "ingest_source_type": source_type,
-                    "ingest_source_index": idx,
-                    "ingest_source_total": source_total,
-                    "ingest_discovered_repos": min(len(repos), max_repos),
-                }
+                plan.discovered_repos = extract_github_repos_from_markdown(content)
+            await _emit_source(
+                plan,
+                "ingest_discover_repos",
+                ingest_discovered_repos=min(len(plan.discovered_repos), plan.max_repos),
             )
+            return plan
 
-            for repo_full_name in repos:
-                if discovered_count >= max_repos:
-                    break
-                if repo_full_name.lower() in scanned_repos:
-                    continue
-                scanned_repos.add(repo_full_name.lower())
-                discovered_count += 1
-
-                await _emit(
-                    {
-                        "phase": "ingest_scan_repo",
-                        "ingest_source_id": source_id,
-                        "ingest_source_type": source_type,
-                        "ingest_source_index": idx,
-                        "ingest_source_total": source_total,
-                        "ingest_repo_full_name": repo_full_name,
-                        "ingest_discovered_repo_index": discovered_count,
-                        "ingest_discovered_repo_total": min(len(repos), max_repos),
-                    }
-                )
+        if source_type == "github_repo":
+            return plan
 
-                try:
-                    candidates = await list_repo_skills_candidates(
-                        repo_full_name,
-                        allowed_path_globs=allowed_path_globs,
-                        min_repo_type=min_repo_type,
-                    )
-                except Exception as exc:
-                    await _emit(
-                        {
-                            "phase": "ingest_source_error",
-                            "ingest_source_id": source_id,
-                            "ingest_source_type": source_type,
-                            "ingest_source_index": idx,
-                            "ingest_source_total": source_total,
-                            "ingest_repo_full_name": repo_full_name,
-                            "ingest_last_source_error": str(exc),
-                        }
+        if source_type in ("web_directory", "github_search"):
+            directory_url = source.get("url") if source_type == "web_directory" else None
+            extra = {"ingest_directory_url": directory_url} if directory_url else {}
+            if directory_url:
+                await _emit_source(plan, "ingest_discover_repos", **extra)
+            else:
+                await _emit_source(plan, "ingest_github_search")
+            try:
+                if directory_url:
+                    plan.discovered_repos = await discover_repos_from_web_directory(
+                        source, _client(plan)
                     )
-                    continue
-
-                for candidate in candidates[:max_skill_files_per_repo]:
-                    skill_url = candidate.get("url")
-                    if not skill_url:
-                        continue
-                    skill_content = await fetch_text(skill_url, client)
-                    if not skill_content:
-                        continue
-                    results.append(
-                        {
-                            "source_id": source_id,
-                            "content": skill_content,
-                            "url": skill_url,
-                            "external_id": skill_url,
-                            "source_type": "skill_md",
-                            "repo_full_name": repo_full_name,
-                            "skill_path": candidate.get("path"),
-                            "skill_sha": candidate.get("sha"),
-                            "discovered_from": f"markdown_list:{source_id}",
-                            "repo_type": candidate.get("repo_type"),
-                            "repo_intent_score": candidate.get("repo_intent_score"),
-                            "repo_total_files": candidate.get("repo_total_files"),
-                            "repo_skill_files": candidate.get("repo_skill_files"),
-                            "repo_canonical_skill_files": candidate.get("repo_canonical_skill_files"),
-                        }
+                else:
+                    plan.discovered_repos = await discover_repos_from_github_search(
+                        source, _client(plan)
                     )
-
-            await _emit(
-                {
-                    "phase": "ingest_source_done",
-                    "ingest_source_id": source_id,
-                    "ingest_source_type": source_type,
-                    "ingest_source_index": idx,
-                    "ingest_source_total": source_total,
-                    "ingest_discovered_repos": discovered_count,
-                }
-            )
-            continue
-
-        if source_type == "github_repo":
-            repo_full_name = source["repo_full_name"]
-            if repo_full_name.lower() in scanned_repos:
-                continue
-            scanned_repos.add(repo_full_name.lower())
-            try:
-                candidates = await list_repo_skills_candidates(
-                    repo_full_name,
-                    allowed_path_globs=source.get("allowed_path_globs"),
-                    min_repo_type=str(source.get("min_repo_type", "skills_focused")),
-                )
             except Exception as exc:
-                await _emit(
-                    {
-                        "phase": "ingest_source_error",
-                        "ingest_source_id": source_id,
-                        "ingest_source_type": source_type,
-                        "ingest_source_index": idx,
-                        "ingest_source_total": source_total,
-                        "ingest_last_source_error": str(exc),
-                    }
-                )
-                continue
-            for candidate in candidates:
-                content = await fetch_text(candidate["url"], client)
-                if not content:
-                    continue
-                results.append(
-                    {
-                        "source_id": source_id,
-                        "content": content,
-                        "url": candidate["url"],
-                        "external_id": candidate["url"],
-                        "source_type": "skill_md",
-                        "repo_full_name": repo_full_name,
-                        "skill_path": candidate["path"],
-                        "skill_sha": candidate["sha"],
-                        "repo_type": candidate.get("repo_type"),
-                        "repo_intent_score": candidate.get("repo_intent_score"),
-                        "repo_total_files": candidate.get("repo_total_files"),
-                        "repo_skill_files": candidate.get("repo_skill_files"),
-                        "repo_canonical_skill_files": candidate.get("repo_canonical_skill_files"),
-                    }
+                await _emit_source(
+                    plan, "ingest_source_error", ingest_last_source_error=str(exc), **extra
                 )
-            await _emit(
-                {
-                    "phase": "ingest_source_done",
-                    "ingest_source_id": source_id,
-                    "ingest_source_type": source_type,
-                    "ingest_source_index": idx,
-                    "ingest_source_total": source_total,
-                }
+                plan.skipped = True
+            return plan
+
+        await _emit_source(plan, "ingest_fetch_url", ingest_url=source.get("url"))
+        plan.content = await fetch_text(source["url"], _client(plan))
+        if not plan.content:
+            plan.skipped = True
+        return plan
+
+    async def _fetch_direct_skill(plan: _SourcePlan, skill_url: str) -> list[dict[str, Any]]:
+        skill_content = await fetch_text(skill_url, _client(plan))
+        if not skill_content:
+            return []
+        return [
+            {
+                "source_id": plan.source_id,
+                "content": skill_content,
+                "url": skill_url,
+                "external_id": skill_url,
+                "source_type": "skill_md",
+                "discovered_from": f"markdown_list:{plan.source_id}:direct",
+            }
+        ]
+
+    async def _fetch_candidate(
+        plan: _SourcePlan,
+        repo_full_name: str,
+        candidate: dict[str, Any],
+        discovered_from: Optional[str],
+    ) -> list[dict[str, Any]]:
+        skill_url = candidate.get("url")
+        if not skill_url:
+            return []
+        skill_content = await fetch_text(skill_url, _client(plan))
+        if not skill_content:
+            return []
+        return [
+            {
+                "source_id": plan.source_id,
+                "content": skill_content,
+                "url": skill_url,
+                "external_id": skill_url,
+                "source_type": "skill_md",
+                "repo_full_name": repo_full_name,
+                "skill_path": candidate.get("path"),
+                "skill_sha": candidate.get("sha"),
+                "discovered_from": discovered_from,
+                "repo_type": candidate.get("repo_type"),
+                "repo_intent_score": candidate.get("repo_intent_score"),
+                "repo_total_files": candidate.get("repo_total_files"),
+                "repo_skill_files": candidate.get("repo_skill_files"),
+                "repo_canonical_skill_files": candidate.get("repo_canonical_skill_files"),
+            }
+        ]
+
+    async def _crawl_repo(
+        plan: _SourcePlan, repo_index: int, repo_full_name: str
+    ) -> list[dict[str, Any]]:
+        options = _repo_scan_options(plan.source)
+        if plan.source_type != "github_repo":
+            await _emit_source(
+                plan,
+                "ingest_scan_repo",
+                ingest_repo_full_name=repo_full_name,
+                ingest_discovered_repo_index=repo_index,
+                ingest_discovered_repo_total=min(len(plan.discovered_repos), plan.max_repos),
             )
-            continue
-
-        if source_type == "web_directory":
-            directory_url = source["url"]
-            await _emit(
-                {
-                    "phase": "ingest_discover_repos",
-                    "ingest_source_id": source_id,
-                    "ingest_source_type": source_type,
-                    "ingest_source_index": idx,
-                    "ingest_source_total": source_total,
-                    "ingest_directory_url": directory_url,
-                }
+        try:
+            candidates = await list_repo_skills_candidates(
+                repo_full_name,
+                allowed_path_globs=options["allowed_path_globs"],
+                min_repo_type=options["min_repo_type"],
+                client=_client(plan),
+                response_cache=response_cache,
             )
-            try:
-                repos = await discover_repos_from_web_directory(source, client)
-            except Exception as exc:
-                await _emit(
-                    {
-                        "phase": "ingest_source_error",
-                        "ingest_source_id": source_id,
-                        "ingest_source_type": source_type,
-                        "ingest_source_index": idx,
-                        "ingest_source_total": source_total,
-                        "ingest_directory_url": directory_url,
-                        "ingest_last_source_error": str(exc),
-                    }
-                )
-                continue
-            max_repos = int(source.get("max_repos", 60))
-            discovered_count = 0
-
-            for repo_full_name in repos:
-                if discovered_count >= max_repos:
-                    break
-                if repo_full_name.lower() in scanned_repos:
-                    continue
-                scanned_repos.add(repo_full_name.lower())
-                discovered_count += 1
-
-                await _emit(
-                    {
-                        "phase": "ingest_scan_repo",
-                        "ingest_source_id": source_id,
-                        "ingest_source_type": source_type,
-                        "ingest_source_index": idx,
-                        "ingest_source_total": source_total,
-                        "ingest_repo_full_name": repo_full_name,
-                        "ingest_discovered_repo_index": discovered_count,
-                        "ingest_discovered_repo_total": min(len(repos), max_repos),
-                    }
-                )
-                try:
-                    candidates = await list_repo_skills_candidates(
-                        repo_full_name,
-                        allowed_path_globs=source.get("allowed_path_globs"),
-                        min_repo_type=str(source.get("min_repo_type", "skills_only")),
-                    )
-                except Exception as exc:
-                    await _emit(
-                        {
-                            "phase": "ingest_source_error",
-                            "ingest_source_id": source_id,
-                            "ingest_source_type": source_type,
-                            "ingest_source_index": idx,
-                            "ingest_source_total": source_total,
-                            "ingest_repo_full_name": repo_full_name,
-                            "ingest_last_source_error": str(exc),
-                        }
-                    )
-                    continue
-                for candidate in candidates:
-                    content = await fetch_text(candidate["url"], client)
-                    if not content:
-                        continue
-                    results.append(
-                        {
-                            "source_id": source_id,
-                            "content": content,
-                            "url": candidate["url"],
-                            "external_id": candidate["url"],
-                            "source_type": "skill_md",
-                            "repo_full_name": repo_full_name,
-                            "skill_path": candidate["path"],
-                            "skill_sha": candidate["sha"],
-                            "discovered_from": urlparse(directory_url).netloc,
-                            "repo_type": candidate.get("repo_type"),
-                            "repo_intent_score": candidate.get("repo_intent_score"),
-                            "repo_total_files": candidate.get("repo_total_files"),
-                            "repo_skill_files": candidate.get("repo_skill_files"),
-                            "repo_canonical_skill_files": candidate.get("repo_canonical_skill_files"),
-                        }
-                    )
-            await _emit(
-                {
-                    "phase": "ingest_source_done",
-                    "ingest_source_id": source_id,
-                    "ingest_source_type": source_type,
-                    "ingest_source_index": idx,
-                    "ingest_source_total": source_total,
-                    "ingest_discovered_repos": discovered_count,
-                }
+        except Exception as exc:
+            await _emit_source(
+                plan,
+                "ingest_source_error",
+                ingest_repo_full_name=repo_full_name,
+                ingest_last_source_error=str(exc),
             )
-            continue
-
-        if source_type == "github_search":
-            await _emit(
-                {
-                    "phase": "ingest_github_search",
-                    "ingest_source_id": source_id,
-                    "ingest_source_type": source_type,
-                    "ingest_source_index": idx,
-                    "ingest_source_total": source_total,
-                }
+            return []
+
+        if options["max_skill_files"] is not None:
+            candidates = candidates[: options["max_skill_files"]]
+        to_fetch = candidates
+        options_hash = scan_options_hash(options)
+        if tree_index is not None:
+            to_fetch = await tree_index.changed_candidates(
+                repo_full_name, candidates, options_hash=options_hash
             )
-            try:
-                repos = await discover_repos_from_github_search(source, client)
-            except Exception as exc:
-                await _emit(
-                    {
-                        "phase": "ingest_source_error",
-                        "ingest_source_id": source_id,
-                        "ingest_source_type": source_type,
-                        "ingest_source_index": idx,
-                        "ingest_source_total": source_total,
-                        "ingest_last_source_error": str(exc),
-                    }
-                )
-                continue
-            max_repos = int(source.get("max_repos", 60))
-            discovered_count = 0
+        batches = await asyncio.gather(
+            *(
+                _fetch_candidate(plan, repo_full_name, c, options["discovered_from"])
+                for c in to_fetch
+            )
+        )
+        results = [item for batch in batches for item in batch]
+        if tree_index is not None:
+            tree_index.record(
+                repo_full_name,
+                candidates,
+                {item["skill_path"] for item in results},
+                options_hash=options_hash,
+            )
+        return results
 
-            for repo_full_name in repos:
-                if discovered_count >= max_repos:
-                    break
-                if repo_full_name.lower() in scanned_repos:
-                    continue
-                scanned_repos.add(repo_full_name.lower())
-                discovered_count += 1
-
-                await _emit(
-                    {
-                        "phase": "ingest_scan_repo",
-                        "ingest_source_id": source_id,
-                        "ingest_source_type": source_type,
-                        "ingest_source_index": idx,
-                        "ingest_source_total": source_total,
-                        "ingest_repo_full_name": repo_full_name,
-                        "ingest_discovered_repo_index": discovered_count,
-                        "ingest_discovered_repo_total": min(len(repos), max_repos),
-                    }
-                )
-                try:
-                    candidates = await list_repo_skills_candidates(
-                        repo_full_name,
-                        allowed_path_globs=source.get("allowed_path_globs"),
-                        min_repo_type=str(source.get("min_repo_type", "skills_only")),
-                    )
-                except Exception as exc:
-                    await _emit(
-                        {
-                            "phase": "ingest_source_error",
-                            "ingest_source_id": source_id,
-                            "ingest_source_type": source_type,
-                            "ingest_source_index": idx,
-                            "ingest_source_total": source_total,
-                            "ingest_repo_full_name": repo_full_name,
-                            "ingest_last_source_error": str(exc),
-                        }
-                    )
-                    continue
-                for candidate in candidates:
-                    content = await fetch_text(candidate["url"], client)
-                    if not content:
-                        continue
-                    results.append(
-                        {
-                            "source_id": source_id,
-                            "content": content,
-                            "url": candidate["url"],
-                            "external_id": candidate["url"],
-                            "source_type": "skill_md",
-                            "repo_full_name": repo_full_name,
-                            "skill_path": candidate["path"],
-                            "skill_sha": candidate["sha"],
-                            "discovered_from": f"github_search:{source_id}",
-                            "repo_type": candidate.get("repo_type"),
-                            "repo_intent_score": candidate.get("repo_intent_score"),
-                            "repo_total_files": candidate.get("repo_total_files"),
-                            "repo_skill_files": candidate.get("repo_skill_files"),
-                            "repo_canonical_skill_files": candidate.get("repo_canonical_skill_files"),
-                        }
-                    )
-            await _emit(
+    async def _crawl(plan: _SourcePlan) -> list[dict[str, Any]]:
+        if plan.skipped:
+            return []
+        if plan.content is not None:
+            results = [
                 {
-                    "phase": "ingest_source_done",
-                    "ingest_source_id": source_id,
-                    "ingest_source_type": source_type,
-                    "ingest_source_index": idx,
-                    "ingest_source_total": source_total,
-                    "ingest_discovered_repos": discovered_count,
+                    "source_id": plan.source_id,
+                    "content": plan.content,
+                    "url": plan.source["url"],
+                    "external_id": plan.source["url"],
+                    "source_type": plan.source_type,
                 }
-            )
-            continue
+            ]
+            await _emit_source(plan, "ingest_source_done")
+            return results
 
-        await _emit(
-            {
-                "phase": "ingest_fetch_url",
-                "ingest_source_id": source_id,
-                "ingest_source_type": source_type,
-                "ingest_source_index": idx,
-                "ingest_source_total": source_total,
-                "ingest_url": source.get("url"),
-            }
-        )
-        content = await fetch_text(source["url"], client)
-        if not content:
-            continue
-        results.append(
-            {
-                "source_id": source_id,
-                "content": content,
-                "url": source["url"],
-                "external_id": source["url"],
-                "source_type": source_type,
-            }
+        batches = await asyncio.gather(
+            *(_fetch_direct_skill(plan, url) for url in plan.direct_skill_urls),
+            *(_crawl_repo(plan, i, repo) for i, repo in enumerate(plan.repos, start=1)),
         )
-        await _emit(
-            {
-                "phase": "ingest_source_done",
-                "ingest_source_id": source_id,
-                "ingest_source_type": source_type,
-                "ingest_source_index": idx,
-                "ingest_source_total": source_total,
-            }
-        )
-            
-    await client.aclose()
-    return results
+        results = [item for batch in batches for item in batch]
+        if plan.source_type == "github_repo":
+            await _emit_source(plan, "ingest_source_done", github_rate_limits=scheduler.status())
+        else:
+            await _emit_source(
+                plan,
+                "ingest_source_done",
+                ingest_discovered_repos=len(plan.repos),
+                github_rate_limits=scheduler.status(),
+            )
+        return results
+
+    plans = [
+        _SourcePlan(index=idx, source=source) for idx, source in enumerate(sources_to_run, start=1)
+    ]
+    await asyncio.gather(*(_discover(plan) for plan in plans))
+    for plan in plans:
+        _claim_repos(plan, scanned_repos)
+    batches = await asyncio.gather(*(_crawl(plan) for plan in plans))
+    return [item for batch in batches for item in batch]
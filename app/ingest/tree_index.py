@@ -0,0 +1,166 @@
+"""Incremental crawl by git SHAs, backed by `github_tree_index`.
+
+Scanner candidates carry the repo's root tree SHA and each SKILL.md blob SHA. Per repo the
+crawler asks `TreeIndex.changed_candidates` what to download:
+
+- default branch or scan options (path globs, repo type, file cap) changed: everything
+- tree SHA unchanged since the last ingest: nothing, except files whose `raw_skills` row
+  was deleted meanwhile
+- otherwise: only files whose blob SHA differs from the stored one (plus deleted rows)
+
+`record` collects the new state and the ingest worker persists it with `save` after the
+downloaded files were upserted, so a crash in between only causes a re-download. A repo
+whose changed files could not all be downloaded is stored without its tree SHA and is
+compared file by file again next time.
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, NamedTuple, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import AsyncSessionLocal
+from app.repos.github_tree_index_repo import (
+    get_existing_raw_external_ids,
+    get_tree_index,
+    save_tree_index,
+)
+
+
+def scan_options_hash(options: dict[str, Any]) -> str:
+    """Fingerprint of the scan options that decide which SKILL.md files a repo yields."""
+    relevant = {
+        "allowed_path_globs": options.get("allowed_path_globs"),
+        "min_repo_type": options.get("min_repo_type"),
+        "max_skill_files": options.get("max_skill_files"),
+    }
+    raw = json.dumps(relevant, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class _StoredRepo(NamedTuple):
+    default_branch: str
+    tree_sha: str
+    blob_shas: dict[str, str]
+    options_hash: str
+    # Candidate URLs that still have a `raw_skills` row.
+    ingested_urls: set[str]
+
+
+class TreeIndex:
+    """Per-crawl view of `github_tree_index` plus the updates to store afterwards."""
+
+    def __init__(self, session_factory: Callable = AsyncSessionLocal):
+        self._session_factory = session_factory
+        self._stored_blobs: dict[str, dict[str, str]] = {}
+        self._unchanged_repos: set[str] = set()
+        self.pending: dict[str, dict[str, Any]] = {}
+        self.repos_unchanged = 0
+        self.files_unchanged = 0
+        self.files_changed = 0
+
+    async def _load(self, repo_full_name: str, urls: list[str]) -> Optional[_StoredRepo]:
+        try:
+            async with self._session_factory() as db:
+                entry = await get_tree_index(db, repo_full_name)
+                if entry is None:
+                    return None
+                ingested_urls = await get_existing_raw_external_ids(db, urls)
+        except Exception:
+            return None
+        return _StoredRepo(
+            entry.default_branch,
+            entry.tree_sha,
+            dict(entry.blob_shas or {}),
+            entry.options_hash or "",
+            ingested_urls,
+        )
+
+    async def changed_candidates(
+        self,
+        repo_full_name: str,
+        candidates: list[dict[str, Any]],
+        *,
+        options_hash: str = "",
+    ) -> list[dict[str, Any]]:
+        """Candidates to download: none for an unchanged tree, else the ones with a new blob SHA.
+
+        Candidates whose `raw_skills` row is gone are downloaded again either way.
+        """
+        if not candidates or not candidates[0].get("repo_tree_sha"):
+            return candidates
+        key = repo_full_name.lower()
+        tree_sha = candidates[0]["repo_tree_sha"]
+        urls = [c["url"] for c in candidates if c.get("url")]
+        stored = await self._load(repo_full_name, urls)
+        if (
+            stored is None
+            or stored.default_branch != candidates[0].get("repo_default_branch")
+            or stored.options_hash != options_hash
+        ):
+            # New repo, raw URLs changed with the default branch, or the source's scan
+            # options changed (other globs / repo type / file cap): fetch everything.
+            self.files_changed += len(candidates)
+            return candidates
+
+        missing = {url for url in urls if url not in stored.ingested_urls}
+        if stored.tree_sha == tree_sha and not missing:
+            self._unchanged_repos.add(key)
+            self.repos_unchanged += 1
+            self.files_unchanged += len(candidates)
+            return []
+
+        blob_shas = stored.blob_shas
+        self._stored_blobs[key] = blob_shas
+        changed = [
+            c
+            for c in candidates
+            if blob_shas.get(c.get("path")) != c.get("sha") or c.get("url") in missing
+        ]
+        self.files_unchanged += len(candidates) - len(changed)
+        self.files_changed += len(changed)
+        return changed
+
+    def record(
+        self,
+        repo_full_name: str,
+        candidates: list[dict[str, Any]],
+        fetched_paths: set[str],
+        *,
+        options_hash: str = "",
+    ) -> None:
+        """Remember the repo's new tree/blob SHAs after its changed files were downloaded."""
+        key = repo_full_name.lower()
+        if not candidates or not candidates[0].get("repo_tree_sha") or key in self._unchanged_repos:
+            return
+        stored_blobs = self._stored_blobs.get(key, {})
+        blob_shas: dict[str, str] = {}
+        complete = True
+        for candidate in candidates:
+            path, sha = candidate.get("path"), candidate.get("sha")
+            if not path:
+                continue
+            if path in fetched_paths or stored_blobs.get(path) == sha:
+                blob_shas[path] = sha
+                continue
+            complete = False
+            if path in stored_blobs:
+                blob_shas[path] = stored_blobs[path]
+        self.pending[key] = {
+            "repo_full_name": key,
+            "default_branch": candidates[0].get("repo_default_branch") or "",
+            # An empty tree SHA never matches, so the next crawl compares blobs again.
+            "tree_sha": candidates[0]["repo_tree_sha"] if complete else "",
+            "blob_shas": blob_shas,
+            "options_hash": options_hash,
+        }
+
+    async def save(self, db: AsyncSession) -> int:
+        """Persist recorded repos; call once their files are upserted."""
+        if not self.pending:
+            return 0
+        count = await save_tree_index(db, self.pending.values())
+        await db.commit()
+        self.pending.clear()
+        return count
@@ -0,0 +1,152 @@
+"""Embedding backends behind one provider interface.
+
+Every provider returns L2-normalized float32 vectors of `EMBEDDING_DIMENSIONS` so rows
+embedded by different backends stay comparable in `skills.embedding` (`Vector(384)`).
+
+- `sentence-transformers`: reference PyTorch pipeline.
+- `onnx`: ONNX Runtime on CPU, by default the int8-quantized export published with the
+  model (`onnx/model_qint8_avx2.onnx`). Needs the optional `onnx` extra
+  (`onnxruntime`, `tokenizers`, `huggingface-hub`).
+
+Heavy imports (torch, onnxruntime) happen when a provider is constructed.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Protocol, Sequence
+
+import numpy as np
+
+from app.settings import Settings
+
+EMBEDDING_DIMENSIONS = 384
+# all-MiniLM-L6-v2 truncates inputs at 256 word pieces (sentence-transformers max_seq_length).
+MAX_SEQUENCE_LENGTH = 256
+HF_MODEL_NAMESPACE = "sentence-transformers"
+
+
+class EmbeddingProvider(Protocol):
+    name: str
+
+    def encode(self, texts: Sequence[str], *, batch_size: int) -> np.ndarray:
+        """Return a `(len(texts), EMBEDDING_DIMENSIONS)` float32 array."""
+        ...
+
+
+def _check_dimensions(vectors: np.ndarray) -> np.ndarray:
+    if vectors.ndim != 2 or vectors.shape[1] != EMBEDDING_DIMENSIONS:
+        raise ValueError(
+            f"embedding backend returned shape {vectors.shape}, "
+            f"expected (n, {EMBEDDING_DIMENSIONS})"
+        )
+    return vectors.astype(np.float32, copy=False)
+
+
+class SentenceTransformerProvider:
+    name = "sentence-transformers"
+
+    def __init__(self, model_name: str) -> None:
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(model_name)
+
+    def encode(self, texts: Sequence[str], *, batch_size: int) -> np.ndarray:
+        vectors = self._model.encode(
+            list(texts),
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return _check_dimensions(np.asarray(vectors))
+
+
+class OnnxProvider:
+    """Mean pooling + L2 normalization over the transformer output, as in the ST pipeline."""
+
+    name = "onnx"
+
+    def __init__(self, model_name: str, *, model_path: str = "", model_file: str = "") -> None:
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        onnx_path, tokenizer_path = self._resolve_files(model_name, model_path, model_file)
+        self._tokenizer = Tokenizer.from_file(str(tokenizer_path))
+        self._tokenizer.enable_truncation(max_length=MAX_SEQUENCE_LENGTH)
+        self._tokenizer.enable_padding()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self._session = ort.InferenceSession(
+            str(onnx_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {item.name for item in self._session.get_inputs()}
+
+    @staticmethod
+    def _resolve_files(model_name: str, model_path: str, model_file: str) -> tuple[Path, Path]:
+        if model_path:
+            onnx_path = Path(model_path)
+            return onnx_path, onnx_path.parent / "tokenizer.json"
+
+        from huggingface_hub import hf_hub_download
+
+        repo_id = model_name if "/" in model_name else f"{HF_MODEL_NAMESPACE}/{model_name}"
+        onnx_path = Path(hf_hub_download(repo_id, model_file or "onnx/model_qint8_avx2.onnx"))
+        tokenizer_path = Path(hf_hub_download(repo_id, "tokenizer.json"))
+        return onnx_path, tokenizer_path
+
+    def _encode_batch(self, texts: list[str]) -> np.ndarray:
+        encodings = self._tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+        token_embeddings = self._session.run(None, feeds)[0]
+        return mean_pool_normalize(token_embeddings, attention_mask)
+
+    def encode(self, texts: Sequence[str], *, batch_size: int) -> np.ndarray:
+        items = list(texts)
+        if not items:
+            return np.zeros((0, EMBEDDING_DIMENSIONS), dtype=np.float32)
+        chunks = [
+            self._encode_batch(items[start : start + batch_size])
+            for start in range(0, len(items), batch_size)
+        ]
+        return _check_dimensions(np.vstack(chunks))
+
+
+def mean_pool_normalize(token_embeddings: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """Masked mean over tokens followed by L2 normalization (matches ST Pooling + Normalize)."""
+    mask = attention_mask[..., None].astype(np.float32)
+    summed = (token_embeddings * mask).sum(axis=1)
+    counts = np.clip(mask.sum(axis=1), 1e-9, None)
+    pooled = summed / counts
+    norms = np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+    return (pooled / norms).astype(np.float32)
+
+
+def provider_backend(settings: Settings) -> str:
+    backend = str(settings.embedding_backend or "").strip().lower()
+    return backend if backend in {"sentence-transformers", "onnx"} else "sentence-transformers"
+
+
+def provider_version(settings: Settings) -> str:
+    """Stable id of model + backend; vectors are only reused under the same version."""
+    backend = provider_backend(settings)
+    if backend == "onnx":
+        variant = Path(
+            settings.embedding_onnx_model_path or settings.embedding_onnx_model_file
+        ).stem
+        return f"{settings.embedding_model_name}+onnx:{variant}"
+    return settings.embedding_model_name
+
+
+def create_provider(settings: Settings) -> EmbeddingProvider:
+    if provider_backend(settings) == "onnx":
+        return OnnxProvider(
+            settings.embedding_model_name,
+            model_path=settings.embedding_onnx_model_path,
+            model_file=settings.embedding_onnx_model_file,
+        )
+    return SentenceTransformerProvider(settings.embedding_model_name)
@@ -1,18 +1,146 @@
-from sentence_transformers import SentenceTransformer
-from typing import Optional
+"""Sentence embedding service shared by the API and the workers.
 
-# Initialize embedding model (singleton)
-_embedding_model = None
+All encoding goes through `encode_many()`: texts are encoded in batches of
+`EMBEDDING_BATCH_SIZE` on a small thread pool so callers never block the event loop.
+
+The backend (`EMBEDDING_BACKEND`: sentence-transformers or ONNX Runtime, see
+`app.llm.embedding_providers`) is imported on first model load, never at module
+import. `EMBEDDING_MODE` controls the API process:
+- `off`: no query embeddings (keyword search only, torch is never imported)
+- `lazy`: load the model on the first vector/hybrid query
+- `warm`: load and warm the model in the background at startup
+"""
+
+import asyncio
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Literal, Optional, Sequence
+
+from app.llm.embedding_providers import EmbeddingProvider, create_provider, provider_version
+from app.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+EmbeddingModelState = Literal["disabled", "not_loaded", "loading", "ready", "error"]
+
+# Initialize embedding provider (singleton)
+_embedding_provider: Optional[EmbeddingProvider] = None
+_model_state: EmbeddingModelState = "not_loaded"
+_model_lock = Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def embedding_mode() -> str:
+    mode = str(get_settings().embedding_mode or "lazy").strip().lower()
+    return mode if mode in {"off", "lazy", "warm"} else "lazy"
+
+
+def embeddings_enabled() -> bool:
+    return embedding_mode() != "off"
+
+
+def model_state() -> EmbeddingModelState:
+    if not embeddings_enabled():
+        return "disabled"
+    return _model_state
+
+
+def embedding_model_ready() -> bool:
+    """Readiness of this replica as far as the embedding model is concerned.
+
+    Only `warm` replicas gate on the model (not ready while loading or after a failed load);
+    a `lazy` replica loads on demand and serves keyword results when that fails, so it stays
+    ready and `/health` reports it as degraded instead.
+    """
+    return not (embedding_mode() == "warm" and model_state() in {"not_loaded", "loading", "error"})
+
+
+def embedding_model_version() -> str:
+    """Model + backend id stored with vectors and used in cache keys (no model load)."""
+    return provider_version(get_settings())
+
+
+def skill_embedding_text(
+    *,
+    name: Optional[str],
+    description: Optional[str],
+    derived_description: Optional[str],
+    use_cases: Optional[Sequence[str]],
+) -> str:
+    """Embedding input for a skill (single builder for the parse worker and backfills)."""
+    return (
+        f"{name or ''} {description or ''} {derived_description or ''} {' '.join(use_cases or [])}"
+    )
+
+
+def embedding_input_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def get_embedding_provider() -> EmbeddingProvider:
+    global _embedding_provider, _model_state
+    if _embedding_provider is None:
+        with _model_lock:
+            if _embedding_provider is None:
+                _model_state = "loading"
+                try:
+                    _embedding_provider = create_provider(get_settings())
+                except Exception:
+                    _model_state = "error"
+                    raise
+                _model_state = "ready"
+    return _embedding_provider
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        workers = max(int(get_settings().embedding_max_workers or 1), 1)
+        _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embeddings")
+    return _executor
+
+
+def encode_many_sync(texts: Sequence[Optional[str]]) -> list[Optional[list[float]]]:
+    """Encode texts in batches; blank inputs map to None (same order as `texts`)."""
+    results: list[Optional[list[float]]] = [None] * len(texts)
+    indexed = [(i, text.strip()) for i, text in enumerate(texts) if text and text.strip()]
+    if not indexed:
+        return results
+
+    batch_size = max(int(get_settings().embedding_batch_size or 1), 1)
+    provider = get_embedding_provider()
+    for start in range(0, len(indexed), batch_size):
+        chunk = indexed[start : start + batch_size]
+        vectors = provider.encode([text for _, text in chunk], batch_size=batch_size)
+        for (i, _), vector in zip(chunk, vectors):
+            results[i] = vector.tolist()
+    return results
+
+
+async def encode_many(texts: Sequence[Optional[str]]) -> list[Optional[list[float]]]:
+    """Batched embeddings computed off the event loop."""
+    if not texts:
+        return []
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), encode_many_sync, list(texts))
+
+
+async def embed_text(text: str) -> Optional[list[float]]:
+    """Single-text convenience wrapper around `encode_many`."""
+    return (await encode_many([text]))[0]
 
-def get_embedding_model():
-    global _embedding_model
-    if _embedding_model is None:
-        # Use a small, efficient model for now
-        _embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-    return _embedding_model
 
 def generate_embedding(text: str) -> Optional[list[float]]:
-    if not text or not text.strip():
-        return None
-    model = get_embedding_model()
-    return model.encode(text).tolist()
+    """Synchronous single-text embedding (scripts / REPL use)."""
+    return encode_many_sync([text])[0]
+
+
+async def warm_up_embedding_model() -> None:
+    """Load the model and run one encode so the first real query pays no setup cost."""
+    try:
+        await encode_many(["warm up"])
+        logger.info("Embedding model warmed up (%s).", embedding_model_version())
+    except Exception as exc:
+        logger.warning("Embedding model warm-up failed: %s", exc)
@@ -1,6 +1,8 @@
 """FastAPI application entry point."""
 
+import asyncio
 from contextlib import asynccontextmanager
+from typing import Optional
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,18 +11,40 @@ from fastapi.responses import JSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
+from app.api.response_cache import listen_for_invalidations
+from app.cache.memory_l1 import response_l1_cache
+from app.cache.query_embeddings import query_embedding_cache
 from app.cache.redis_l2 import redis_l2_cache
-from app.settings import get_settings
+from app.db.session import log_pool_config
+from app.ingest.http import close_shared_http_client
 from app.limiter import limiter
+from app.llm.embeddings import (
+    embedding_mode,
+    embedding_model_ready,
+    model_state,
+    warm_up_embedding_model,
+)
+from app.settings import get_settings
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
+    log_pool_config(get_settings())
     await redis_l2_cache.init()
+    warmup_task: Optional[asyncio.Task] = None
+    if embedding_mode() == "warm":
+        # Serve immediately; /health/ready answers 200 once the model is loaded.
+        warmup_task = asyncio.create_task(warm_up_embedding_model())
+    invalidation_task = asyncio.create_task(listen_for_invalidations())
     try:
         yield
     finally:
+        if warmup_task is not None and not warmup_task.done():
+            warmup_task.cancel()
+        invalidation_task.cancel()
+        # Admin-triggered ingest runs in this process on the shared ingest client.
+        await close_shared_http_client()
         await redis_l2_cache.close()
 
 
@@ -52,11 +76,31 @@ def create_app() -> FastAPI:
     # Compress larger JSON payloads (lists/details) for faster network transfer.
     app.add_middleware(GZipMiddleware, minimum_size=1024)
 
-    # Health check
+    # Health check (liveness: always 200 while the process serves requests)
     @app.get("/health", tags=["Health"])
     async def health_check():
-        return {"status": "ok"}
-    
+        return {
+            # Failed model load: keyword search still works, vector/hybrid fall back to it.
+            "status": "degraded" if model_state() == "error" else "ok",
+            "ready": embedding_model_ready(),
+            "embedding_model": {"mode": embedding_mode(), "state": model_state()},
+            "query_embedding_cache": query_embedding_cache.stats(),
+            "response_l1_cache": response_l1_cache.stats(),
+        }
+
+    # Readiness: 503 while a warm replica loads the embedding model or after its load failed,
+    # so load balancers keep traffic away until vector search can be served.
+    @app.get("/health/ready", tags=["Health"])
+    async def readiness_check():
+        ready = embedding_model_ready()
+        return JSONResponse(
+            status_code=200 if ready else 503,
+            content={
+                "ready": ready,
+                "embedding_model": {"mode": embedding_mode(), "state": model_state()},
+            },
+        )
+
     # API Router
     from app.api.router import api_router
     app.include_router(api_router, prefix="/api")
@@ -12,10 +12,12 @@ from app.models.skill_event import SkillEvent
 from app.models.skill_popularity import SkillPopularity
 from app.models.skill_rank_snapshot import SkillRankSnapshot
 from app.models.github_repo_cache import GithubRepoCache
+from app.models.github_tree_index import GithubTreeIndex
 from app.models.system_setting import SystemSetting
 from app.models.api_key import ApiKey
 from app.models.api_key_usage import ApiKeyRateWindow, ApiKeyDailyUsage, ApiKeyMonthlyUsage
 from app.models.skill_trust_audit import SkillTrustAudit
+from app.models.public_skill_search import PublicSkillSearch
 
 __all__ = [
     "SkillSource",
@@ -30,10 +32,12 @@ __all__ = [
     "SkillPopularity",
     "SkillRankSnapshot",
     "GithubRepoCache",
+    "GithubTreeIndex",
     "SystemSetting",
     "ApiKey",
     "ApiKeyRateWindow",
     "ApiKeyDailyUsage",
     "ApiKeyMonthlyUsage",
     "SkillTrustAudit",
+    "PublicSkillSearch",
 ]
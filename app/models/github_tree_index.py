@@ -0,0 +1,30 @@
+"""GitHub tree index model."""
+
+from sqlalchemy import String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models._mixins import TimestampMixin
+
+
+class GithubTreeIndex(Base, TimestampMixin):
+    """Last ingested tree of a scanned repo: root tree SHA and SKILL.md blob SHAs.
+
+    Written by the ingest worker after the crawled files were upserted into `raw_skills`;
+    the crawler skips repos whose tree SHA and scan options are unchanged and only
+    downloads files whose blob SHA changed (`app/ingest/tree_index.py`).
+    """
+
+    __tablename__ = "github_tree_index"
+
+    repo_full_name: Mapped[str] = mapped_column(String, primary_key=True)  # lower-cased owner/repo
+    default_branch: Mapped[str] = mapped_column(String, nullable=False)
+    tree_sha: Mapped[str] = mapped_column(String, nullable=False)
+    # skill path -> blob SHA
+    blob_shas: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    # `scan_options_hash` of the source options the files were selected with
+    options_hash: Mapped[str] = mapped_column(String, nullable=False, default="", server_default="")
+
+    def __repr__(self) -> str:
+        return f"<GithubTreeIndex {self.repo_full_name}@{self.tree_sha}>"
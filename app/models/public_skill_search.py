@@ -0,0 +1,150 @@
+"""Public skill search projection model."""
+
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+if TYPE_CHECKING:
+    from app.models.category import Category
+
+
+class PublicSkillSearch(Base):
+    """Denormalized, publicly visible skill rows for list/search endpoints.
+
+    One row per public skill, rebuilt from `skills` + category + tags + sources + popularity
+    by `app/repos/public_skill_search_repo.py` whenever those change (category/tag renames
+    are re-projected by database triggers). List queries read only this table: no
+    visibility regexes and no joins.
+    """
+
+    __tablename__ = "public_skill_search"
+    __table_args__ = (
+        Index(
+            "ix_public_skill_search_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_l2_ops"},
+        ),
+        Index("ix_public_skill_search_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_public_skill_search_tag_slugs", "tag_slugs", postgresql_using="gin"),
+        Index(
+            "ix_public_skill_search_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_public_skill_search_slug_trgm",
+            "slug",
+            postgresql_using="gin",
+            postgresql_ops={"slug": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_public_skill_search_tag_text_trgm",
+            "tag_text",
+            postgresql_using="gin",
+            postgresql_ops={"tag_text": "gin_trgm_ops"},
+        ),
+        Index("ix_public_skill_search_category_slug", "category_slug"),
+        # Full popularity keyset order (see `public_skill_sort_keys`), scanned backwards.
+        Index(
+            "ix_public_skill_search_popularity_order",
+            "popularity_score",
+            "trust_rank",
+            text("coalesce(trust_score, 0.0)"),
+            "updated_at",
+            "skill_id",
+        ),
+        Index("ix_public_skill_search_created_at_id", "created_at", "skill_id"),
+        Index("ix_public_skill_search_source_names", "source_names", postgresql_using="gin"),
+        # Packs: group by repo and list a repo's skills by recency.
+        Index("ix_public_skill_search_repo_updated_at", "repo_full_name", "updated_at", "skill_id"),
+    )
+
+    skill_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # List card fields (copied from skills)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    slug: Mapped[str] = mapped_column(String, nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    is_official: Mapped[bool] = mapped_column(Boolean, default=False)
+    github_stars: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    github_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    quality_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    trust_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    trust_level: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    trust_flags: Mapped[Optional[list[str]]] = mapped_column(JSONB, nullable=True)
+    trust_last_verified_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
+    # Precomputed filter/sort keys
+    category_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    category_slug: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    tag_slugs: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default=list)
+    # Tag names and slugs joined by newlines (substring tag matches without a join).
+    tag_text: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    # owner/repo parsed from the GitHub SKILL.md url (packs)
+    repo_full_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    # `skill_sources.name` of every source that links the skill (plugins view)
+    source_names: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default=list)
+    # ok=2, warning=1, else 0
+    trust_rank: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
+    views: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    favorites: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    popularity_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    # Search documents (copied from skills)
+    search_vector: Mapped[Optional[str]] = mapped_column(TSVECTOR, nullable=True, deferred=True)
+    embedding: Mapped[Optional[list[float]]] = mapped_column(
+        Vector(384), nullable=True, deferred=True
+    )
+
+    category: Mapped[Optional["Category"]] = relationship(
+        "Category",
+        primaryjoin="foreign(PublicSkillSearch.category_id) == Category.id",
+        viewonly=True,
+    )
+
+    @property
+    def id(self) -> uuid.UUID:
+        """Expose the skill id for API schemas."""
+        return self.skill_id
+
+    @property
+    def stars(self) -> int:
+        """Expose favorites as stars for API schemas."""
+        return self.favorites or 0
+
+    @property
+    def score(self) -> float:
+        """Expose the popularity score for API schemas."""
+        return self.popularity_score or 0.0
+
+    def __repr__(self) -> str:
+        return f"<PublicSkillSearch {self.slug}>"
@@ -4,10 +4,21 @@
 import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, Any
-from sqlalchemy import String, ForeignKey, Text, Boolean, Integer, DateTime, Float
+from sqlalchemy import (
+    String,
+    ForeignKey,
+    Text,
+    Boolean,
+    Integer,
+    DateTime,
+    Float,
+    Index,
+    Computed,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from pgvector.sqlalchemy import Vector
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 
 from app.db.base import Base
 from app.models._mixins import UUIDPrimaryKeyMixin, TimestampMixin
@@ -19,11 +30,51 @@ if TYPE_CHECKING:
     from app.models.skill_source_link import SkillSourceLink
     from app.models.tag import Tag
 
+# Weighted full-text document: A=name/slug, B=summary, C=description, D=content.
+# 'simple' keeps tokens language-agnostic (catalog mixes English/Korean text).
+SKILL_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, "
+    "coalesce(name, '') || ' ' || coalesce(slug, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'C') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(content, '')), 'D')"
+)
+
 
 class Skill(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     """Canonical Skill model."""
 
     __tablename__ = "skills"
+    __table_args__ = (
+        # ANN index for `ORDER BY embedding <-> :q LIMIT k` candidate retrieval.
+        Index(
+            "ix_skills_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_l2_ops"},
+        ),
+        Index("ix_skills_search_vector", "search_vector", postgresql_using="gin"),
+        # Trigram indexes keep substring/short-prefix ILIKE on name/slug index-backed.
+        Index(
+            "ix_skills_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_skills_slug_trgm",
+            "slug",
+            postgresql_using="gin",
+            postgresql_ops={"slug": "gin_trgm_ops"},
+        ),
+        # Keyset seeks for newest/oldest list cursors: (created_at, id) > (:ts, :id).
+        Index("ix_skills_created_at_id", "created_at", "id"),
+        # Public-only scans (packs, taxonomy counts, rankings) never touch hidden rows.
+        Index(
+            "ix_skills_public_created_at_id", "created_at", "id", postgresql_where=text("is_public")
+        ),
+    )
 
     # Core Metadata
     slug: Mapped[str] = mapped_column(String, nullable=False, unique=True, index=True)  # owner/name
@@ -57,6 +108,11 @@ class Skill(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     # Status
     is_official: Mapped[bool] = mapped_column(Boolean, default=False)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Public visibility policy (official + verified + canonical SKILL.md URL), computed on write
+    # by `app.repos.public_filters.apply_public_visibility`.
+    is_public: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=text("false"), nullable=False, index=True
+    )
 
     # Benchmark Features (GitHub & Metadata)
     github_stars: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -73,6 +129,18 @@ class Skill(Base, UUIDPrimaryKeyMixin, TimestampMixin):
 
     # Vector Search
     embedding: Mapped[Optional[list[float]]] = mapped_column(Vector(384), nullable=True)  # 384 for all-MiniLM-L6-v2
+    # sha256 of the text that produced `embedding` + model/backend version;
+    # unchanged pairs skip inference.
+    embedding_input_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    embedding_model: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
+    # Keyword Search (generated by Postgres, never written by the app)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(SKILL_SEARCH_VECTOR_SQL, persisted=True),
+        nullable=True,
+        deferred=True,
+    )
     
     # Relationships
     category: Mapped["Category"] = relationship("Category", back_populates="skills")
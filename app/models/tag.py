@@ -1,7 +1,7 @@
 """Tag model."""
 
 from typing import TYPE_CHECKING
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -15,6 +15,20 @@ class Tag(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     """Skill tag (Normalized in lower-kebab-case)."""
 
     __tablename__ = "tags"
+    __table_args__ = (
+        Index(
+            "ix_tags_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_tags_slug_trgm",
+            "slug",
+            postgresql_using="gin",
+            postgresql_ops={"slug": "gin_trgm_ops"},
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String, nullable=False, unique=True, index=True)
     slug: Mapped[str] = mapped_column(String, nullable=False, unique=True, index=True)
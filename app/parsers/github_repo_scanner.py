@@ -4,7 +4,11 @@ import fnmatch
 import re
 from typing import Any, Optional
 
-from app.ingest.http import get_http_client
+from httpx import AsyncClient
+
+from app.ingest.github_cache import GithubResponseCache, compact_repo, compact_tree
+from app.ingest.github_scheduler import raise_for_rate_limit
+from app.ingest.http import get_shared_http_client
 from app.settings import get_settings
 
 settings = get_settings()
@@ -132,88 +136,108 @@ def _compute_repo_focus(
     }
 
 
+async def _get_json(
+    client: AsyncClient,
+    url: str,
+    headers: dict[str, str],
+    response_cache: Optional[GithubResponseCache],
+    compact,
+) -> Optional[dict]:
+    if response_cache is not None:
+        return await response_cache.get_json(client, url, headers=headers, compact=compact)
+    resp = await client.get(url, headers=headers)
+    if resp.status_code != 200:
+        # A rate-limited scan must fail loudly instead of looking like an empty repo.
+        raise_for_rate_limit(resp)
+        return None
+    return resp.json()
+
+
 async def list_repo_skills_candidates(
     repo_full_name: str,
     *,
     allowed_path_globs: Optional[list[str]] = None,
     min_repo_type: str = "skills_only",
+    client: Optional[AsyncClient] = None,
+    response_cache: Optional[GithubResponseCache] = None,
 ) -> list[dict[str, Any]]:
     """
     Scan a GitHub repo for SKILL.md files.
-    Uses GitHub API Tree/Search.
+    Uses GitHub API Tree/Search on `client` (the shared ingest client when omitted).
+    With `response_cache`, repo and tree requests are conditional and 304s reuse cached JSON.
     """
-    client = await get_http_client()
-    try:
-        headers = {"Accept": "application/vnd.github.v3+json"}
-        if settings.github_token:
-            headers["Authorization"] = f"Bearer {settings.github_token}"
-
-        # 1. Get default branch SHA
-        repo_url = f"{settings.github_api_base}/repos/{repo_full_name}"
-        resp = await client.get(repo_url, headers=headers)
-        if resp.status_code != 200:
-            return []
-
-        repo_data = resp.json()
-        default_branch = repo_data.get("default_branch", "main")
-        stargazers_count = repo_data.get("stargazers_count", 0)
-        pushed_at = repo_data.get("pushed_at")
-
-        # 2. Get Tree (Recursive)
-        tree_url = f"{repo_url}/git/trees/{default_branch}?recursive=1"
-        resp = await client.get(tree_url, headers=headers)
-        if resp.status_code != 200:
-            return []
-
-        tree_data = resp.json()
-        files = tree_data.get("tree", [])
-
-        blob_paths: list[str] = [str(f.get("path", "")) for f in files if f.get("type") == "blob" and f.get("path")]
-        focus = _compute_repo_focus(
-            repo_full_name=repo_full_name,
-            repo_description=(repo_data.get("description") or ""),
-            blob_paths=blob_paths,
+    if client is None:
+        client = await get_shared_http_client()
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    if settings.github_token:
+        headers["Authorization"] = f"Bearer {settings.github_token}"
+
+    # 1. Get default branch SHA
+    repo_url = f"{settings.github_api_base}/repos/{repo_full_name}"
+    repo_data = await _get_json(client, repo_url, headers, response_cache, compact_repo)
+    if repo_data is None:
+        return []
+
+    default_branch = repo_data.get("default_branch", "main")
+    stargazers_count = repo_data.get("stargazers_count", 0)
+    pushed_at = repo_data.get("pushed_at")
+
+    # 2. Get Tree (Recursive)
+    tree_url = f"{repo_url}/git/trees/{default_branch}?recursive=1"
+    tree_data = await _get_json(client, tree_url, headers, response_cache, compact_tree)
+    if tree_data is None:
+        return []
+
+    files = tree_data.get("tree", [])
+
+    blob_paths: list[str] = [
+        str(f.get("path", "")) for f in files if f.get("type") == "blob" and f.get("path")
+    ]
+    focus = _compute_repo_focus(
+        repo_full_name=repo_full_name,
+        repo_description=(repo_data.get("description") or ""),
+        blob_paths=blob_paths,
+    )
+
+    type_rank = {"not_skills": 0, "mixed": 1, "skills_focused": 2, "skills_only": 3}
+    current_rank = type_rank.get(focus["repo_type"], 0)
+    required_rank = type_rank.get(min_repo_type, 3)
+    if current_rank < required_rank:
+        return []
+
+    candidates = []
+    for f in files:
+        if f.get("type") != "blob":
+            continue
+        path = str(f.get("path", ""))
+        if not path:
+            continue
+        if not path.lower().endswith("/skill.md") and path.lower() != "skill.md":
+            continue
+        if not _matches_skill_layout(path):
+            continue
+        if not _matches_allowed_glob(path, allowed_path_globs):
+            continue
+
+        # Construct raw URL:
+        # https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}
+        raw_url = f"https://raw.githubusercontent.com/{repo_full_name}/{default_branch}/{path}"
+        candidates.append(
+            {
+                "path": path,
+                "url": raw_url,
+                "sha": f["sha"],
+                "repo_type": focus["repo_type"],
+                "repo_intent_score": focus["repo_intent_score"],
+                "repo_total_files": focus["total_files"],
+                "repo_skill_files": focus["skill_file_count"],
+                "repo_canonical_skill_files": focus["canonical_skill_file_count"],
+                "github_stars": stargazers_count,
+                "github_pushed_at": pushed_at,
+                "repo_default_branch": default_branch,
+                "repo_tree_sha": tree_data.get("sha"),
+            }
         )
 
-        type_rank = {"not_skills": 0, "mixed": 1, "skills_focused": 2, "skills_only": 3}
-        current_rank = type_rank.get(focus["repo_type"], 0)
-        required_rank = type_rank.get(min_repo_type, 3)
-        if current_rank < required_rank:
-            return []
-
-        candidates = []
-        for f in files:
-            if f.get("type") != "blob":
-                continue
-            path = str(f.get("path", ""))
-            if not path:
-                continue
-            if not path.lower().endswith("/skill.md") and path.lower() != "skill.md":
-                continue
-            if not _matches_skill_layout(path):
-                continue
-            if not _matches_allowed_glob(path, allowed_path_globs):
-                continue
-
-            # Construct raw URL:
-            # https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}
-            raw_url = f"https://raw.githubusercontent.com/{repo_full_name}/{default_branch}/{path}"
-            candidates.append(
-                {
-                    "path": path,
-                    "url": raw_url,
-                    "sha": f["sha"],
-                    "repo_type": focus["repo_type"],
-                    "repo_intent_score": focus["repo_intent_score"],
-                    "repo_total_files": focus["total_files"],
-                    "repo_skill_files": focus["skill_file_count"],
-                    "repo_canonical_skill_files": focus["canonical_skill_file_count"],
-                    "github_stars": stargazers_count,
-                    "github_pushed_at": pushed_at,
-                }
-            )
-
-        candidates.sort(key=lambda item: item["path"])
-        return candidates
-    finally:
-        await client.aclose()
+    candidates.sort(key=lambda item: item["path"])
+    return candidates
@@ -9,6 +9,8 @@ from app.models.skill import Skill
 from app.models.skill_popularity import SkillPopularity
 from app.models.skill_tag import SkillTag
 from app.models.tag import Tag
+from app.repos.public_filters import apply_public_visibility
+from app.repos.public_skill_search_repo import refresh_public_skill_search
 from app.schemas.admin_skill import AdminSkillCreate, AdminSkillUpdate
 
 
@@ -83,6 +85,7 @@ class AdminSkillRepo:
             is_official=payload.is_official,
             is_verified=payload.is_verified,
         )
+        apply_public_visibility(skill)
         self.db.add(skill)
         await self.db.flush()
 
@@ -91,6 +94,7 @@ class AdminSkillRepo:
         pop = SkillPopularity(skill_id=skill.id)
         self.db.add(pop)
         await self.db.flush()
+        await refresh_public_skill_search(self.db, [skill.id])
 
         stmt = (
             select(Skill)
@@ -116,6 +120,7 @@ class AdminSkillRepo:
         for key, value in update_data.items():
             if hasattr(Skill, key):
                 setattr(skill, key, value)
+        apply_public_visibility(skill)
 
         if has_category_slug:
             skill.category_id = await self._resolve_category_id(
@@ -128,6 +133,7 @@ class AdminSkillRepo:
 
         self.db.add(skill)
         await self.db.flush()
+        await refresh_public_skill_search(self.db, [skill.id])
 
         stmt = (
             select(Skill)
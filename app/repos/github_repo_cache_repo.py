@@ -0,0 +1,39 @@
+"""Storage of conditional GitHub API responses (`github_repo_cache`).
+
+One row per request URL (`repo_url`), holding the validators (`etag`, `last_modified`)
+and the compacted JSON body served when GitHub answers 304 Not Modified.
+"""
+
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.github_repo_cache import GithubRepoCache
+
+
+async def get_cached_response(db: AsyncSession, url: str) -> Optional[GithubRepoCache]:
+    result = await db.execute(select(GithubRepoCache).where(GithubRepoCache.repo_url == url))
+    return result.scalar_one_or_none()
+
+
+async def store_cached_response(
+    db: AsyncSession,
+    url: str,
+    *,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    data: dict,
+) -> None:
+    """Insert or replace the cached response for `url` (caller commits)."""
+    values = {"etag": etag, "last_modified": last_modified, "data": data, "fetched_at": func.now()}
+    stmt = (
+        pg_insert(GithubRepoCache)
+        .values(repo_url=url, **values)
+        .on_conflict_do_update(
+            index_elements=[GithubRepoCache.repo_url],
+            set_={**values, "updated_at": func.now()},
+        )
+    )
+    await db.execute(stmt)
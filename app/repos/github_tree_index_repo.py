@@ -0,0 +1,50 @@
+"""Storage of the repo tree / SKILL.md blob SHA index (`github_tree_index`)."""
+
+from typing import Iterable, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.github_tree_index import GithubTreeIndex
+from app.models.raw_skill import RawSkill
+
+
+async def get_tree_index(db: AsyncSession, repo_full_name: str):
+    result = await db.execute(
+        select(GithubTreeIndex).where(GithubTreeIndex.repo_full_name == repo_full_name.lower())
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_existing_raw_external_ids(db: AsyncSession, external_ids: Sequence[str]) -> set[str]:
+    """Subset of `external_ids` (SKILL.md raw URLs) that still have a `raw_skills` row."""
+    if not external_ids:
+        return set()
+    result = await db.execute(
+        select(RawSkill.external_id).where(RawSkill.external_id.in_(list(external_ids))).distinct()
+    )
+    return set(result.scalars().all())
+
+
+async def save_tree_index(db: AsyncSession, entries: Iterable[dict]) -> int:
+    """Upsert index rows (dicts as built by `TreeIndex.record`); caller commits."""
+    count = 0
+    for entry in entries:
+        values = {
+            "default_branch": entry["default_branch"],
+            "tree_sha": entry["tree_sha"],
+            "blob_shas": entry["blob_shas"],
+            "options_hash": entry.get("options_hash", ""),
+        }
+        stmt = (
+            pg_insert(GithubTreeIndex)
+            .values(repo_full_name=entry["repo_full_name"].lower(), **values)
+            .on_conflict_do_update(
+                index_elements=[GithubTreeIndex.repo_full_name],
+                set_={**values, "updated_at": func.now()},
+            )
+        )
+        await db.execute(stmt)
+        count += 1
+    return count
@@ -0,0 +1,263 @@
+"""Shared pagination helpers for list queries (offset + keyset cursors)."""
+
+import base64
+import binascii
+import hashlib
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import and_, func, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.settings import get_settings
+
+TOTAL_COUNT_LABEL = "_total_count"
+SORT_KEY_LABEL_PREFIX = "_sort_key_"
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One ORDER BY term; the full list must end with a unique column (e.g. id)."""
+
+    expr: ColumnElement[Any]
+    descending: bool = False
+
+    def ordering(self) -> ColumnElement[Any]:
+        return self.expr.desc() if self.descending else self.expr.asc()
+
+
+def order_by_keys(keys: Sequence[SortKey]) -> list[ColumnElement[Any]]:
+    """ORDER BY clauses matching `keys` (use together with `fetch_page(sort_keys=...)`)."""
+    return [key.ordering() for key in keys]
+
+
+@dataclass
+class PageSlice:
+    """One fetched page plus the total row count of the unpaginated query."""
+
+    rows: list[Any] = field(default_factory=list)
+    # None in cursor mode: keyset pages never count the full result set.
+    total: Optional[int] = 0
+    # True when `total` stopped at the configured count cap (deep result sets).
+    total_estimated: bool = False
+    # Opaque keyset cursor for the page after this one (None on the last page).
+    next_cursor: Optional[str] = None
+
+    def scalars(self) -> list[Any]:
+        """First column of every row (the ORM entity for `select(Model)` queries)."""
+        return [row[0] for row in self.rows]
+
+
+def page_count(total: Optional[int], size: int) -> Optional[int]:
+    """Number of pages needed for `total` rows (None when the total is unknown)."""
+    if total is None:
+        return None
+    if total <= 0 or size <= 0:
+        return 0
+    return (total + size - 1) // size
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(status_code=422, detail="Invalid cursor.")
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(str(value["dt"]))
+        if "uuid" in value:
+            return uuid.UUID(str(value["uuid"]))
+        raise ValueError("unknown cursor value")
+    return value
+
+
+def cursor_scope(name: str, *filters: Any) -> str:
+    """Scope string binding cursors to an ordering *and* the filters that shaped the result.
+
+    A cursor replayed with other filters (category, tags, query, ...) is rejected instead
+    of seeking into a different result set.
+    """
+    if not any(f not in (None, "", [], ()) for f in filters):
+        return name
+    signature = json.dumps([_encode_value(f) for f in filters], separators=(",", ":"), default=str)
+    return f"{name}:{hashlib.sha1(signature.encode('utf-8')).hexdigest()[:16]}"
+
+
+def encode_cursor(scope: str, values: Sequence[Any], *, depth: Optional[int] = None) -> str:
+    """Encode the last row's sort tuple as an opaque URL-safe cursor.
+
+    `depth` is the number of rows served up to and including that row; callers whose
+    candidate sets depend on how deep the client is (e.g. ANN top-K) read it back with
+    `cursor_depth`.
+    """
+    data: dict[str, Any] = {"s": scope, "v": [_encode_value(v) for v in values]}
+    if depth is not None:
+        data["d"] = int(depth)
+    raw = json.dumps(data, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _load_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError, binascii.Error, UnicodeError) as exc:
+        raise _invalid_cursor() from exc
+    if not isinstance(data, dict):
+        raise _invalid_cursor()
+    return data
+
+
+def decode_cursor(cursor: str, *, scope: str, arity: int) -> list[Any]:
+    """Decode a cursor produced by `encode_cursor` for the same ordering scope."""
+    data = _load_cursor(cursor)
+    try:
+        values = [_decode_value(v) for v in data["v"]]
+    except (ValueError, KeyError, TypeError) as exc:
+        raise _invalid_cursor() from exc
+    if data.get("s") != scope or len(values) != arity or any(v is None for v in values):
+        raise _invalid_cursor()
+    return values
+
+
+def cursor_depth(cursor: Optional[str]) -> int:
+    """Rows already served before the page a cursor points at (0 without a cursor)."""
+    if not cursor:
+        return 0
+    depth = _load_cursor(cursor).get("d", 0)
+    if not isinstance(depth, int) or isinstance(depth, bool) or depth < 0:
+        raise _invalid_cursor()
+    return depth
+
+
+def keyset_after(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement[bool]:
+    """Rows strictly after `values` in the ORDER BY given by `keys`.
+
+    Single-direction orders use a row-value comparison, which Postgres answers with one
+    seek on a matching (or backward-scanned) multi-column index; mixed directions fall
+    back to an OR chain.
+    """
+    if len({key.descending for key in keys}) == 1:
+        row = tuple_(*[key.expr for key in keys])
+        # Bind each value with its column's type (e.g. timestamptz), as `expr < value` would.
+        bound = tuple_(*[literal(value, type_=key.expr.type) for key, value in zip(keys, values)])
+        return row < bound if keys[0].descending else row > bound
+
+    clauses = []
+    for index, key in enumerate(keys):
+        ties = [keys[j].expr == values[j] for j in range(index)]
+        step = key.expr < values[index] if key.descending else key.expr > values[index]
+        clauses.append(and_(*ties, step))
+    # Leading bound lets the planner seek on the first key's index before the OR chain.
+    first = keys[0]
+    lead = first.expr <= values[0] if first.descending else first.expr >= values[0]
+    return and_(lead, or_(*clauses))
+
+
+def _cursor_for_row(row: Any, *, scope: str, arity: int, depth: int) -> str:
+    mapping = row._mapping
+    return encode_cursor(
+        scope, [mapping[f"{SORT_KEY_LABEL_PREFIX}{i}"] for i in range(arity)], depth=depth
+    )
+
+
+async def _count_rows(db: AsyncSession, stmt: Select, *, cap: int) -> int:
+    base = stmt.order_by(None)
+    if cap > 0:
+        # LIMIT inside the subquery lets Postgres stop scanning once `cap` rows are found.
+        base = base.limit(cap)
+    count_stmt = select(func.count()).select_from(base.subquery())
+    return int((await db.execute(count_stmt)).scalar_one() or 0)
+
+
+async def fetch_page(
+    db: AsyncSession,
+    stmt: Select,
+    *,
+    page: int,
+    size: int,
+    count_cap: Optional[int] = None,
+    sort_keys: Optional[Sequence[SortKey]] = None,
+    cursor: Optional[str] = None,
+    cursor_scope: str = "",
+) -> PageSlice:
+    """Fetch a page and its total without running the filtered query twice.
+
+    - Exact mode (cap <= 0): `count(*) OVER ()` is added to the page query, so the
+      total arrives in the same round trip.
+    - Estimated mode (cap > 0): the page query runs as-is and the total comes from a
+      count that stops at `cap` rows; `total_estimated` is set when the cap is hit.
+    - Cursor mode (`cursor` given): seeks past the cursor's sort tuple instead of
+      using OFFSET and skips counting (`total` is None).
+
+    With `sort_keys` (which must match the statement's ORDER BY), `next_cursor` is
+    filled whenever another page exists. Result rows keep their original columns
+    first; helper columns (sort keys, window total) trail them.
+    """
+    keys = list(sort_keys or [])
+    if keys:
+        stmt = stmt.add_columns(
+            *[key.expr.label(f"{SORT_KEY_LABEL_PREFIX}{i}") for i, key in enumerate(keys)]
+        )
+
+    if cursor:
+        if not keys:
+            raise _invalid_cursor()
+        values = decode_cursor(cursor, scope=cursor_scope, arity=len(keys))
+        depth = cursor_depth(cursor)
+        seek = stmt.where(keyset_after(keys, values)).limit(size + 1)
+        rows = list((await db.execute(seek)).all())
+        has_more = len(rows) > size
+        rows = rows[:size]
+        next_cursor = (
+            _cursor_for_row(rows[-1], scope=cursor_scope, arity=len(keys), depth=depth + len(rows))
+            if has_more
+            else None
+        )
+        return PageSlice(rows=rows, total=None, next_cursor=next_cursor)
+
+    cap = get_settings().list_count_cap if count_cap is None else count_cap
+    cap = max(int(cap or 0), 0)
+    offset = (page - 1) * size
+
+    if cap > 0:
+        rows = list((await db.execute(stmt.offset(offset).limit(size))).all())
+        total = await _count_rows(db, stmt, cap=cap)
+        page_slice = PageSlice(
+            rows=rows,
+            total=max(total, offset + len(rows)),
+            total_estimated=total >= cap,
+        )
+    else:
+        windowed = stmt.add_columns(func.count().over().label(TOTAL_COUNT_LABEL))
+        rows = list((await db.execute(windowed.offset(offset).limit(size))).all())
+        if rows:
+            page_slice = PageSlice(rows=rows, total=int(rows[0][-1] or 0))
+        elif page <= 1:
+            page_slice = PageSlice(rows=rows, total=0)
+        else:
+            # Past the last page the window has no row to ride on; fall back to a plain count.
+            page_slice = PageSlice(rows=rows, total=await _count_rows(db, stmt, cap=0))
+
+    if keys and page_slice.rows and offset + len(page_slice.rows) < (page_slice.total or 0):
+        page_slice.next_cursor = _cursor_for_row(
+            page_slice.rows[-1],
+            scope=cursor_scope,
+            arity=len(keys),
+            depth=offset + len(page_slice.rows),
+        )
+    return page_slice
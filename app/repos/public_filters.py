@@ -1,9 +1,15 @@
-"""Shared SQL filters for publicly visible skills."""
+"""Shared SQL filters for publicly visible skills.
+
+Visibility is decided once per write: `apply_public_visibility` stores the policy result in
+`skills.is_public` (parse worker, admin CRUD, seed), and public queries filter on that
+indexed column. `public_skill_policy_conditions` is the same policy in SQL, used by the
+backfill migration and the consistency checker (`scripts/check_public_visibility.py`).
+"""
 
 import re
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy import or_
+from sqlalchemy import and_, not_, or_
 from sqlalchemy.sql.elements import ColumnElement
 
 from app.models.skill import Skill
@@ -12,14 +18,19 @@ PUBLIC_SKILL_URL_DB_REGEXES = (
     r"^https://github\.com/[^/]+/[^/]+/blob/[^/]+/skills/[^/]+/SKILL\.md$",
     r"^https://github\.com/[^/]+/[^/]+/blob/[^/]+/\.claude/skills/[^/]+/SKILL\.md$",
 )
-PUBLIC_SKILL_URL_REGEXES = (
-    re.compile(r"/blob/[^/]+/skills/[^/]+/skill\.md$", re.IGNORECASE),
-    re.compile(r"/blob/[^/]+/\.claude/skills/[^/]+/skill\.md$", re.IGNORECASE),
+# Same patterns as the `~*` DB regexes (case-insensitive, whole URL).
+PUBLIC_SKILL_URL_REGEXES = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in PUBLIC_SKILL_URL_DB_REGEXES
 )
 
 
 def public_skill_conditions() -> list[ColumnElement[bool]]:
-    """Return the shared visibility policy for public APIs."""
+    """Return the shared visibility policy for public APIs (precomputed `skills.is_public`)."""
+    return [Skill.is_public.is_(True)]
+
+
+def public_skill_policy_conditions() -> list[ColumnElement[bool]]:
+    """Evaluate the visibility policy from source columns (regexes; maintenance use only)."""
     return [
         Skill.is_official.is_(True),
         Skill.is_verified.is_(True),
@@ -28,9 +39,34 @@ def public_skill_conditions() -> list[ColumnElement[bool]]:
     ]
 
 
+def public_visibility_mismatch_condition() -> ColumnElement[bool]:
+    """Rows whose stored `is_public` disagrees with the policy."""
+    policy = and_(*public_skill_policy_conditions())
+    return or_(
+        and_(Skill.is_public.is_(True), not_(policy)),
+        and_(Skill.is_public.is_not(True), policy),
+    )
+
+
 def is_public_skill_url(url: Optional[str]) -> bool:
     """Runtime equivalent of public URL policy."""
     if not url:
         return False
-    lowered = url.lower()
-    return any(regex.search(lowered) for regex in PUBLIC_SKILL_URL_REGEXES)
+    return any(regex.fullmatch(url) for regex in PUBLIC_SKILL_URL_REGEXES)
+
+
+def compute_is_public(
+    *, is_official: Optional[bool], is_verified: Optional[bool], url: Optional[str]
+) -> bool:
+    """Public visibility policy for one skill row."""
+    return bool(is_official) and bool(is_verified) and is_public_skill_url(url)
+
+
+def apply_public_visibility(skill: Any) -> bool:
+    """Store the policy result on `skill.is_public`; call after url/official/verified changes."""
+    skill.is_public = compute_is_public(
+        is_official=skill.is_official,
+        is_verified=skill.is_verified,
+        url=skill.url,
+    )
+    return skill.is_public
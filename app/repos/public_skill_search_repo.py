@@ -0,0 +1,145 @@
+"""Maintenance of the `public_skill_search` projection.
+
+Writers call these inside their own transaction, before commit, so the projection and
+the source rows change atomically:
+
+- `refresh_public_skill_search(db, ids)`: after anything a list card, filter or search
+  document depends on changed (skill fields, category, tags, embedding, trust, delete).
+  Rows that are no longer public are removed.
+- `refresh_public_skill_popularity(db, ids)`: after popularity counters changed.
+
+Category and tag renames are re-projected by triggers on `categories` / `tags`
+(migration `d5f8b3e1a7c2`), so they stay correct whichever tool edits the taxonomy.
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+PROJECTION_COLUMNS = (
+    "skill_id, name, slug, description, summary, is_official, github_stars, github_updated_at, "
+    "quality_score, trust_score, trust_level, trust_flags, trust_last_verified_at, "
+    "created_at, updated_at, "
+    "url, category_id, category_slug, tag_slugs, tag_text, repo_full_name, source_names, "
+    "trust_rank, views, favorites, popularity_score, search_vector, embedding"
+)
+
+# owner/repo of a public GitHub SKILL.md url (`https://github.com/{owner}/{repo}/blob/...`).
+REPO_FULL_NAME_SQL = (
+    "split_part(split_part(s.url, 'https://github.com/', 2), '/', 1) || '/' || "
+    "split_part(split_part(s.url, 'https://github.com/', 2), '/', 2)"
+)
+
+# `skills.is_public` is the precomputed visibility policy (see app/repos/public_filters.py).
+PUBLIC_SKILL_SQL = "s.is_public IS TRUE"
+
+PROJECTION_SELECT_SQL = f"""
+SELECT
+    s.id, s.name, s.slug, s.description, s.summary, s.is_official,
+    s.github_stars, s.github_updated_at,
+    s.quality_score, s.trust_score, s.trust_level, s.trust_flags, s.trust_last_verified_at,
+    s.created_at, s.updated_at,
+    s.url, s.category_id, c.slug,
+    coalesce(t.slugs, ARRAY[]::varchar[]), coalesce(t.text, ''),
+    {REPO_FULL_NAME_SQL}, coalesce(src.names, ARRAY[]::varchar[]),
+    CASE s.trust_level WHEN 'ok' THEN 2 WHEN 'warning' THEN 1 ELSE 0 END,
+    coalesce(p.views, 0), coalesce(p.favorites, 0), coalesce(p.score, 0.0),
+    s.search_vector, s.embedding
+FROM skills s
+LEFT JOIN categories c ON c.id = s.category_id
+LEFT JOIN skill_popularity p ON p.skill_id = s.id
+LEFT JOIN LATERAL (
+    SELECT
+        array_agg(tg.slug ORDER BY tg.slug) AS slugs,
+        string_agg(tg.name || E'\\n' || tg.slug, E'\\n' ORDER BY tg.slug) AS text
+    FROM skill_tags st
+    JOIN tags tg ON tg.id = st.tag_id
+    WHERE st.skill_id = s.id
+) t ON TRUE
+LEFT JOIN LATERAL (
+    SELECT array_agg(DISTINCT ss.name) AS names
+    FROM skill_source_links sl
+    JOIN skill_sources ss ON ss.id = sl.source_id
+    WHERE sl.skill_id = s.id
+) src ON TRUE
+WHERE {PUBLIC_SKILL_SQL}
+"""
+
+
+UPSERT_SET_SQL = ", ".join(
+    f"{column} = EXCLUDED.{column}"
+    for column in (name.strip() for name in PROJECTION_COLUMNS.split(","))
+    if column != "skill_id"
+)
+
+
+def _unique_ids(skill_ids: Iterable) -> list:
+    return list(dict.fromkeys(skill_id for skill_id in skill_ids if skill_id is not None))
+
+
+def _ids_filter(sql: str, column: str) -> str:
+    return f"{sql} AND {column} IN :skill_ids"
+
+
+async def refresh_public_skill_search(
+    db: AsyncSession, skill_ids: Optional[Iterable] = None
+) -> int:
+    """Re-project `skill_ids` (every skill when None); returns the number of public rows written.
+
+    Upserts the rows that are public and deletes the ones that are not (anymore), so
+    concurrent refreshes of the same skill never collide on the primary key.
+    """
+    # Sessions run with autoflush off; pending ORM changes must reach the SELECT below.
+    await db.flush()
+    upsert = f"INSERT INTO public_skill_search ({PROJECTION_COLUMNS}) {PROJECTION_SELECT_SQL}"
+    prune = (
+        "DELETE FROM public_skill_search AS ps WHERE NOT EXISTS "
+        f"(SELECT 1 FROM skills s WHERE s.id = ps.skill_id AND {PUBLIC_SKILL_SQL})"
+    )
+    params: dict = {}
+    if skill_ids is not None:
+        ids = _unique_ids(skill_ids)
+        if not ids:
+            return 0
+        upsert = _ids_filter(upsert, "s.id")
+        prune = _ids_filter(prune, "ps.skill_id")
+        params["skill_ids"] = ids
+    upsert += f" ON CONFLICT (skill_id) DO UPDATE SET {UPSERT_SET_SQL}"
+
+    def _statement(sql: str):
+        statement = text(sql)
+        if skill_ids is not None:
+            statement = statement.bindparams(bindparam("skill_ids", expanding=True))
+        return statement
+
+    result = await db.execute(_statement(upsert), params)
+    await db.execute(_statement(prune), params)
+    return int(result.rowcount or 0)
+
+
+async def refresh_public_skill_popularity(
+    db: AsyncSession, skill_ids: Optional[Iterable] = None
+) -> int:
+    """Copy popularity counters into existing projection rows (all rows when None)."""
+    await db.flush()
+    sql = (
+        "UPDATE public_skill_search AS ps "
+        "SET views = p.views, favorites = p.favorites, popularity_score = p.score "
+        "FROM skill_popularity AS p WHERE p.skill_id = ps.skill_id "
+        "AND (ps.views, ps.favorites, ps.popularity_score) "
+        "IS DISTINCT FROM (p.views, p.favorites, p.score)"
+    )
+    if skill_ids is None:
+        result = await db.execute(text(sql))
+    else:
+        ids = _unique_ids(skill_ids)
+        if not ids:
+            return 0
+        result = await db.execute(
+            text(_ids_filter(sql, "ps.skill_id")).bindparams(
+                bindparam("skill_ids", expanding=True)
+            ),
+            {"skill_ids": ids},
+        )
+    return int(result.rowcount or 0)
@@ -0,0 +1,132 @@
+"""Shared keyword search expressions (full-text + trigram) for skill queries."""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import Boolean, case, func, literal_column, or_, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.public_skill_search import PublicSkillSearch
+from app.models.skill import Skill
+from app.models.skill_tag import SkillTag
+from app.models.tag import Tag
+
+SEARCH_TEXT_CONFIG = "simple"
+
+# Per-field relevance, unchanged from the ILIKE-based scorer: every field that matches adds
+# its weight (max 4.30). `search_vector` weight classes: A=name/slug, B=summary,
+# C=description, D=content.
+NAME_MATCH_WEIGHT = 1.00
+SLUG_MATCH_WEIGHT = 0.90
+TAG_MATCH_WEIGHT = 0.80
+TEXT_CLASS_WEIGHTS = (("b", 0.75), ("c", 0.65), ("d", 0.20))  # summary, description, content
+# Query tokens turned into `token:*` prefix terms (partial words while typing).
+MAX_PREFIX_TERMS = 8
+
+
+@dataclass(frozen=True)
+class KeywordSearch:
+    """Predicate + relevance score for a keyword query."""
+
+    match: ColumnElement[bool]
+    score: ColumnElement[float]
+
+
+# websearch_to_tsquery syntax: quoted phrases, `-word` exclusions, `OR`.
+_WEBSEARCH_SYNTAX_RE = re.compile(r'"|(?:^|\s)-\w|\bor\b', re.IGNORECASE)
+
+
+def prefix_tsquery_text(query_text: str) -> Optional[str]:
+    """`to_tsquery` text matching every word of `query_text` as a prefix (`kub` -> `kub:*`).
+
+    Only word characters survive, so user input can never inject tsquery operators.
+    None for queries using websearch syntax: those keep their exact websearch meaning.
+    """
+    if _WEBSEARCH_SYNTAX_RE.search(query_text):
+        return None
+    words = re.findall(r"\w+", query_text.lower())[:MAX_PREFIX_TERMS]
+    return " & ".join(f"{word}:*" for word in words) or None
+
+
+def _regconfig() -> ColumnElement:
+    return literal_column(f"'{SEARCH_TEXT_CONFIG}'::regconfig")
+
+
+def _keyword_search(
+    query_text: str,
+    *,
+    search_vector: ColumnElement,
+    name: ColumnElement[str],
+    slug: ColumnElement[str],
+    tag_match: ColumnElement[bool],
+) -> KeywordSearch:
+    like = f"%{query_text}%"
+    ts_queries = [func.websearch_to_tsquery(_regconfig(), query_text)]
+    prefix_text = prefix_tsquery_text(query_text)
+    if prefix_text:
+        ts_queries.append(func.to_tsquery(_regconfig(), prefix_text))
+
+    def text_hit(vector: ColumnElement) -> ColumnElement[bool]:
+        return or_(*[vector.op("@@", return_type=Boolean)(ts_query) for ts_query in ts_queries])
+
+    def class_hit(weight_class: str) -> ColumnElement[bool]:
+        weights = literal_column(f"'{{{weight_class}}}'::\"char\"[]")
+        return text_hit(func.ts_filter(search_vector, weights))
+
+    name_match = name.ilike(like)
+    slug_match = slug.ilike(like)
+    terms = [
+        # Name: substring (trigram index) or every word in name/slug, in any order.
+        case((or_(name_match, class_hit("a")), NAME_MATCH_WEIGHT), else_=0.0),
+        case((slug_match, SLUG_MATCH_WEIGHT), else_=0.0),
+        *[case((class_hit(cls), weight), else_=0.0) for cls, weight in TEXT_CLASS_WEIGHTS],
+        case((tag_match, TAG_MATCH_WEIGHT), else_=0.0),
+    ]
+    score = terms[0]
+    for term in terms[1:]:
+        score = score + term
+    return KeywordSearch(
+        match=or_(text_hit(search_vector), name_match, slug_match, tag_match),
+        score=score,
+    )
+
+
+def build_skill_keyword_search(query_text: str) -> KeywordSearch:
+    """Build index-backed keyword match/score expressions for `Skill` rows.
+
+    - `skills.search_vector @@ websearch_to_tsquery(...)` (whole words, websearch syntax) or
+      `@@ to_tsquery('word:* & ...')` (word prefixes) use the GIN tsvector index.
+    - name/slug/tag `ILIKE '%q%'` use pg_trgm GIN indexes (any substring).
+    """
+    like = f"%{query_text}%"
+    tag_match = (
+        select(SkillTag.skill_id)
+        .join(Tag, SkillTag.tag_id == Tag.id)
+        .where(
+            SkillTag.skill_id == Skill.id,
+            or_(Tag.name.ilike(like), Tag.slug.ilike(like)),
+        )
+        .exists()
+    )
+    return _keyword_search(
+        query_text,
+        search_vector=Skill.search_vector,
+        name=Skill.name,
+        slug=Skill.slug,
+        tag_match=tag_match,
+    )
+
+
+def build_public_search_keyword_search(query_text: str) -> KeywordSearch:
+    """Same match/score as `build_skill_keyword_search`, on `public_skill_search` columns.
+
+    Tag names/slugs live in the trigram-indexed `tag_text` column, so no tag join is needed.
+    """
+    return _keyword_search(
+        query_text,
+        search_vector=PublicSkillSearch.search_vector,
+        name=PublicSkillSearch.name,
+        slug=PublicSkillSearch.slug,
+        tag_match=PublicSkillSearch.tag_text.ilike(f"%{query_text}%"),
+    )
@@ -3,19 +3,66 @@
 import uuid
 from typing import Sequence, Optional
 
-from sqlalchemy import select, func, desc, or_
+from sqlalchemy import func, literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.models.public_skill_search import PublicSkillSearch
 from app.models.skill import Skill
-from app.models.tag import Tag
 from app.models.skill_tag import SkillTag
-from app.models.category import Category
-from app.models.skill_popularity import SkillPopularity
-from app.models.skill_source import SkillSource
-from app.models.skill_source_link import SkillSourceLink
 from app.schemas.skill import SkillQuery
-from app.repos.public_filters import public_skill_conditions
+from app.repos.pagination import PageSlice, SortKey, cursor_scope, fetch_page, order_by_keys
+from app.repos.search_filters import build_public_search_keyword_search
+
+
+# `coalesce(trust_score, 0.0)` exactly as indexed by `ix_public_skill_search_popularity_order`
+# (a bound parameter would not match the index expression).
+PUBLIC_TRUST_SCORE_RANK = func.coalesce(PublicSkillSearch.trust_score, literal_column("0.0"))
+
+
+def public_skill_sort_keys(sort: str) -> list[SortKey]:
+    """ORDER BY keys for public skill lists over `public_skill_search`.
+
+    Every order runs in one direction and ends with `skill_id` (total, keyset-safe), so
+    cursor seeks are a single row-value comparison on a matching index:
+    `ix_public_skill_search_created_at_id` (newest/oldest) and
+    `ix_public_skill_search_popularity_order` (popularity).
+    """
+    if sort == "newest":
+        return [
+            SortKey(PublicSkillSearch.created_at, descending=True),
+            SortKey(PublicSkillSearch.skill_id, descending=True),
+        ]
+    if sort == "oldest":
+        return [SortKey(PublicSkillSearch.created_at), SortKey(PublicSkillSearch.skill_id)]
+    return [
+        SortKey(PublicSkillSearch.popularity_score, descending=True),
+        SortKey(PublicSkillSearch.trust_rank, descending=True),
+        SortKey(PUBLIC_TRUST_SCORE_RANK, descending=True),
+        SortKey(PublicSkillSearch.updated_at, descending=True),
+        SortKey(PublicSkillSearch.skill_id, descending=True),
+    ]
+
+
+def _public_list_statement(query: SkillQuery):
+    """Filtered projection SELECT shared by the public list endpoints (no joins)."""
+    stmt = select(PublicSkillSearch)
+
+    # Filter by Query
+    if query.q:
+        keyword = query.q.strip()
+        if keyword:
+            stmt = stmt.where(build_public_search_keyword_search(keyword).match)
+
+    if query.category_slug:
+        stmt = stmt.where(PublicSkillSearch.category_slug == query.category_slug)
+
+    if query.tag_slugs:
+        # ANY semantics: include skills that have at least one selected tag.
+        stmt = stmt.where(PublicSkillSearch.tag_slugs.overlap(list(query.tag_slugs)))
+
+    # Eager load (list cards read category.name)
+    return stmt.options(selectinload(PublicSkillSearch.category))
 
 
 class SkillRepo:
@@ -52,156 +99,45 @@ class SkillRepo:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def list_skills(self, query: SkillQuery) -> tuple[Sequence[Skill], int]:
-        """List skills with filtering/pagination."""
-        stmt = select(Skill).where(*public_skill_conditions())
-        
-        # Filter by Query
-        if query.q:
-            keyword = query.q.strip()
-            if keyword:
-                like = f"%{keyword}%"
-                tag_search_exists = (
-                    select(SkillTag.skill_id)
-                    .join(Tag, SkillTag.tag_id == Tag.id)
-                    .where(
-                        SkillTag.skill_id == Skill.id,
-                        or_(Tag.name.ilike(like), Tag.slug.ilike(like)),
-                    )
-                    .exists()
-                )
-                stmt = stmt.where(
-                    or_(
-                        Skill.name.ilike(like),
-                        Skill.slug.ilike(like),
-                        Skill.description.ilike(like),
-                        Skill.content.ilike(like),
-                        tag_search_exists,
-                    )
-                )
-        
-        if query.category_slug:
-            stmt = stmt.join(Skill.category).where(Category.slug == query.category_slug)
-            
-        if query.tag_slugs:
-            # ANY semantics: include skills that have at least one selected tag.
-            tag_filter_exists = (
-                select(SkillTag.skill_id)
-                .join(Tag, SkillTag.tag_id == Tag.id)
-                .where(
-                    SkillTag.skill_id == Skill.id,
-                    Tag.slug.in_(query.tag_slugs),
-                )
-                .exists()
-            )
-            stmt = stmt.where(tag_filter_exists)
-
-        # Count total
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = (await self.db.execute(count_stmt)).scalar_one()
-
-        # Sorting
-        if query.sort == "newest":
-            stmt = stmt.order_by(desc(Skill.created_at))
-        elif query.sort == "oldest":
-            stmt = stmt.order_by(Skill.created_at)
-        else: # popularity
-            # Join popularity if needed
-             stmt = stmt.outerjoin(Skill.popularity).order_by(desc(SkillPopularity.score))
-
-        # Pagination
-        stmt = stmt.offset((query.page - 1) * query.size).limit(query.size)
-        
-        # Eager load
-        stmt = stmt.options(
-            selectinload(Skill.category),
-            selectinload(Skill.tag_associations).selectinload(SkillTag.tag),
-            selectinload(Skill.popularity),
-            selectinload(Skill.source_links),
+    async def list_skills(self, query: SkillQuery) -> PageSlice:
+        """List public skills with filtering/pagination (reads `public_skill_search`)."""
+        scope = cursor_scope(
+            f"skills:{query.sort}", query.q, query.category_slug, sorted(query.tag_slugs or [])
         )
-
-        result = await self.db.execute(stmt)
-        return result.scalars().all(), total
+        return await self._list_public(query, _public_list_statement(query), scope)
 
     async def list_skills_from_source_names(
         self,
         query: SkillQuery,
         *,
         source_names: Sequence[str],
-    ) -> tuple[Sequence[Skill], int]:
+    ) -> PageSlice:
         """List publicly visible skills that were ingested from specific sources."""
         names = [str(name).strip() for name in (source_names or []) if str(name).strip()]
         if not names:
-            return [], 0
-
-        from_source_exists = (
-            select(SkillSourceLink.id)
-            .join(SkillSource, SkillSourceLink.source_id == SkillSource.id)
-            .where(
-                SkillSourceLink.skill_id == Skill.id,
-                SkillSource.name.in_(names),
-            )
-            .exists()
+            return PageSlice()
+
+        stmt = _public_list_statement(query).where(PublicSkillSearch.source_names.overlap(names))
+        scope = cursor_scope(
+            f"skills:sources:{query.sort}",
+            query.q,
+            query.category_slug,
+            sorted(query.tag_slugs or []),
+            sorted(names),
         )
-
-        stmt = select(Skill).where(*public_skill_conditions()).where(from_source_exists)
-
-        # Filter by Query
-        if query.q:
-            keyword = query.q.strip()
-            if keyword:
-                like = f"%{keyword}%"
-                tag_search_exists = (
-                    select(SkillTag.skill_id)
-                    .join(Tag, SkillTag.tag_id == Tag.id)
-                    .where(
-                        SkillTag.skill_id == Skill.id,
-                        or_(Tag.name.ilike(like), Tag.slug.ilike(like)),
-                    )
-                    .exists()
-                )
-                stmt = stmt.where(
-                    or_(
-                        Skill.name.ilike(like),
-                        Skill.slug.ilike(like),
-                        Skill.description.ilike(like),
-                        Skill.content.ilike(like),
-                        tag_search_exists,
-                    )
-                )
-
-        if query.category_slug:
-            stmt = stmt.join(Skill.category).where(Category.slug == query.category_slug)
-
-        if query.tag_slugs:
-            tag_filter_exists = (
-                select(SkillTag.skill_id)
-                .join(Tag, SkillTag.tag_id == Tag.id)
-                .where(
-                    SkillTag.skill_id == Skill.id,
-                    Tag.slug.in_(query.tag_slugs),
-                )
-                .exists()
-            )
-            stmt = stmt.where(tag_filter_exists)
-
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = (await self.db.execute(count_stmt)).scalar_one()
-
-        if query.sort == "newest":
-            stmt = stmt.order_by(desc(Skill.created_at))
-        elif query.sort == "oldest":
-            stmt = stmt.order_by(Skill.created_at)
-        else:
-            stmt = stmt.outerjoin(Skill.popularity).order_by(desc(SkillPopularity.score))
-
-        stmt = stmt.offset((query.page - 1) * query.size).limit(query.size)
-        stmt = stmt.options(
-            selectinload(Skill.category),
-            selectinload(Skill.tag_associations).selectinload(SkillTag.tag),
-            selectinload(Skill.popularity),
-            selectinload(Skill.source_links),
+        return await self._list_public(query, stmt, scope)
+
+    async def _list_public(self, query: SkillQuery, stmt, cursor_scope: str) -> PageSlice:
+        sort_keys = public_skill_sort_keys(query.sort)
+        stmt = stmt.order_by(*order_by_keys(sort_keys))
+
+        # Pagination (total arrives with the page; `cursor` switches to keyset seeks)
+        return await fetch_page(
+            self.db,
+            stmt,
+            page=query.page,
+            size=query.size,
+            sort_keys=sort_keys,
+            cursor=query.cursor,
+            cursor_scope=cursor_scope,
         )
-
-        result = await self.db.execute(stmt)
-        return result.scalars().all(), total
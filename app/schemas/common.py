@@ -10,10 +10,12 @@ class Page(BaseModel, Generic[T]):
     """Pagination response model."""
 
     items: list[T]
-    total: int
+    total: Optional[int]  # None when paginating by cursor
     page: int
     size: int
-    pages: int
+    pages: Optional[int]
+    total_estimated: bool = False  # total stopped at LIST_COUNT_CAP
+    next_cursor: Optional[str] = None  # keyset cursor for the next page
 
     model_config = ConfigDict(from_attributes=True)
 
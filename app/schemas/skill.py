@@ -128,5 +128,6 @@ class SkillQuery(BaseModel):
     sort: str = "popularity"
     page: int = 1
     size: int = 20
+    cursor: Optional[str] = None
 
 SkillDetail = Skill
@@ -26,6 +26,21 @@ class WorkerStatus(BaseModel):
     last_processed_in_loop: Optional[int] = None
     last_error_count_in_loop: Optional[int] = None
     last_drained_in_loop: Optional[int] = None
+    last_embeddings_computed_in_loop: Optional[int] = None
+    last_embeddings_reused_in_loop: Optional[int] = None  # unchanged text + model: no inference
+    # cache entries (re)computed by the warmer
+    last_cache_warm_computed_in_loop: Optional[int] = None
+    last_cache_warm_cached_in_loop: Optional[int] = None
+    last_cache_warm_errors_in_loop: Optional[int] = None
+    last_http_requests_in_loop: Optional[int] = None  # shared ingest HTTP client
+    last_http_connections_opened_in_loop: Optional[int] = None
+    last_http_connections_reused_in_loop: Optional[int] = None
+    last_http2_responses_in_loop: Optional[int] = None
+    last_github_requests_in_loop: Optional[int] = None  # repo/tree requests of the scanner
+    last_github_not_modified_in_loop: Optional[int] = None  # 304s served from github_repo_cache
+    last_repos_unchanged_in_loop: Optional[int] = None  # same tree SHA: no downloads
+    last_files_unchanged_in_loop: Optional[int] = None  # same blob SHA: not downloaded
+    last_files_changed_in_loop: Optional[int] = None
 
     last_error: Optional[str] = None
 
@@ -43,6 +58,8 @@ class WorkerStatus(BaseModel):
     ingest_last_source_error: Optional[str] = None
     ingested_so_far: Optional[int] = None
     ingest_results: Optional[int] = None
+    # GitHub budget per bucket (core/search/raw): limit, remaining, used, rate_limited, reset_at
+    github_rate_limits: Optional[dict] = None
 
     # Bounded event log (last ~50 phase transitions + errors)
     recent_events: Optional[list[dict]] = None
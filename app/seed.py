@@ -7,6 +7,8 @@ from app.models.skill import Skill
 from app.models.tag import Tag
 from app.models.skill_tag import SkillTag
 from app.models.skill_popularity import SkillPopularity
+from app.repos.public_filters import apply_public_visibility
+from app.repos.public_skill_search_repo import refresh_public_skill_search
 
 INITIAL_CATEGORIES = [
     # Taxonomy policy: "chat", "code", "writing" are deprecated and merged into Tools.
@@ -191,6 +193,7 @@ async def seed_data():
                         github_stars=skill_data.get("github_stars"),
                         use_cases=skill_data.get("use_cases")
                     )
+                    apply_public_visibility(new_skill)
                     db.add(new_skill)
                     await db.flush() # to get ID
                     
@@ -216,6 +219,7 @@ async def seed_data():
         # Backfill categories for any existing uncategorized skills
         print("Backfilling uncategorized skills...")
         await backfill_uncategorized_skills(db)
+        await refresh_public_skill_search(db)
 
         await db.commit()
         print("Seed Complete.")
@@ -4,10 +4,12 @@ import asyncio
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.redis_l2 import POPULARITY_VERSION, redis_l2_cache
 from app.db.session import AsyncSessionLocal
 from app.models.skill import Skill
 from app.models.skill_popularity import SkillPopularity
 from app.models.skill_event import SkillEvent
+from app.repos.public_skill_search_repo import refresh_public_skill_popularity
 
 async def compute_score(db: AsyncSession):
     """Compute popularity score for all skills."""
@@ -23,6 +25,11 @@ async def compute_score(db: AsyncSession):
 async def run():
     async with AsyncSessionLocal() as db:
         await compute_score(db)
+        # Events update single rows in real time; resync every row of the search projection.
+        await refresh_public_skill_popularity(db)
+        await db.commit()
+    # New scores reorder rankings and popularity-sorted lists (and the warm-up that follows).
+    await redis_l2_cache.bump_namespaces(POPULARITY_VERSION)
 
 if __name__ == "__main__":
     asyncio.run(run())
@@ -3,34 +3,30 @@
 import asyncio
 import hashlib
 import re
-from sentence_transformers import SentenceTransformer
-
-# Initialize embedding model (singleton)
-_embedding_model = None
-
-def get_embedding_model():
-    global _embedding_model
-    if _embedding_model is None:
-        # Use a small, efficient model for now
-        _embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-    return _embedding_model
-
-def generate_embedding(text: str) -> list[float]:
-    if not text or not text.strip():
-        return None
-    model = get_embedding_model()
-    return model.encode(text).tolist()
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import Optional
+from typing import Any, Optional
 from urllib.parse import urlparse
 
+from app.cache.redis_l2 import CATALOG_VERSION, redis_l2_cache
 from app.db.session import AsyncSessionLocal
+from app.llm.embeddings import (
+    embedding_input_hash,
+    embedding_model_version,
+    encode_many,
+    skill_embedding_text,
+)
+from app.ingest.github_cache import github_cache_stats
+from app.ingest.github_scheduler import get_github_scheduler
+from app.ingest.http import connection_stats
 from app.ingest.sources import run_ingest_sources
+from app.ingest.tree_index import TreeIndex
 from app.ingest.db_upsert import upsert_raw_skill
 from app.models.raw_skill import RawSkill
 from app.parsers.skillmd_parser import parse_skill_md
+from app.repos.public_filters import apply_public_visibility
+from app.repos.public_skill_search_repo import refresh_public_skill_search
 from app.quality.skill_quality import validate_skill_md
 from app.quality.claude_skill_spec import validate_claude_skill_frontmatter
 from app.llm.glm_client import summarize_skill_overview, summarize_skill_detail_overview
@@ -522,8 +518,44 @@ async def ingest_raw(db: AsyncSession, source_ids: Optional[list[str]] = None) -
     """Fetch from sources and upsert raw skills."""
     await _patch_worker_status({"phase": "ingest_fetch_sources"})
     print("Fetching sources...")
-    results = await run_ingest_sources(progress=_patch_worker_status, source_ids=source_ids)
-    await _patch_worker_status({"phase": "ingest_upsert_raw", "ingest_results": int(len(results))})
+    http_before = connection_stats.snapshot()
+    github_before = github_cache_stats.snapshot()
+    tree_index = TreeIndex() if get_settings().ingest_incremental else None
+    results = await run_ingest_sources(
+        progress=_patch_worker_status, source_ids=source_ids, tree_index=tree_index
+    )
+    http_stats = connection_stats.since(http_before)
+    github_stats = github_cache_stats.since(github_before)
+    print(
+        f"HTTP: {http_stats.requests} requests on {http_stats.connections_opened} new connections "
+        f"({http_stats.connections_reused} reused, {http_stats.http2_responses} over HTTP/2)"
+    )
+    print(
+        f"GitHub repo/tree: {github_stats.requests} requests, "
+        f"{github_stats.not_modified} not modified (served from github_repo_cache)"
+    )
+    if tree_index is not None:
+        print(
+            f"Incremental: {tree_index.repos_unchanged} repos unchanged, "
+            f"{tree_index.files_unchanged} files unchanged, "
+            f"{tree_index.files_changed} files fetched"
+        )
+    await _patch_worker_status(
+        {
+            "phase": "ingest_upsert_raw",
+            "ingest_results": int(len(results)),
+            "last_http_requests_in_loop": int(http_stats.requests),
+            "last_http_connections_opened_in_loop": int(http_stats.connections_opened),
+            "last_http_connections_reused_in_loop": int(http_stats.connections_reused),
+            "last_http2_responses_in_loop": int(http_stats.http2_responses),
+            "last_github_requests_in_loop": int(github_stats.requests),
+            "last_github_not_modified_in_loop": int(github_stats.not_modified),
+            "last_repos_unchanged_in_loop": int(tree_index.repos_unchanged) if tree_index else None,
+            "last_files_unchanged_in_loop": int(tree_index.files_unchanged) if tree_index else None,
+            "last_files_changed_in_loop": int(tree_index.files_changed) if tree_index else None,
+            "github_rate_limits": get_github_scheduler(get_settings()).status(),
+        }
+    )
     
     count = 0
     for res in results:
@@ -565,11 +597,68 @@ async def ingest_raw(db: AsyncSession, source_ids: Optional[list[str]] = None) -
             )
         
     print(f"Ingested {count} raw items.")
+    if tree_index is not None:
+        # Only now are the fetched files in raw_skills; a crash before this re-downloads them.
+        await tree_index.save(db)
     await _patch_worker_status({"phase": "ingest_done", "last_ingested_raw_items": int(count)})
     return count
 
 
 
+def _skill_embedding_input(skill: Any) -> str:
+    spec = skill.spec if isinstance(skill.spec, dict) else {}
+    return skill_embedding_text(
+        name=skill.name,
+        description=skill.description,
+        derived_description=spec.get("derived_description"),
+        use_cases=skill.use_cases,
+    )
+
+
+def _queue_skill_embedding(queue: list[tuple[Any, str]], skill: Any) -> bool:
+    """Queue `skill` for embedding unless its stored vector already matches text + model.
+
+    Returns False when the existing vector is reused.
+    """
+    text = _skill_embedding_input(skill)
+    if (
+        skill.embedding is not None
+        and skill.embedding_input_hash == embedding_input_hash(text)
+        and skill.embedding_model == embedding_model_version()
+    ):
+        return False
+    queue.append((skill, text))
+    return True
+
+
+async def _apply_embeddings(queue: list[tuple[Any, str]]) -> int:
+    """Embed queued skill texts in one batched call and drain the queue.
+
+    On failure the previous vector keeps serving but `embedding_input_hash` is cleared, so
+    `backfill_missing_embeddings` re-embeds the row once the provider recovers.
+    Returns the number of skills that received a vector.
+    """
+    if not queue:
+        return 0
+    items = list(queue)
+    queue.clear()
+    try:
+        vectors = await encode_many([text for _, text in items])
+    except Exception as e:
+        print(f"Embedding batch failed ({len(items)} skills): {e}")
+        for skill, _ in items:
+            skill.embedding_input_hash = None
+        return 0
+    version = embedding_model_version()
+    applied = 0
+    for (skill, text), vector in zip(items, vectors):
+        skill.embedding = vector
+        skill.embedding_input_hash = embedding_input_hash(text) if vector else None
+        skill.embedding_model = version if vector else None
+        applied += 1 if vector else 0
+    return applied
+
+
 async def parse_queued_raw_skills(db: AsyncSession) -> dict:
     """Process pending raw skills."""
     print("Processing pending raw skills...")
@@ -621,6 +710,13 @@ async def parse_queued_raw_skills(db: AsyncSession) -> dict:
 
     processed = 0
     errors = 0
+    # (skill, text) pairs embedded together once a batch fills up (and at the end).
+    embedding_queue: list[tuple[Skill, str]] = []
+    embedding_batch_size = max(int(settings.embedding_batch_size or 1), 1)
+    embeddings_computed = 0
+    embeddings_reused = 0
+    # Skills created/updated in this batch; re-projected into public_skill_search before commit.
+    touched_skill_ids: set = set()
 
     for raw in pending_skills:
         try:
@@ -915,12 +1011,12 @@ async def parse_queued_raw_skills(db: AsyncSession) -> dict:
                     }
                     existing_skill.is_official = True
                     existing_skill.is_verified = True
+                    apply_public_visibility(existing_skill)
                     existing_skill.github_stars = github_stars
                     existing_skill.github_updated_at = github_updated_at
                     existing_skill.use_cases = use_cases
-                    existing_skill.embedding = generate_embedding(
-                        f"{name} {description} {spec_result.derived_description or ''} {' '.join(use_cases)}"
-                    )
+                    if not _queue_skill_embedding(embedding_queue, existing_skill):
+                        embeddings_reused += 1
                     existing_skill.quality_score = float(quality.score)
                     trust_profile = compute_trust_profile(
                         quality_score=quality.score,
@@ -940,6 +1036,7 @@ async def parse_queued_raw_skills(db: AsyncSession) -> dict:
                     updated_count = 1
 
                     await _ensure_skill_tags(db, skill_id=existing_skill.id, tag_slugs=tag_slugs)
+                    touched_skill_ids.add(existing_skill.id)
                     await _ensure_skill_source_link(
                         db,
                         skill_id=existing_skill.id,
@@ -981,10 +1078,9 @@ async def parse_queued_raw_skills(db: AsyncSession) -> dict:
                         trust_level="warning",
                         trust_flags=[],
                         trust_last_verified_at=datetime.now(timezone.utc),
-                        embedding=generate_embedding(
-                            f"{name} {description} {spec_result.derived_description or ''} {' '.join(use_cases)}"
-                        ),
                     )
+                    apply_public_visibility(new_skill)
+                    _queue_skill_embedding(embedding_queue, new_skill)
                     trust_profile = compute_trust_profile(
                         quality_score=quality.score,
                         is_verified=True,
@@ -1000,6 +1096,7 @@ async def parse_queued_raw_skills(db: AsyncSession) -> dict:
                     db.add(new_skill)
                     await db.flush()
                     await _ensure_skill_tags(db, skill_id=new_skill.id, tag_slugs=tag_slugs)
+                    touched_skill_ids.add(new_skill.id)
                     await _ensure_skill_source_link(
                         db,
                         skill_id=new_skill.id,
@@ -1028,6 +1125,8 @@ async def parse_queued_raw_skills(db: AsyncSession) -> dict:
                 raw.parse_status = "processed"
                 await db.flush()
                 processed += 1
+                if len(embedding_queue) >= embedding_batch_size:
+                    embeddings_computed += await _apply_embeddings(embedding_queue)
                 continue
 
         except Exception as e:
@@ -1036,7 +1135,11 @@ async def parse_queued_raw_skills(db: AsyncSession) -> dict:
             raw.parse_error = {"message": str(e)}
             errors += 1
             
+    embeddings_computed += await _apply_embeddings(embedding_queue)
+    await refresh_public_skill_search(db, touched_skill_ids)
     await db.commit()
+    if processed:
+        await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
 
     pending_after = (
         await db.execute(select(func.count()).select_from(RawSkill).where(RawSkill.parse_status == "pending"))
@@ -1055,6 +1158,8 @@ async def parse_queued_raw_skills(db: AsyncSession) -> dict:
             "errors": int(errors),
             "batch_size": int(len(pending_skills)),
             "drained": int(drained),
+            "embeddings_computed": int(embeddings_computed),
+            "embeddings_reused": int(embeddings_reused),
         }
     )
 
@@ -1065,6 +1170,8 @@ async def parse_queued_raw_skills(db: AsyncSession) -> dict:
         "errors": int(errors),
         "batch_size": int(len(pending_skills)),
         "drained": int(drained),
+        "embeddings_computed": int(embeddings_computed),
+        "embeddings_reused": int(embeddings_reused),
     }
 
 
@@ -1102,7 +1209,9 @@ async def backfill_missing_summaries(db: AsyncSession, *, limit: int = 15) -> in
             updated += 1
 
     if updated:
+        await refresh_public_skill_search(db, [skill.id for skill in skills])
         await db.commit()
+        await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
     return updated
 
 
@@ -1141,6 +1250,7 @@ async def backfill_missing_detail_overviews(db: AsyncSession, *, limit: int = 10
 
     if updated:
         await db.commit()
+        await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
     return updated
 
 
@@ -1225,7 +1335,10 @@ async def backfill_missing_source_links(db: AsyncSession, *, limit: int = 200) -
         created += 1
 
     if created:
+        # The plugins view filters on the projected `source_names`.
+        await refresh_public_skill_search(db, [skill.id for skill in skills])
         await db.commit()
+        await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
     return created
 
 
@@ -1271,7 +1384,9 @@ async def backfill_missing_tags_from_raw_frontmatter(db: AsyncSession, *, limit:
         updated += 1
 
     if updated:
+        await refresh_public_skill_search(db, [skill.id for skill in skills])
         await db.commit()
+        await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
     return updated
 
 
@@ -1336,12 +1451,17 @@ async def backfill_missing_specs_from_raw_frontmatter(db: AsyncSession, *, limit
 
     if updated:
         await db.commit()
+        await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
     return updated
 
 
 
 async def backfill_missing_embeddings(db: AsyncSession, *, limit: int = 100) -> int:
-    """Backfill missing embeddings for existing skills."""
+    """Backfill missing embeddings and re-embed stale rows.
+
+    Stale means produced by another model version, or with no input hash (the embedding
+    failed after the text changed, or the vector predates input hashing).
+    """
     from app.models.skill import Skill
     
     if limit <= 0:
@@ -1349,24 +1469,25 @@ async def backfill_missing_embeddings(db: AsyncSession, *, limit: int = 100) ->
 
     stmt = (
         select(Skill)
-        .where(Skill.embedding.is_(None))
+        .where(
+            (Skill.embedding.is_(None))
+            | (Skill.embedding_input_hash.is_(None))
+            | (Skill.embedding_model.is_distinct_from(embedding_model_version()))
+        )
         .where(Skill.description.is_not(None))
-        .order_by(Skill.updated_at.desc())
+        .order_by(Skill.embedding.is_not(None), Skill.updated_at.desc())
         .limit(int(limit))
     )
     result = await db.execute(stmt)
     skills = result.scalars().all()
 
-    updated = 0
-    for skill in skills:
-        text = f"{skill.name or ''} {skill.description or ''} {skill.summary or ''} {' '.join(skill.use_cases or [])}"
-        embedding = generate_embedding(text)
-        if embedding:
-            skill.embedding = embedding
-            updated += 1
-    
+    queue = [(skill, _skill_embedding_input(skill)) for skill in skills]
+    updated = await _apply_embeddings(queue)
+
     if updated:
+        await refresh_public_skill_search(db, [skill.id for skill in skills])
         await db.commit()
+        await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
     return updated
 
 
@@ -1406,7 +1527,9 @@ async def backfill_missing_trust_profiles(db: AsyncSession, *, limit: int = 200)
         updated += 1
 
     if updated:
+        await refresh_public_skill_search(db, [skill.id for skill in skills])
         await db.commit()
+        await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
     return updated
 
 async def run(source_ids: Optional[list[str]] = None):
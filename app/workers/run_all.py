@@ -3,8 +3,10 @@
 import asyncio
 from datetime import datetime, timedelta, timezone
 
-from app.workers import ingest_and_parse, compute_popularity, build_rank_snapshots
-from app.db.session import AsyncSessionLocal
+from app.cache.redis_l2 import redis_l2_cache
+from app.settings import get_settings
+from app.workers import ingest_and_parse, compute_popularity, build_rank_snapshots, warm_cache
+from app.db.session import AsyncSessionLocal, pool_config_summary
 from app.repos.system_setting_repo import (
     DEFAULT_WORKER_SETTINGS,
     get_worker_settings,
@@ -59,6 +61,9 @@ async def _patch_worker_status(patch: dict) -> None:
         return
 
 async def main():
+    print(f"Database pool: {pool_config_summary(get_settings())}")
+    # Parse/backfill commits bump the API response cache versions through Redis.
+    await redis_l2_cache.init()
     while True:
         print("--- Starting Workers ---")
         worker_settings = DEFAULT_WORKER_SETTINGS
@@ -112,6 +117,8 @@ async def main():
                 pending_after = None
                 processed = None
                 errors = None
+                embeddings_computed = None
+                embeddings_reused = None
                 if isinstance(stats, dict):
                     ingested = stats.get("ingested")
                     parse_stats = stats.get("parse") if isinstance(stats.get("parse"), dict) else {}
@@ -120,6 +127,8 @@ async def main():
                     processed = parse_stats.get("processed")
                     errors = parse_stats.get("errors")
                     drained = parse_stats.get("drained")
+                    embeddings_computed = parse_stats.get("embeddings_computed")
+                    embeddings_reused = parse_stats.get("embeddings_reused")
                 await _patch_worker_status(
                     {
                         "phase": "ingest_and_parse_done",
@@ -129,6 +138,14 @@ async def main():
                         "last_processed_in_loop": int(processed) if isinstance(processed, int) else None,
                         "last_error_count_in_loop": int(errors) if isinstance(errors, int) else None,
                         "last_drained_in_loop": int(drained) if isinstance(drained, int) else None,
+                        "last_embeddings_computed_in_loop": (
+                            int(embeddings_computed)
+                            if isinstance(embeddings_computed, int)
+                            else None
+                        ),
+                        "last_embeddings_reused_in_loop": (
+                            int(embeddings_reused) if isinstance(embeddings_reused, int) else None
+                        ),
                     }
                 )
             else:
@@ -141,6 +158,8 @@ async def main():
                 processed = None
                 errors = None
                 drained_total = 0
+                embeddings_computed_total = 0
+                embeddings_reused_total = 0
                 try:
                     async with AsyncSessionLocal() as db:
                         # Drain the queue in one loop run (no "sleep between loops"),
@@ -156,6 +175,12 @@ async def main():
                             drained = parse_stats.get("drained")
                             if isinstance(drained, int):
                                 drained_total += drained
+                            embeddings_computed_total += int(
+                                parse_stats.get("embeddings_computed") or 0
+                            )
+                            embeddings_reused_total += int(
+                                parse_stats.get("embeddings_reused") or 0
+                            )
                             # Stop when there's nothing left (or no progress).
                             if not isinstance(pending_after, int) or pending_after <= 0:
                                 break
@@ -171,6 +196,8 @@ async def main():
                         "last_processed_in_loop": int(processed) if isinstance(processed, int) else None,
                         "last_error_count_in_loop": int(errors) if isinstance(errors, int) else None,
                         "last_drained_in_loop": int(drained_total),
+                        "last_embeddings_computed_in_loop": int(embeddings_computed_total),
+                        "last_embeddings_reused_in_loop": int(embeddings_reused_total),
                     }
                 )
 
@@ -197,6 +224,23 @@ async def main():
             await compute_popularity.run()
             await _patch_worker_status({"phase": "build_rank_snapshots"})
             await build_rank_snapshots.run()
+
+            if get_settings().cache_warm_enabled:
+                try:
+                    await _patch_worker_status({"phase": "cache_warm"})
+                    warm_stats = await warm_cache.run()
+                    await _patch_worker_status(
+                        {
+                            "phase": "cache_warm_done",
+                            "last_cache_warm_computed_in_loop": int(
+                                warm_stats.get("computed") or 0
+                            ),
+                            "last_cache_warm_cached_in_loop": int(warm_stats.get("cached") or 0),
+                            "last_cache_warm_errors_in_loop": int(warm_stats.get("errors") or 0),
+                        }
+                    )
+                except Exception as e:
+                    await _patch_worker_status({"phase": "cache_warm_error", "last_error": str(e)})
         except Exception as e:
             print(f"Worker Error: {e}")
             await _patch_worker_status({"phase": "error", "last_error": str(e)})
@@ -0,0 +1,144 @@
+"""Cache Warmer Worker.
+
+Runs after each pipeline loop and requests the hottest public pages through the API app
+in-process (httpx ASGI transport), so their response cache entries are computed here
+instead of on the first user request after data changed:
+
+- `/api/rankings/top10`, `/api/categories`, `/api/tags`, `/api/packs`, `/api/plugins`
+- `/api/skills` page 1: default, each `CACHE_WARM_SORTS` sort, each category, top tags
+- the `CACHE_WARM_TOP_QUERIES` most requested searches from the hit log
+- `CACHE_WARM_EXTRA_PATHS`
+
+Data changes bump the cache namespace versions, so after a change these requests miss and
+recompute under the new keys; otherwise they are cheap cache hits.
+"""
+
+import asyncio
+from typing import Optional
+from urllib.parse import urlencode
+
+import httpx
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.hit_log import WARMER_HEADER, search_hit_log
+from app.cache.redis_l2 import redis_l2_cache
+from app.db.session import AsyncSessionLocal
+from app.models.category import Category
+from app.models.skill import Skill
+from app.models.skill_tag import SkillTag
+from app.models.tag import Tag
+from app.repos.public_filters import public_skill_conditions
+from app.settings import Settings, get_settings
+
+API_PREFIX = "/api"
+WARM_BASE_URL = "http://cache-warmer"
+WARM_TIMEOUT_SECONDS = 30.0
+STATIC_PATHS = (
+    "/rankings/top10",
+    "/categories",
+    "/tags",
+    "/packs",
+    "/plugins",
+    "/skills",
+)
+
+
+def _skills_path(**params: str) -> str:
+    return f"{API_PREFIX}/skills?{urlencode(sorted(params.items()))}"
+
+
+async def _top_tag_slugs(db: AsyncSession, limit: int) -> list[str]:
+    if limit <= 0:
+        return []
+    stmt = (
+        select(Tag.slug)
+        .join(SkillTag, SkillTag.tag_id == Tag.id)
+        .join(Skill, Skill.id == SkillTag.skill_id)
+        .where(*public_skill_conditions())
+        .group_by(Tag.slug)
+        .order_by(func.count(SkillTag.skill_id).desc(), Tag.slug)
+        .limit(limit)
+    )
+    return list((await db.execute(stmt)).scalars().all())
+
+
+async def collect_warm_paths(db: AsyncSession, settings: Optional[Settings] = None) -> list[str]:
+    """Request targets to warm, in priority order and without duplicates."""
+    settings = settings or get_settings()
+    paths = [f"{API_PREFIX}{path}" for path in STATIC_PATHS]
+    paths += [_skills_path(sort=sort) for sort in settings.cache_warm_sort_list]
+
+    category_slugs = (
+        (await db.execute(select(Category.slug).order_by(Category.display_order, Category.name)))
+        .scalars()
+        .all()
+    )
+    paths += [_skills_path(category=slug) for slug in category_slugs]
+    paths += [
+        _skills_path(tags=slug) for slug in await _top_tag_slugs(db, settings.cache_warm_top_tags)
+    ]
+
+    paths += await search_hit_log.top(settings.cache_warm_top_queries)
+    paths += settings.cache_warm_extra_path_list
+    return list(dict.fromkeys(path for path in paths if path.startswith("/")))
+
+
+async def warm_paths(paths: list[str], *, concurrency: int) -> dict:
+    """GET every path through the app; count what was (re)computed vs. already cached."""
+    from app.main import create_app
+
+    stats = {"requested": len(paths), "computed": 0, "cached": 0, "errors": 0}
+    semaphore = asyncio.Semaphore(max(int(concurrency), 1))
+    transport = httpx.ASGITransport(app=create_app())
+
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url=WARM_BASE_URL,
+        timeout=WARM_TIMEOUT_SECONDS,
+        headers={"Accept-Encoding": "gzip", WARMER_HEADER: "1"},
+    ) as client:
+
+        async def warm(path: str) -> None:
+            async with semaphore:
+                try:
+                    response = await client.get(path)
+                except Exception as exc:
+                    print(f"Cache warm error for {path}: {exc}")
+                    stats["errors"] += 1
+                    return
+            if response.status_code != 200:
+                stats["errors"] += 1
+            elif response.headers.get("X-Cache", "MISS") == "MISS":
+                stats["computed"] += 1
+            else:
+                stats["cached"] += 1
+
+        await asyncio.gather(*(warm(path) for path in paths))
+    return stats
+
+
+async def run() -> dict:
+    settings = get_settings()
+    if not redis_l2_cache.enabled():
+        return {"requested": 0, "computed": 0, "cached": 0, "errors": 0}
+    async with AsyncSessionLocal() as db:
+        paths = await collect_warm_paths(db, settings)
+    stats = await warm_paths(paths, concurrency=settings.cache_warm_concurrency)
+    print(
+        f"Cache warm: {stats['computed']} computed, {stats['cached']} already cached, "
+        f"{stats['errors']} errors ({stats['requested']} paths)."
+    )
+    return stats
+
+
+async def _main() -> None:
+    await redis_l2_cache.init()
+    try:
+        await run()
+    finally:
+        await redis_l2_cache.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
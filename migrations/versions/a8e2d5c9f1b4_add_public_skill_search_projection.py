@@ -0,0 +1,177 @@
+"""Add public_skill_search projection for public list/search endpoints.
+
+Revision ID: a8e2d5c9f1b4
+Revises: f7a1c4e8b3d6
+Create Date: 2026-10-17 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a8e2d5c9f1b4"
+down_revision: Union[str, None] = "f7a1c4e8b3d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "public_skill_search"
+TRGM_INDEXES = (
+    ("ix_public_skill_search_name_trgm", "name"),
+    ("ix_public_skill_search_slug_trgm", "slug"),
+    ("ix_public_skill_search_tag_text_trgm", "tag_text"),
+)
+
+# Initial population; kept in sync with app/repos/public_skill_search_repo.py at this revision.
+POPULATE_SQL = r"""
+INSERT INTO public_skill_search (
+    skill_id, name, slug, description, summary, is_official, github_stars, github_updated_at,
+    quality_score, trust_score, trust_level, trust_flags, trust_last_verified_at,
+    created_at, updated_at,
+    category_id, category_slug, tag_slugs, tag_text, trust_rank, views, favorites, popularity_score,
+    search_vector, embedding
+)
+SELECT
+    s.id, s.name, s.slug, s.description, s.summary, s.is_official,
+    s.github_stars, s.github_updated_at,
+    s.quality_score, s.trust_score, s.trust_level, s.trust_flags, s.trust_last_verified_at,
+    s.created_at, s.updated_at,
+    s.category_id, c.slug,
+    coalesce(t.slugs, ARRAY[]::varchar[]), coalesce(t.text, ''),
+    CASE s.trust_level WHEN 'ok' THEN 2 WHEN 'warning' THEN 1 ELSE 0 END,
+    coalesce(p.views, 0), coalesce(p.favorites, 0), coalesce(p.score, 0.0),
+    s.search_vector, s.embedding
+FROM skills s
+LEFT JOIN categories c ON c.id = s.category_id
+LEFT JOIN skill_popularity p ON p.skill_id = s.id
+LEFT JOIN LATERAL (
+    SELECT
+        array_agg(tg.slug ORDER BY tg.slug) AS slugs,
+        string_agg(tg.name || E'\n' || tg.slug, E'\n' ORDER BY tg.slug) AS text
+    FROM skill_tags st
+    JOIN tags tg ON tg.id = st.tag_id
+    WHERE st.skill_id = s.id
+) t ON TRUE
+WHERE s.is_official IS TRUE
+  AND s.is_verified IS TRUE
+  AND s.url IS NOT NULL
+  AND (
+    s.url ~* '^https://github\.com/[^/]+/[^/]+/blob/[^/]+/skills/[^/]+/SKILL\.md$'
+    OR s.url ~* '^https://github\.com/[^/]+/[^/]+/blob/[^/]+/\.claude/skills/[^/]+/SKILL\.md$'
+  )
+ON CONFLICT (skill_id) DO NOTHING
+"""
+
+
+def _has_table(table_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return table_name in inspector.get_table_names()
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    if not _has_table(TABLE):
+        op.create_table(
+            TABLE,
+            sa.Column(
+                "skill_id",
+                postgresql.UUID(as_uuid=True),
+                sa.ForeignKey("skills.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("slug", sa.String(), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("summary", sa.Text(), nullable=True),
+            sa.Column("is_official", sa.Boolean(), nullable=True),
+            sa.Column("github_stars", sa.Integer(), nullable=True),
+            sa.Column("github_updated_at", sa.DateTime(), nullable=True),
+            sa.Column("quality_score", sa.Float(), nullable=True),
+            sa.Column("trust_score", sa.Float(), nullable=True),
+            sa.Column("trust_level", sa.String(), nullable=True),
+            sa.Column("trust_flags", postgresql.JSONB(), nullable=True),
+            sa.Column("trust_last_verified_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("category_id", postgresql.UUID(as_uuid=True), nullable=True),
+            sa.Column("category_slug", sa.String(), nullable=True),
+            sa.Column("tag_slugs", postgresql.ARRAY(sa.String()), nullable=False),
+            sa.Column("tag_text", sa.Text(), nullable=False),
+            sa.Column("trust_rank", sa.SmallInteger(), nullable=False),
+            sa.Column("views", sa.Integer(), nullable=False),
+            sa.Column("favorites", sa.Integer(), nullable=False),
+            sa.Column("popularity_score", sa.Float(), nullable=False),
+            sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+            sa.Column("embedding", Vector(384), nullable=True),
+        )
+
+    op.execute(sa.text(POPULATE_SQL))
+
+    if not _has_index(TABLE, "ix_public_skill_search_embedding_hnsw"):
+        op.create_index(
+            "ix_public_skill_search_embedding_hnsw",
+            TABLE,
+            ["embedding"],
+            unique=False,
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_l2_ops"},
+        )
+    if not _has_index(TABLE, "ix_public_skill_search_search_vector"):
+        op.create_index(
+            "ix_public_skill_search_search_vector",
+            TABLE,
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+        )
+    if not _has_index(TABLE, "ix_public_skill_search_tag_slugs"):
+        op.create_index(
+            "ix_public_skill_search_tag_slugs",
+            TABLE,
+            ["tag_slugs"],
+            unique=False,
+            postgresql_using="gin",
+        )
+    for index_name, column_name in TRGM_INDEXES:
+        if not _has_index(TABLE, index_name):
+            op.create_index(
+                index_name,
+                TABLE,
+                [column_name],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column_name: "gin_trgm_ops"},
+            )
+    if not _has_index(TABLE, "ix_public_skill_search_category_slug"):
+        op.create_index(
+            "ix_public_skill_search_category_slug", TABLE, ["category_slug"], unique=False
+        )
+    if not _has_index(TABLE, "ix_public_skill_search_popularity"):
+        op.create_index(
+            "ix_public_skill_search_popularity",
+            TABLE,
+            ["popularity_score", "trust_rank"],
+            unique=False,
+        )
+    if not _has_index(TABLE, "ix_public_skill_search_created_at_id"):
+        op.create_index(
+            "ix_public_skill_search_created_at_id", TABLE, ["created_at", "skill_id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    if _has_table(TABLE):
+        op.drop_table(TABLE)
@@ -0,0 +1,72 @@
+"""Add precomputed skills.is_public visibility flag.
+
+Revision ID: b3f6c1d8e2a7
+Revises: a8e2d5c9f1b4
+Create Date: 2026-10-17 15:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f6c1d8e2a7"
+down_revision: Union[str, None] = "a8e2d5c9f1b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Public visibility policy at this revision (app/repos/public_filters.py).
+BACKFILL_SQL = r"""
+UPDATE skills
+SET is_public = (
+    is_official IS TRUE
+    AND is_verified IS TRUE
+    AND url IS NOT NULL
+    AND (
+        url ~* '^https://github\.com/[^/]+/[^/]+/blob/[^/]+/skills/[^/]+/SKILL\.md$'
+        OR url ~* '^https://github\.com/[^/]+/[^/]+/blob/[^/]+/\.claude/skills/[^/]+/SKILL\.md$'
+    )
+)
+"""
+
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(col["name"] == column_name for col in inspector.get_columns(table_name))
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    if not _has_column("skills", "is_public"):
+        op.add_column(
+            "skills",
+            sa.Column("is_public", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        )
+    op.execute(sa.text(BACKFILL_SQL))
+
+    if not _has_index("skills", "ix_skills_is_public"):
+        op.create_index("ix_skills_is_public", "skills", ["is_public"], unique=False)
+    if not _has_index("skills", "ix_skills_public_created_at_id"):
+        op.create_index(
+            "ix_skills_public_created_at_id",
+            "skills",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_where=sa.text("is_public"),
+        )
+
+
+def downgrade() -> None:
+    if _has_index("skills", "ix_skills_public_created_at_id"):
+        op.drop_index("ix_skills_public_created_at_id", table_name="skills")
+    if _has_index("skills", "ix_skills_is_public"):
+        op.drop_index("ix_skills_is_public", table_name="skills")
+    if _has_column("skills", "is_public"):
+        op.drop_column("skills", "is_public")
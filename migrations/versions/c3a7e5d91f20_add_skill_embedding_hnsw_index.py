@@ -0,0 +1,42 @@
+"""Add HNSW index on skills.embedding.
+
+Revision ID: c3a7e5d91f20
+Revises: b7d9a9e6c4f2
+Create Date: 2026-10-17 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a7e5d91f20"
+down_revision: Union[str, None] = "b7d9a9e6c4f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    if not _has_index("skills", "ix_skills_embedding_hnsw"):
+        op.create_index(
+            "ix_skills_embedding_hnsw",
+            "skills",
+            ["embedding"],
+            unique=False,
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_l2_ops"},
+        )
+
+
+def downgrade() -> None:
+    if _has_index("skills", "ix_skills_embedding_hnsw"):
+        op.drop_index("ix_skills_embedding_hnsw", table_name="skills")
@@ -0,0 +1,59 @@
+"""Add github_tree_index for incremental (tree/blob SHA) crawling.
+
+Revision ID: c4e7a2d9b5f1
+Revises: b3f6c1d8e2a7
+Create Date: 2026-10-17 16:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e7a2d9b5f1"
+down_revision: Union[str, None] = "b3f6c1d8e2a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "github_tree_index"
+
+
+def _has_table(table_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    if not _has_table(TABLE):
+        op.create_table(
+            TABLE,
+            sa.Column("repo_full_name", sa.String(), primary_key=True),
+            sa.Column("default_branch", sa.String(), nullable=False),
+            sa.Column("tree_sha", sa.String(), nullable=False),
+            sa.Column(
+                "blob_shas",
+                postgresql.JSONB(),
+                nullable=False,
+                server_default=sa.text("'{}'::jsonb"),
+            ),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("now()"),
+                nullable=False,
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("now()"),
+                nullable=False,
+            ),
+        )
+
+
+def downgrade() -> None:
+    if _has_table(TABLE):
+        op.drop_table(TABLE)
@@ -0,0 +1,88 @@
+"""Add full-text search vector and trigram indexes for keyword search.
+
+Revision ID: d4b8f2a6c1e3
+Revises: c3a7e5d91f20
+Create Date: 2026-10-17 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d4b8f2a6c1e3"
+down_revision: Union[str, None] = "c3a7e5d91f20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, "
+    "coalesce(name, '') || ' ' || coalesce(slug, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'C') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(content, '')), 'D')"
+)
+TRGM_INDEXES = (
+    ("ix_skills_name_trgm", "skills", "name"),
+    ("ix_skills_slug_trgm", "skills", "slug"),
+    ("ix_tags_name_trgm", "tags", "name"),
+    ("ix_tags_slug_trgm", "tags", "slug"),
+)
+
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(col["name"] == column_name for col in inspector.get_columns(table_name))
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    if not _has_column("skills", "search_vector"):
+        op.add_column(
+            "skills",
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+                nullable=True,
+            ),
+        )
+    if not _has_index("skills", "ix_skills_search_vector"):
+        op.create_index(
+            "ix_skills_search_vector",
+            "skills",
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+        )
+
+    for index_name, table_name, column_name in TRGM_INDEXES:
+        if not _has_index(table_name, index_name):
+            op.create_index(
+                index_name,
+                table_name,
+                [column_name],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column_name: "gin_trgm_ops"},
+            )
+
+
+def downgrade() -> None:
+    for index_name, table_name, _ in TRGM_INDEXES:
+        if _has_index(table_name, index_name):
+            op.drop_index(index_name, table_name=table_name)
+    if _has_index("skills", "ix_skills_search_vector"):
+        op.drop_index("ix_skills_search_vector", table_name="skills")
+    if _has_column("skills", "search_vector"):
+        op.drop_column("skills", "search_vector")
@@ -0,0 +1,153 @@
+"""Add url/repo/source columns to public_skill_search and re-project taxonomy renames.
+
+Revision ID: d5f8b3e1a7c2
+Revises: c4e7a2d9b5f1
+Create Date: 2026-10-17 20:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d5f8b3e1a7c2"
+down_revision: Union[str, None] = "c4e7a2d9b5f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "public_skill_search"
+
+# Kept in sync with app/repos/public_skill_search_repo.py at this revision.
+BACKFILL_SQL = r"""
+UPDATE public_skill_search AS ps
+SET
+    url = s.url,
+    repo_full_name = split_part(split_part(s.url, 'https://github.com/', 2), '/', 1) || '/' ||
+        split_part(split_part(s.url, 'https://github.com/', 2), '/', 2),
+    source_names = coalesce(src.names, ARRAY[]::varchar[])
+FROM skills s
+LEFT JOIN LATERAL (
+    SELECT array_agg(DISTINCT ss.name) AS names
+    FROM skill_source_links sl
+    JOIN skill_sources ss ON ss.id = sl.source_id
+    WHERE sl.skill_id = s.id
+) src ON TRUE
+WHERE s.id = ps.skill_id
+"""
+
+# One statement per execute (asyncpg runs each as a prepared statement).
+CATEGORY_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION public_skill_search_category_renamed() RETURNS trigger AS $$
+BEGIN
+    UPDATE public_skill_search SET category_slug = NEW.slug WHERE category_id = NEW.id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+CATEGORY_TRIGGER_SQL = """
+CREATE TRIGGER public_skill_search_category_renamed
+AFTER UPDATE OF slug ON categories
+FOR EACH ROW WHEN (OLD.slug IS DISTINCT FROM NEW.slug)
+EXECUTE FUNCTION public_skill_search_category_renamed()
+"""
+
+TAG_FUNCTION_SQL = r"""
+CREATE OR REPLACE FUNCTION public_skill_search_tag_renamed() RETURNS trigger AS $$
+BEGIN
+    UPDATE public_skill_search AS ps
+    SET tag_slugs = t.slugs, tag_text = t.text
+    FROM (
+        SELECT
+            st.skill_id,
+            array_agg(tg.slug ORDER BY tg.slug) AS slugs,
+            string_agg(tg.name || E'\n' || tg.slug, E'\n' ORDER BY tg.slug) AS text
+        FROM skill_tags st
+        JOIN tags tg ON tg.id = st.tag_id
+        WHERE st.skill_id IN (SELECT skill_id FROM skill_tags WHERE tag_id = NEW.id)
+        GROUP BY st.skill_id
+    ) t
+    WHERE ps.skill_id = t.skill_id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+TAG_TRIGGER_SQL = """
+CREATE TRIGGER public_skill_search_tag_renamed
+AFTER UPDATE OF name, slug ON tags
+FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name OR OLD.slug IS DISTINCT FROM NEW.slug)
+EXECUTE FUNCTION public_skill_search_tag_renamed()
+"""
+
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(col["name"] == column_name for col in inspector.get_columns(table_name))
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    if not _has_column(TABLE, "url"):
+        op.add_column(TABLE, sa.Column("url", sa.String(), nullable=True))
+    if not _has_column(TABLE, "repo_full_name"):
+        op.add_column(TABLE, sa.Column("repo_full_name", sa.String(), nullable=True))
+    if not _has_column(TABLE, "source_names"):
+        op.add_column(
+            TABLE,
+            sa.Column(
+                "source_names",
+                postgresql.ARRAY(sa.String()),
+                nullable=False,
+                server_default=sa.text("ARRAY[]::varchar[]"),
+            ),
+        )
+
+    op.execute(sa.text(BACKFILL_SQL))
+
+    if not _has_index(TABLE, "ix_public_skill_search_source_names"):
+        op.create_index(
+            "ix_public_skill_search_source_names",
+            TABLE,
+            ["source_names"],
+            unique=False,
+            postgresql_using="gin",
+        )
+    if not _has_index(TABLE, "ix_public_skill_search_repo_updated_at"):
+        op.create_index(
+            "ix_public_skill_search_repo_updated_at",
+            TABLE,
+            ["repo_full_name", "updated_at", "skill_id"],
+            unique=False,
+        )
+
+    op.execute(CATEGORY_FUNCTION_SQL)
+    op.execute("DROP TRIGGER IF EXISTS public_skill_search_category_renamed ON categories")
+    op.execute(CATEGORY_TRIGGER_SQL)
+    op.execute(TAG_FUNCTION_SQL)
+    op.execute("DROP TRIGGER IF EXISTS public_skill_search_tag_renamed ON tags")
+    op.execute(TAG_TRIGGER_SQL)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS public_skill_search_tag_renamed ON tags")
+    op.execute("DROP FUNCTION IF EXISTS public_skill_search_tag_renamed()")
+    op.execute("DROP TRIGGER IF EXISTS public_skill_search_category_renamed ON categories")
+    op.execute("DROP FUNCTION IF EXISTS public_skill_search_category_renamed()")
+    for index_name in (
+        "ix_public_skill_search_repo_updated_at",
+        "ix_public_skill_search_source_names",
+    ):
+        if _has_index(TABLE, index_name):
+            op.drop_index(index_name, table_name=TABLE)
+    for column_name in ("source_names", "repo_full_name", "url"):
+        if _has_column(TABLE, column_name):
+            op.drop_column(TABLE, column_name)
@@ -0,0 +1,38 @@
+"""Add composite (created_at, id) index on skills for keyset pagination.
+
+Revision ID: e5c9a3b7d2f4
+Revises: d4b8f2a6c1e3
+Create Date: 2026-10-17 11:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5c9a3b7d2f4"
+down_revision: Union[str, None] = "d4b8f2a6c1e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    if not _has_index("skills", "ix_skills_created_at_id"):
+        op.create_index(
+            "ix_skills_created_at_id",
+            "skills",
+            ["created_at", "id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    if _has_index("skills", "ix_skills_created_at_id"):
+        op.drop_index("ix_skills_created_at_id", table_name="skills")
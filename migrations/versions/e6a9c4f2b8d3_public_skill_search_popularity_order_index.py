@@ -0,0 +1,54 @@
+"""Index the full popularity keyset order of public_skill_search.
+
+Revision ID: e6a9c4f2b8d3
+Revises: d5f8b3e1a7c2
+Create Date: 2026-10-17 21:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6a9c4f2b8d3"
+down_revision: Union[str, None] = "d5f8b3e1a7c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "public_skill_search"
+OLD_INDEX = "ix_public_skill_search_popularity"
+NEW_INDEX = "ix_public_skill_search_popularity_order"
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(idx["name"] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    # Same expressions as `public_skill_sort_keys("popularity")`; the all-DESC keyset
+    # `(..) < (..)` is answered by a backward scan of this index.
+    if not _has_index(TABLE, NEW_INDEX):
+        op.create_index(
+            NEW_INDEX,
+            TABLE,
+            [
+                "popularity_score",
+                "trust_rank",
+                sa.text("coalesce(trust_score, 0.0)"),
+                "updated_at",
+                "skill_id",
+            ],
+            unique=False,
+        )
+    if _has_index(TABLE, OLD_INDEX):
+        op.drop_index(OLD_INDEX, table_name=TABLE)
+
+
+def downgrade() -> None:
+    if not _has_index(TABLE, OLD_INDEX):
+        op.create_index(OLD_INDEX, TABLE, ["popularity_score", "trust_rank"], unique=False)
+    if _has_index(TABLE, NEW_INDEX):
+        op.drop_index(NEW_INDEX, table_name=TABLE)
@@ -0,0 +1,48 @@
+"""Add embedding input hash + model version to skills.
+
+Revision ID: f7a1c4e8b3d6
+Revises: e5c9a3b7d2f4
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a1c4e8b3d6"
+down_revision: Union[str, None] = "e5c9a3b7d2f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every vector stored before this revision came from the sentence-transformers MiniLM model.
+LEGACY_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(col["name"] == column_name for col in inspector.get_columns(table_name))
+
+
+def upgrade() -> None:
+    if not _has_column("skills", "embedding_input_hash"):
+        op.add_column(
+            "skills", sa.Column("embedding_input_hash", sa.String(length=64), nullable=True)
+        )
+    if not _has_column("skills", "embedding_model"):
+        op.add_column("skills", sa.Column("embedding_model", sa.String(), nullable=True))
+    op.execute(
+        sa.text(
+            "UPDATE skills SET embedding_model = :model "
+            "WHERE embedding IS NOT NULL AND embedding_model IS NULL"
+        ).bindparams(model=LEGACY_EMBEDDING_MODEL)
+    )
+
+
+def downgrade() -> None:
+    if _has_column("skills", "embedding_model"):
+        op.drop_column("skills", "embedding_model")
+    if _has_column("skills", "embedding_input_hash"):
+        op.drop_column("skills", "embedding_input_hash")
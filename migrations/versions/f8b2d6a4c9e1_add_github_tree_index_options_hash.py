@@ -0,0 +1,40 @@
+"""Store the scan-options fingerprint with each github_tree_index entry.
+
+Revision ID: f8b2d6a4c9e1
+Revises: e6a9c4f2b8d3
+Create Date: 2026-10-17 22:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f8b2d6a4c9e1"
+down_revision: Union[str, None] = "e6a9c4f2b8d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "github_tree_index"
+
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(col["name"] == column_name for col in inspector.get_columns(table_name))
+
+
+def upgrade() -> None:
+    # Existing entries get "" (never a real fingerprint), so each repo is fetched in full
+    # once and re-indexed with its source's current options.
+    if not _has_column(TABLE, "options_hash"):
+        op.add_column(
+            TABLE,
+            sa.Column("options_hash", sa.String(), nullable=False, server_default=""),
+        )
+
+
+def downgrade() -> None:
+    if _has_column(TABLE, "options_hash"):
+        op.drop_column(TABLE, "options_hash")
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Compare embedding backends on the stored skill catalog.
+
+Reports, per backend:
+- throughput: catalog texts encoded per second (batched)
+- latency: single-query encode p50/p95 (the API search path)
+- recall@10: overlap of each query's 10 nearest catalog neighbours (L2, like pgvector `<->`)
+  with the neighbours produced by the baseline backend
+
+Usage:
+    python scripts/benchmark_embeddings.py --backends sentence-transformers,onnx --limit 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.db.session import AsyncSessionLocal  # noqa: E402
+from app.llm.embedding_providers import create_provider, provider_version  # noqa: E402
+from app.models.skill import Skill  # noqa: E402
+from app.settings import get_settings  # noqa: E402
+
+
+@dataclass
+class BackendResult:
+    backend: str
+    version: str
+    load_s: float
+    catalog_size: int
+    throughput_per_s: float
+    p50_ms: float
+    p95_ms: float
+    recall_at_10: float
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Return percentile with linear interpolation."""
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    sorted_values = sorted(values)
+    index = (len(sorted_values) - 1) * p
+    lower = int(index)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    if lower == upper:
+        return sorted_values[lower]
+    weight = index - lower
+    return (sorted_values[lower] * (1.0 - weight)) + (sorted_values[upper] * weight)
+
+
+async def load_catalog(limit: int) -> tuple[list[str], list[str]]:
+    """(embedding input texts, skill names) for the most recently updated skills."""
+    async with AsyncSessionLocal() as db:
+        stmt = (
+            select(Skill.name, Skill.description, Skill.summary, Skill.use_cases)
+            .where(Skill.description.is_not(None))
+            .order_by(Skill.updated_at.desc())
+            .limit(limit)
+        )
+        rows = (await db.execute(stmt)).all()
+    texts = [
+        f"{name or ''} {description or ''} {summary or ''} {' '.join(use_cases or [])}".strip()
+        for name, description, summary, use_cases in rows
+    ]
+    return texts, [str(row[0] or "") for row in rows]
+
+
+def top_k(queries: np.ndarray, catalog: np.ndarray, k: int) -> np.ndarray:
+    # Squared L2 distance; ranking matches pgvector l2 distance.
+    distances = (
+        (queries**2).sum(axis=1, keepdims=True)
+        - 2.0 * queries @ catalog.T
+        + (catalog**2).sum(axis=1)[None, :]
+    )
+    k = min(k, catalog.shape[0])
+    return np.argsort(distances, axis=1)[:, :k]
+
+
+def recall_at_k(baseline: np.ndarray, candidate: np.ndarray) -> float:
+    if baseline.size == 0:
+        return 0.0
+    hits = [len(set(b.tolist()) & set(c.tolist())) / len(b) for b, c in zip(baseline, candidate)]
+    return float(statistics.mean(hits))
+
+
+def run_backend(
+    backend: str,
+    *,
+    texts: list[str],
+    queries: list[str],
+    batch_size: int,
+    warmup: int,
+) -> tuple[BackendResult, np.ndarray]:
+    settings = get_settings().model_copy(update={"embedding_backend": backend})
+    started = time.perf_counter()
+    provider = create_provider(settings)
+    load_s = time.perf_counter() - started
+
+    for _ in range(warmup):
+        provider.encode(queries[:1] or ["warm up"], batch_size=1)
+
+    started = time.perf_counter()
+    catalog = provider.encode(texts, batch_size=batch_size)
+    elapsed = time.perf_counter() - started
+
+    latencies: list[float] = []
+    query_vectors = []
+    for query in queries:
+        started = time.perf_counter()
+        query_vectors.append(provider.encode([query], batch_size=1)[0])
+        latencies.append((time.perf_counter() - started) * 1000.0)
+
+    neighbours = (
+        top_k(np.vstack(query_vectors), catalog, 10) if query_vectors else np.empty((0, 10))
+    )
+    result = BackendResult(
+        backend=backend,
+        version=provider_version(settings),
+        load_s=load_s,
+        catalog_size=len(texts),
+        throughput_per_s=(len(texts) / elapsed) if elapsed > 0 else 0.0,
+        p50_ms=percentile(latencies, 0.50),
+        p95_ms=percentile(latencies, 0.95),
+        recall_at_10=1.0,
+    )
+    return result, neighbours
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark embedding backends on the skill catalog."
+    )
+    parser.add_argument("--backends", default="sentence-transformers,onnx")
+    parser.add_argument("--limit", type=int, default=2000, help="Catalog rows to encode")
+    parser.add_argument("--queries", type=int, default=200, help="Skill names used as queries")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Print JSON output only")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    backends = [part.strip() for part in args.backends.split(",") if part.strip()]
+    if not backends:
+        raise SystemExit("At least one backend is required.")
+
+    texts, names = asyncio.run(load_catalog(args.limit))
+    if not texts:
+        raise SystemExit("No skills with descriptions found.")
+    queries = [name for name in names if name][: args.queries]
+
+    results: list[BackendResult] = []
+    baseline_neighbours = None
+    for backend in backends:
+        result, neighbours = run_backend(
+            backend,
+            texts=texts,
+            queries=queries,
+            batch_size=args.batch_size,
+            warmup=args.warmup,
+        )
+        if baseline_neighbours is None:
+            baseline_neighbours = neighbours
+        else:
+            result.recall_at_10 = recall_at_k(baseline_neighbours, neighbours)
+        results.append(result)
+
+    if args.json:
+        print(json.dumps([asdict(item) for item in results], ensure_ascii=False, indent=2))
+        return 0
+
+    print("Embedding Backend Benchmark")
+    print(f"- catalog: {len(texts)} skills, queries: {len(queries)}, batch_size: {args.batch_size}")
+    print(f"- recall@10 baseline: {backends[0]}")
+    print("")
+    for item in results:
+        print(f"[{item.backend}] {item.version}")
+        print(f"  load_s: {item.load_s:.2f}")
+        print(f"  throughput_per_s: {item.throughput_per_s:.1f}")
+        print(f"  p50_ms: {item.p50_ms:.2f}")
+        print(f"  p95_ms: {item.p95_ms:.2f}")
+        print(f"  recall_at_10: {item.recall_at_10:.4f}")
+        print("")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Measure cached-hit throughput of the Redis L2 response cache against a local Redis.
+
+Seeds `--entries` response entries (pre-compressed like real cache writes), then runs
+`--requests` hit lookups at each concurrency level and reports ops/s and latency:
+- `get`: one `get_entry` (HMGET) per request, the per-request API hit path
+- `batch`: `get_entries` for `--batch` keys per call (one pipelined round trip)
+
+Usage:
+    python scripts/benchmark_redis_cache.py --url redis://localhost:6379/0 --concurrency 1,32,256
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.cache.redis_l2 import RedisL2Cache  # noqa: E402
+from app.cache.response_body import encode_body, render_json  # noqa: E402
+from app.settings import get_settings  # noqa: E402
+
+BENCH_PREFIX = "skills-marketplace-bench"
+
+
+@dataclass
+class LevelResult:
+    mode: str
+    concurrency: int
+    requests: int
+    keys_per_request: int
+    ops_per_s: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    misses: int
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Return percentile with linear interpolation."""
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    sorted_values = sorted(values)
+    index = (len(sorted_values) - 1) * p
+    lower = int(index)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    if lower == upper:
+        return sorted_values[lower]
+    weight = index - lower
+    return (sorted_values[lower] * (1.0 - weight)) + (sorted_values[upper] * weight)
+
+
+def sample_payload(index: int, body_kb: int) -> dict:
+    # Skill list-like JSON; repeated text compresses roughly like real pages.
+    item = {"id": f"skill-{index}", "name": f"Skill {index}", "description": "x" * 200}
+    return {"items": [item] * max(1, (body_kb * 1024) // 260), "page": 1, "size": 20}
+
+
+async def seed(cache: RedisL2Cache, *, entries: int, body_kb: int) -> list[str]:
+    keys = []
+    for index in range(entries):
+        key = cache.key(namespace="bench", suffix=f"/api/skills?page={index}")
+        bodies = encode_body(render_json(sample_payload(index, body_kb)))
+        await cache.set_entry(key, bodies, soft_ttl_seconds=3600, hard_ttl_seconds=3600)
+        keys.append(key)
+    return keys
+
+
+async def run_level(
+    cache: RedisL2Cache,
+    keys: list[str],
+    *,
+    mode: str,
+    concurrency: int,
+    requests: int,
+    batch: int,
+) -> LevelResult:
+    latencies: list[float] = []
+    misses = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, misses
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            if mode == "batch":
+                entries = await cache.get_entries(random.sample(keys, batch), encodings=["gzip"])
+                misses += sum(1 for entry in entries if entry is None)
+            else:
+                entry = await cache.get_entry(random.choice(keys), encodings=["gzip"])
+                misses += entry is None
+            latencies.append((time.perf_counter() - started) * 1000.0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    per_request = batch if mode == "batch" else 1
+    return LevelResult(
+        mode=mode,
+        concurrency=concurrency,
+        requests=len(latencies),
+        keys_per_request=per_request,
+        ops_per_s=(len(latencies) * per_request / elapsed) if elapsed > 0 else 0.0,
+        p50_ms=percentile(latencies, 0.50),
+        p95_ms=percentile(latencies, 0.95),
+        p99_ms=percentile(latencies, 0.99),
+        misses=misses,
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark Redis L2 cached-hit throughput.")
+    parser.add_argument("--url", default="redis://localhost:6379/0")
+    parser.add_argument("--concurrency", default="1,32,256")
+    parser.add_argument("--modes", default="get,batch")
+    parser.add_argument("--requests", type=int, default=5000, help="Lookups per concurrency level")
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--body-kb", type=int, default=20, help="Approximate JSON body size")
+    parser.add_argument("--batch", type=int, default=10, help="Keys per call in batch mode")
+    parser.add_argument(
+        "--max-connections", type=int, default=None, help="Override REDIS_MAX_CONNECTIONS"
+    )
+    parser.add_argument("--timeout-ms", type=int, default=1000, help="Command + pool wait timeout")
+    parser.add_argument("--json", action="store_true", help="Print JSON output only")
+    return parser.parse_args()
+
+
+async def main_async(args: argparse.Namespace) -> list[LevelResult]:
+    # RedisL2Cache.init() reads settings; point them at the benchmark Redis and prefix.
+    os.environ.update(
+        {
+            "REDIS_URL": args.url,
+            "REDIS_CACHE_ENABLED": "true",
+            "REDIS_CACHE_PREFIX": BENCH_PREFIX,
+            "REDIS_CACHE_TIMEOUT_MS": str(args.timeout_ms),
+        }
+    )
+    if args.max_connections is not None:
+        os.environ["REDIS_MAX_CONNECTIONS"] = str(args.max_connections)
+    get_settings.cache_clear()
+
+    cache = RedisL2Cache()
+    await cache.init()
+    if not cache.enabled():
+        raise SystemExit(f"Cannot connect to Redis at {args.url}")
+
+    results: list[LevelResult] = []
+    try:
+        keys = await seed(cache, entries=args.entries, body_kb=args.body_kb)
+        levels = [int(part) for part in args.concurrency.split(",") if part.strip()]
+        modes = [part.strip() for part in args.modes.split(",") if part.strip()]
+        for mode in modes:
+            for concurrency in levels:
+                results.append(
+                    await run_level(
+                        cache,
+                        keys,
+                        mode=mode,
+                        concurrency=concurrency,
+                        requests=args.requests,
+                        batch=min(args.batch, len(keys)),
+                    )
+                )
+    finally:
+        await cache.close()
+    return results
+
+
+def main() -> int:
+    args = parse_args()
+    results = asyncio.run(main_async(args))
+
+    if args.json:
+        print(json.dumps([asdict(item) for item in results], ensure_ascii=False, indent=2))
+        return 0
+
+    print("Redis L2 Cached-Hit Benchmark")
+    print(f"- url: {args.url}, entries: {args.entries}, body: ~{args.body_kb} KB")
+    print(f"- max_connections: {get_settings().redis_max_connections} per client")
+    print("")
+    for item in results:
+        print(f"[{item.mode}] concurrency={item.concurrency} keys/request={item.keys_per_request}")
+        print(f"  ops_per_s: {item.ops_per_s:.0f}")
+        print(f"  p50_ms: {item.p50_ms:.2f}")
+        print(f"  p95_ms: {item.p95_ms:.2f}")
+        print(f"  p99_ms: {item.p99_ms:.2f}")
+        print(f"  misses: {item.misses}")
+        print("")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Check that precomputed public visibility matches the visibility policy.
+
+Reports:
+- skills whose stored `is_public` disagrees with the policy
+  (official + verified + SKILL.md URL regexes)
+- public skills missing from `public_skill_search`, and projection rows of skills
+  that are not public
+
+Exit code 0 when everything is consistent, 1 otherwise. `--fix` recomputes `is_public` for the
+mismatched skills, re-projects every affected row and bumps the catalog cache version.
+
+Usage:
+    python scripts/check_public_visibility.py [--fix] [--sample 20] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from sqlalchemy import and_, case, select, update
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.cache.redis_l2 import CATALOG_VERSION, redis_l2_cache  # noqa: E402
+from app.db.session import AsyncSessionLocal  # noqa: E402
+from app.models.public_skill_search import PublicSkillSearch  # noqa: E402
+from app.models.skill import Skill  # noqa: E402
+from app.repos.public_filters import (  # noqa: E402
+    public_skill_policy_conditions,
+    public_visibility_mismatch_condition,
+)
+from app.repos.public_skill_search_repo import refresh_public_skill_search  # noqa: E402
+
+
+@dataclass
+class VisibilityReport:
+    is_public_mismatches: int = 0
+    projection_missing: int = 0
+    projection_stale: int = 0
+    samples: dict[str, list[str]] = field(default_factory=dict)
+    fixed: int = 0
+
+    @property
+    def consistent(self) -> bool:
+        return not (self.is_public_mismatches or self.projection_missing or self.projection_stale)
+
+
+async def _ids_and_slugs(db, stmt) -> list[tuple]:
+    return list((await db.execute(stmt)).all())
+
+
+async def check(db) -> tuple[VisibilityReport, set]:
+    """Build the report and the set of skill ids that need fixing."""
+    projected = (
+        select(PublicSkillSearch.skill_id).where(PublicSkillSearch.skill_id == Skill.id).exists()
+    )
+
+    mismatched = await _ids_and_slugs(
+        db,
+        select(Skill.id, Skill.slug)
+        .where(public_visibility_mismatch_condition())
+        .order_by(Skill.slug),
+    )
+    missing = await _ids_and_slugs(
+        db,
+        select(Skill.id, Skill.slug)
+        .where(Skill.is_public.is_(True), ~projected)
+        .order_by(Skill.slug),
+    )
+    stale = await _ids_and_slugs(
+        db,
+        select(PublicSkillSearch.skill_id, PublicSkillSearch.slug)
+        .outerjoin(Skill, Skill.id == PublicSkillSearch.skill_id)
+        .where(Skill.is_public.is_not(True))
+        .order_by(PublicSkillSearch.slug),
+    )
+
+    report = VisibilityReport(
+        is_public_mismatches=len(mismatched),
+        projection_missing=len(missing),
+        projection_stale=len(stale),
+        samples={
+            "is_public_mismatches": [row[1] for row in mismatched],
+            "projection_missing": [row[1] for row in missing],
+            "projection_stale": [row[1] for row in stale],
+        },
+    )
+    return report, {row[0] for row in mismatched + missing + stale}
+
+
+async def fix(db, skill_ids: set) -> int:
+    policy = and_(*public_skill_policy_conditions())
+    await db.execute(
+        update(Skill)
+        .where(Skill.id.in_(skill_ids))
+        .values(is_public=case((policy, True), else_=False))
+        .execution_options(synchronize_session=False)
+    )
+    await refresh_public_skill_search(db, skill_ids)
+    await db.commit()
+    return len(skill_ids)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check skills.is_public and public_skill_search consistency."
+    )
+    parser.add_argument(
+        "--fix", action="store_true", help="Recompute and re-project inconsistent rows"
+    )
+    parser.add_argument("--sample", type=int, default=20, help="Slugs listed per check")
+    parser.add_argument("--json", action="store_true", help="Print JSON output only")
+    return parser.parse_args()
+
+
+async def main_async(args: argparse.Namespace) -> VisibilityReport:
+    async with AsyncSessionLocal() as db:
+        report, skill_ids = await check(db)
+        if args.fix and skill_ids:
+            report.fixed = await fix(db, skill_ids)
+            await redis_l2_cache.init()
+            try:
+                await redis_l2_cache.bump_namespaces(CATALOG_VERSION)
+            finally:
+                await redis_l2_cache.close()
+    report.samples = {name: slugs[: max(args.sample, 0)] for name, slugs in report.samples.items()}
+    return report
+
+
+def main() -> int:
+    args = parse_args()
+    report = asyncio.run(main_async(args))
+
+    if args.json:
+        print(
+            json.dumps(
+                {**asdict(report), "consistent": report.consistent}, ensure_ascii=False, indent=2
+            )
+        )
+    else:
+        print("Public Visibility Check")
+        print(f"- is_public mismatches: {report.is_public_mismatches}")
+        print(f"- public skills missing from public_skill_search: {report.projection_missing}")
+        print(f"- public_skill_search rows for hidden skills: {report.projection_stale}")
+        for name, slugs in report.samples.items():
+            if slugs:
+                print(f"  {name}: {', '.join(slugs)}")
+        if report.fixed:
+            print(f"- fixed: {report.fixed} skills recomputed and re-projected")
+    if report.consistent or report.fixed:
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,7 +1,57 @@
 import sys
 from pathlib import Path
 
+import pytest
+from sqlalchemy.dialects import postgresql
+
 ROOT = Path(__file__).resolve().parents[1]
 root_str = str(ROOT)
 if root_str not in sys.path:
     sys.path.insert(0, root_str)
+
+
+class FakeResult:
+    rowcount = 1
+
+    def __init__(self, rows=()):
+        self._rows = list(rows)
+
+    def all(self):
+        return list(self._rows)
+
+    def scalar_one(self):
+        return self._rows[0][0]
+
+
+class FakeSession:
+    """AsyncSession stand-in: records compiled SQL/params and replays queued result rows."""
+
+    def __init__(self, responses=()):
+        self.responses = list(responses)
+        self.statements: list[str] = []
+        self.params: list[dict] = []
+        self.flushed = 0
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        self.params.append(params or {})
+        return FakeResult(self.responses.pop(0) if self.responses else ())
+
+    async def flush(self):
+        self.flushed += 1
+
+    async def commit(self):
+        self.committed = True
+
+
+@pytest.fixture
+def fake_session():
+    """`FakeSession` class; call it for a session or pass it as a `session_factory`."""
+    return FakeSession
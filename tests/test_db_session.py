@@ -0,0 +1,34 @@
+from app.db.session import connect_args, engine_options
+from app.settings import Settings
+
+
+def test_pooler_mode_disables_prepared_statements():
+    settings = Settings(db_connection_mode="pooler")
+    assert connect_args(settings) == {"prepared_statement_cache_size": 0, "statement_cache_size": 0}
+    # Unknown modes fall back to the pooler-safe settings.
+    assert connect_args(Settings(db_connection_mode="bogus"))["statement_cache_size"] == 0
+
+
+def test_direct_mode_and_pool_sizing():
+    settings = Settings(
+        db_connection_mode="Direct",
+        db_statement_cache_size=250,
+        db_pool_size=20,
+        db_max_overflow=5,
+        db_pool_timeout_seconds=10,
+        db_pool_recycle_seconds=0,
+    )
+    options = engine_options(settings)
+    assert options["connect_args"] == {"statement_cache_size": 250}
+    assert (options["pool_size"], options["max_overflow"], options["pool_timeout"]) == (20, 5, 10)
+    assert options["pool_recycle"] == -1
+
+
+def test_public_routers_read_from_replica_session():
+    from app.api import packs, plugins, rankings, skills, taxonomy
+    from app.api.deps import get_read_db
+
+    for module in (skills, packs, plugins, taxonomy, rankings):
+        for route in module.router.routes:
+            db_calls = {dep.call for dep in route.dependant.dependencies if dep.name == "db"}
+            assert db_calls <= {get_read_db}, (module.__name__, route.path)
@@ -0,0 +1,173 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from app.llm import embeddings
+from app.llm.embedding_providers import mean_pool_normalize, provider_version
+
+
+class _FakeProvider:
+    name = "fake"
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, *, batch_size):
+        self.calls.append(list(texts))
+        return np.array([[float(len(text)), 0.0] for text in texts], dtype=np.float32)
+
+
+def test_encode_many_sync_batches_and_skips_blank_texts(monkeypatch):
+    model = _FakeProvider()
+    monkeypatch.setattr(embeddings, "_embedding_provider", model)
+    monkeypatch.setattr(embeddings.get_settings(), "embedding_batch_size", 2)
+
+    vectors = embeddings.encode_many_sync(["ab", "", "abc", None, "  a  "])
+
+    assert model.calls == [["ab", "abc"], ["a"]]
+    assert vectors == [[2.0, 0.0], None, [3.0, 0.0], None, [1.0, 0.0]]
+
+
+def test_model_state_disabled_when_mode_off(monkeypatch):
+    monkeypatch.setattr(embeddings.get_settings(), "embedding_mode", "off")
+    assert embeddings.embeddings_enabled() is False
+    assert embeddings.model_state() == "disabled"
+
+
+def test_importing_api_does_not_import_sentence_transformers():
+    code = "import sys, app.main; print('sentence_transformers' in sys.modules)"
+    root = Path(__file__).resolve().parents[1]
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=root
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_mean_pool_normalize_ignores_padding_tokens():
+    tokens = np.array([[[3.0, 4.0], [100.0, 100.0]]], dtype=np.float32)
+    mask = np.array([[1, 0]])
+    assert np.allclose(mean_pool_normalize(tokens, mask), [[0.6, 0.8]])
+
+
+def test_provider_version_distinguishes_backends(monkeypatch):
+    settings = embeddings.get_settings()
+    assert provider_version(settings) == settings.embedding_model_name
+    monkeypatch.setattr(settings, "embedding_backend", "onnx")
+    assert provider_version(settings) == f"{settings.embedding_model_name}+onnx:model_qint8_avx2"
+
+
+def test_queue_skill_embedding_reuses_vector_for_unchanged_text_and_model():
+    from types import SimpleNamespace
+
+    from app.workers.ingest_and_parse import _queue_skill_embedding
+
+    skill = SimpleNamespace(
+        name="pdf",
+        description="Read PDFs",
+        spec={"derived_description": "PDF tools"},
+        use_cases=["extract", "merge"],
+        embedding=[0.1] * 384,
+        embedding_input_hash=None,
+        embedding_model=embeddings.embedding_model_version(),
+    )
+    text = embeddings.skill_embedding_text(
+        name="pdf",
+        description="Read PDFs",
+        derived_description="PDF tools",
+        use_cases=["extract", "merge"],
+    )
+    assert text == "pdf Read PDFs PDF tools extract merge"
+
+    queue = []
+    assert _queue_skill_embedding(queue, skill) is True
+    skill.embedding_input_hash = embeddings.embedding_input_hash(text)
+    assert _queue_skill_embedding(queue, skill) is False
+    skill.embedding_model = "another-model"
+    assert _queue_skill_embedding(queue, skill) is True
+    assert queue == [(skill, text), (skill, text)]
+
+
+def test_embedding_model_ready_states(monkeypatch):
+    settings = embeddings.get_settings()
+    monkeypatch.setattr(settings, "embedding_mode", "warm")
+    for state, ready in (
+        ("not_loaded", False),
+        ("loading", False),
+        ("error", False),
+        ("ready", True),
+    ):
+        monkeypatch.setattr(embeddings, "_model_state", state)
+        assert embeddings.embedding_model_ready() is ready
+
+    monkeypatch.setattr(settings, "embedding_mode", "lazy")
+    monkeypatch.setattr(embeddings, "_model_state", "not_loaded")
+    assert embeddings.embedding_model_ready() is True
+    monkeypatch.setattr(embeddings, "_model_state", "error")
+    assert embeddings.embedding_model_ready() is True
+
+
+def test_readiness_endpoint_returns_503_until_the_model_is_ready(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.main import create_app
+
+    monkeypatch.setattr(embeddings.get_settings(), "embedding_mode", "warm")
+    client = TestClient(create_app())  # no lifespan: nothing starts loading
+
+    monkeypatch.setattr(embeddings, "_model_state", "error")
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json() == {
+        "ready": False,
+        "embedding_model": {"mode": "warm", "state": "error"},
+    }
+    health = client.get("/health")
+    assert health.status_code == 200 and health.json()["ready"] is False
+
+    monkeypatch.setattr(embeddings, "_model_state", "ready")
+    assert client.get("/health/ready").status_code == 200
+
+
+def test_lazy_replica_stays_ready_after_a_failed_model_load(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.main import create_app
+
+    monkeypatch.setattr(embeddings.get_settings(), "embedding_mode", "lazy")
+    monkeypatch.setattr(embeddings, "_model_state", "error")
+    client = TestClient(create_app())
+
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {
+        "ready": True,
+        "embedding_model": {"mode": "lazy", "state": "error"},
+    }
+    health = client.get("/health").json()
+    assert health["status"] == "degraded" and health["ready"] is True
+
+
+def test_failed_embedding_batch_marks_rows_for_the_backfill(monkeypatch):
+    import asyncio
+    from types import SimpleNamespace
+
+    from app.workers import ingest_and_parse
+
+    async def failing_encode(texts):
+        raise RuntimeError("provider down")
+
+    monkeypatch.setattr(ingest_and_parse, "encode_many", failing_encode)
+    skill = SimpleNamespace(
+        embedding=[0.1] * 384,
+        embedding_input_hash="old-text-hash",
+        embedding_model=embeddings.embedding_model_version(),
+    )
+    queue = [(skill, "new text")]
+
+    assert asyncio.run(ingest_and_parse._apply_embeddings(queue)) == 0
+    assert queue == []
+    # The old vector keeps serving, but the row no longer looks up to date.
+    assert skill.embedding == [0.1] * 384
+    assert skill.embedding_input_hash is None
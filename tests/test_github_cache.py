@@ -0,0 +1,103 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+
+from app.ingest import github_cache
+from app.ingest.github_cache import GithubResponseCache, compact_tree
+from app.parsers.github_repo_scanner import list_repo_skills_candidates
+
+
+def _github_transport(seen: list[dict]):
+    tree = {
+        "sha": "tree1",
+        "truncated": False,
+        "tree": [
+            {"path": "skills", "type": "tree", "sha": "d1", "mode": "040000"},
+            {
+                "path": "skills/a/SKILL.md",
+                "type": "blob",
+                "sha": "b1",
+                "mode": "100644",
+                "size": 10,
+                "url": "u",
+            },
+            {
+                "path": "skills/b/SKILL.md",
+                "type": "blob",
+                "sha": "b2",
+                "mode": "100644",
+                "size": 10,
+                "url": "u",
+            },
+        ],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(dict(request.headers))
+        etag = '"tree"' if "/git/trees/" in request.url.path else '"repo"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        if "/git/trees/" in request.url.path:
+            return httpx.Response(200, json=tree, headers={"ETag": etag})
+        repo = {
+            "full_name": "acme/skills",
+            "description": "agent skills",
+            "default_branch": "main",
+            "id": 1,
+        }
+        return httpx.Response(200, json=repo, headers={"ETag": etag})
+
+    return httpx.MockTransport(handler)
+
+
+def test_scanner_serves_not_modified_repos_from_the_cache(monkeypatch, fake_session):
+    store: dict[str, SimpleNamespace] = {}
+
+    async def fake_get(db, url):
+        return store.get(url)
+
+    async def fake_store(db, url, *, etag, last_modified, data):
+        store[url] = SimpleNamespace(etag=etag, last_modified=last_modified, data=data)
+
+    monkeypatch.setattr(github_cache, "get_cached_response", fake_get)
+    monkeypatch.setattr(github_cache, "store_cached_response", fake_store)
+    seen: list[dict] = []
+    cache = GithubResponseCache(session_factory=fake_session)
+
+    async def scan() -> list[dict]:
+        async with httpx.AsyncClient(transport=_github_transport(seen)) as client:
+            return await list_repo_skills_candidates(
+                "acme/skills", min_repo_type="not_skills", client=client, response_cache=cache
+            )
+
+    before = github_cache.github_cache_stats.snapshot()
+    first = asyncio.run(scan())
+    second = asyncio.run(scan())
+    stats = github_cache.github_cache_stats.since(before)
+
+    assert [c["sha"] for c in first] == ["b1", "b2"]
+    assert second == first
+    assert "if-none-match" not in seen[0] and seen[2]["if-none-match"] == '"repo"'
+    assert (stats.requests, stats.conditional, stats.not_modified) == (4, 2, 2)
+    tree_entry = next(v for k, v in store.items() if "/git/trees/" in k)
+    assert tree_entry.data["tree"] == [
+        {"path": "skills/a/SKILL.md", "type": "blob", "sha": "b1"},
+        {"path": "skills/b/SKILL.md", "type": "blob", "sha": "b2"},
+    ]
+
+
+def test_cache_is_skipped_when_the_database_is_unavailable():
+    def broken_session():
+        raise RuntimeError("db down")
+
+    cache = GithubResponseCache(session_factory=broken_session)
+
+    async def run():
+        async with httpx.AsyncClient(transport=_github_transport([])) as client:
+            return await cache.get_json(
+                client, "https://api.github.com/repos/acme/skills", headers={}
+            )
+
+    assert asyncio.run(run())["default_branch"] == "main"
+    assert compact_tree({})["tree"] == []
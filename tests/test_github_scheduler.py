@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.ingest.github_scheduler import (
+    CORE,
+    RAW,
+    SEARCH,
+    GithubRateLimitError,
+    GithubScheduler,
+    RateBucket,
+    bucket_for_url,
+    rate_limit_wait,
+)
+
+
+def test_bucket_for_url():
+    assert bucket_for_url("https://api.github.com/repos/a/b/git/trees/main?recursive=1") == CORE
+    assert bucket_for_url("https://api.github.com/search/code?q=x") == SEARCH
+    assert bucket_for_url("https://raw.githubusercontent.com/a/b/main/SKILL.md") == RAW
+    assert bucket_for_url("https://skillsdir.dev/sitemap.xml") is None
+
+
+def test_rate_limit_wait_reads_retry_after_and_reset():
+    now = 1_000.0
+    assert rate_limit_wait(httpx.Response(403, headers={"Retry-After": "30"}), now) == 30.0
+    reset = httpx.Response(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1120"})
+    assert rate_limit_wait(reset, now) == 120.0
+    assert rate_limit_wait(httpx.Response(429), now) == 60.0
+    assert rate_limit_wait(httpx.Response(403), now) is None
+    assert rate_limit_wait(httpx.Response(200, headers={"Retry-After": "5"}), now) is None
+
+
+def test_empty_bucket_serves_waiters_by_priority_after_reset():
+    granted: list[int] = []
+
+    async def run() -> None:
+        bucket = RateBucket(CORE, limit=3, window_seconds=0.05)
+        bucket.remaining = 0
+
+        async def request(priority: int) -> None:
+            await bucket.acquire(priority, max_wait=5)
+            granted.append(priority)
+
+        tasks = []
+        for priority in (2, 0, 1):
+            tasks.append(asyncio.create_task(request(priority)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        assert bucket.used == 3
+
+    asyncio.run(run())
+    assert granted == [0, 1, 2]
+
+
+def test_observe_follows_github_headers():
+    async def run() -> dict:
+        bucket = RateBucket(CORE, limit=60, window_seconds=3600)
+        reset = int(time.time()) + 1800
+        await bucket.observe(
+            {
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "4321",
+                "X-RateLimit-Reset": str(reset),
+            }
+        )
+        return bucket.status()
+
+    status = asyncio.run(run())
+    assert (status["limit"], status["remaining"]) == (5000, 4321)
+
+
+def test_send_raises_when_the_reset_is_beyond_max_wait():
+    reset = str(int(time.time()) + 600)
+    calls = []
+
+    async def send():
+        calls.append(1)
+        return httpx.Response(
+            403,
+            headers={
+                "X-RateLimit-Limit": "60",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": reset,
+            },
+            request=httpx.Request("GET", "https://api.github.com/repos/a/b"),
+        )
+
+    scheduler = GithubScheduler(has_token=False, max_wait_seconds=1)
+    with pytest.raises(GithubRateLimitError):
+        asyncio.run(scheduler.send("https://api.github.com/repos/a/b", send))
+    assert len(calls) == 1
+    status = scheduler.status()[CORE]
+    assert status["remaining"] == 0 and status["rate_limited"] == 1
@@ -0,0 +1,164 @@
+import asyncio
+
+from app.ingest import sources
+from app.ingest.crawler import GITHUB_API, GITHUB_RAW, CrawlLimiter, host_key
+
+
+def test_host_key_buckets_github_and_other_hosts():
+    assert host_key("https://api.github.com/repos/a/b") == GITHUB_API
+    assert host_key("https://raw.githubusercontent.com/a/b/main/SKILL.md") == GITHUB_RAW
+    assert host_key("https://SkillsDir.dev/sitemap.xml") == "skillsdir.dev"
+    assert host_key("https://ghe.example.com/api/v3/repos/a/b", "ghe.example.com") == GITHUB_API
+
+
+def test_limiter_caps_each_host_and_the_global_total():
+    limiter = CrawlLimiter(max_in_flight=3, github_api=1, github_raw=2, per_host=1)
+    active: dict[str, int] = {}
+    peaks: dict[str, int] = {}
+
+    async def request(url: str) -> None:
+        key = host_key(url)
+        async with limiter.slot(url):
+            active[key] = active.get(key, 0) + 1
+            peaks[key] = max(peaks.get(key, 0), active[key])
+            await asyncio.sleep(0.001)
+            active[key] -= 1
+
+    urls = (
+        ["https://raw.githubusercontent.com/a/b/main/x"] * 6
+        + ["https://api.github.com/repos/a/b"] * 4
+        + ["https://skillsdir.dev/page"] * 4
+    )
+
+    async def run() -> None:
+        await asyncio.gather(*(request(url) for url in urls))
+
+    asyncio.run(run())
+    assert peaks == {GITHUB_RAW: 2, GITHUB_API: 1, "skillsdir.dev": 1}
+    assert limiter.peak_in_flight == 3
+    assert limiter.in_flight == 0
+
+
+class _FakeClient:
+    closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_run_ingest_sources_keeps_source_order_and_repo_dedupe(monkeypatch):
+    client = _FakeClient()
+    events: list[dict] = []
+    scanned: list[str] = []
+
+    async def fake_get_shared_http_client():
+        return client
+
+    async def fake_fetch_text(url, client=None):
+        if url.endswith("README.md"):
+            return "- [A](https://github.com/acme/alpha)\n- [B](https://github.com/acme/beta)"
+        # Later files finish first; results must still come back in crawl order.
+        await asyncio.sleep(0.01 if url.endswith("a/SKILL.md") else 0)
+        return f"content of {url}"
+
+    async def fake_candidates(
+        repo_full_name,
+        *,
+        allowed_path_globs=None,
+        min_repo_type="skills_only",
+        client=None,
+        response_cache=None,
+    ):
+        assert client is not None
+        scanned.append(repo_full_name)
+        return [
+            {
+                "path": f"skills/{name}/SKILL.md",
+                "url": f"https://raw.githubusercontent.com/{repo_full_name}/main/skills/{name}/SKILL.md",
+                "sha": name,
+            }
+            for name in ("a", "b")
+        ]
+
+    monkeypatch.setattr(sources, "get_shared_http_client", fake_get_shared_http_client)
+    monkeypatch.setattr(sources, "fetch_text", fake_fetch_text)
+    monkeypatch.setattr(sources, "list_repo_skills_candidates", fake_candidates)
+    monkeypatch.setattr(
+        sources,
+        "SOURCES",
+        [
+            {"id": "official", "type": "github_repo", "repo_full_name": "acme/beta"},
+            {
+                "id": "list",
+                "type": "markdown_list",
+                "url": "https://raw.githubusercontent.com/x/y/main/README.md",
+            },
+            {"id": "again", "type": "github_repo", "repo_full_name": "ACME/alpha"},
+        ],
+    )
+
+    results = asyncio.run(sources.run_ingest_sources(progress=events.append))
+
+    assert sorted(scanned) == ["acme/alpha", "acme/beta"]
+    assert [(r["source_id"], r["repo_full_name"], r["skill_path"]) for r in results] == [
+        ("official", "acme/beta", "skills/a/SKILL.md"),
+        ("official", "acme/beta", "skills/b/SKILL.md"),
+        ("list", "acme/alpha", "skills/a/SKILL.md"),
+        ("list", "acme/alpha", "skills/b/SKILL.md"),
+    ]
+    assert results[2]["discovered_from"] == "markdown_list:list"
+    # The shared client outlives the crawl.
+    assert not client.closed
+
+    done = [e["ingest_source_id"] for e in events if e["phase"] == "ingest_source_done"]
+    assert sorted(done) == ["list", "official"]
+    scan_events = [e for e in events if e["phase"] == "ingest_scan_repo"]
+    assert [
+        (e["ingest_repo_full_name"], e["ingest_discovered_repo_index"]) for e in scan_events
+    ] == [("acme/alpha", 1)]
+
+
+def test_run_ingest_sources_downloads_only_changed_files(monkeypatch):
+    fetched: list[str] = []
+
+    class _Index:
+        recorded = None
+
+        async def changed_candidates(self, repo_full_name, candidates, *, options_hash):
+            self.options_hash = options_hash
+            return [c for c in candidates if c["sha"] != "same"]
+
+        def record(self, repo_full_name, candidates, fetched_paths, *, options_hash):
+            self.recorded = (repo_full_name, len(candidates), fetched_paths)
+            assert options_hash == self.options_hash
+
+    async def fake_get_shared_http_client():
+        return _FakeClient()
+
+    async def fake_fetch_text(url, client=None):
+        fetched.append(url)
+        return "content"
+
+    async def fake_candidates(repo_full_name, **kwargs):
+        return [
+            {
+                "path": f"skills/{name}/SKILL.md",
+                "url": f"https://raw.githubusercontent.com/r/{name}",
+                "sha": sha,
+            }
+            for name, sha in (("a", "same"), ("b", "new"))
+        ]
+
+    monkeypatch.setattr(sources, "get_shared_http_client", fake_get_shared_http_client)
+    monkeypatch.setattr(sources, "fetch_text", fake_fetch_text)
+    monkeypatch.setattr(sources, "list_repo_skills_candidates", fake_candidates)
+    monkeypatch.setattr(
+        sources, "SOURCES", [{"id": "official", "type": "github_repo", "repo_full_name": "acme/x"}]
+    )
+
+    index = _Index()
+    results = asyncio.run(sources.run_ingest_sources(tree_index=index))
+
+    assert fetched == ["https://raw.githubusercontent.com/r/b"]
+    assert [r["skill_path"] for r in results] == ["skills/b/SKILL.md"]
+    assert index.recorded == ("acme/x", 2, {"skills/b/SKILL.md"})
@@ -0,0 +1,46 @@
+import asyncio
+
+import httpx
+
+from app.ingest import http
+from app.ingest.http import ConnectionStats
+
+
+def test_connection_stats_delta_and_reuse():
+    before = ConnectionStats(requests=10, connections_opened=4, http2_responses=2)
+    after = ConnectionStats(requests=25, connections_opened=6, http2_responses=12)
+    delta = after.since(before)
+    assert (delta.requests, delta.connections_opened, delta.http2_responses) == (15, 2, 10)
+    assert delta.connections_reused == 13
+    assert ConnectionStats(requests=1, connections_opened=3).connections_reused == 0
+
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    class _Settings:
+        ingest_http2 = True
+
+    monkeypatch.setattr(http, "h2", None)
+    assert http.http2_enabled(_Settings()) is False
+    monkeypatch.setattr(http, "h2", object())
+    assert http.http2_enabled(_Settings()) is True
+
+
+def test_fetch_text_reuses_the_shared_client(monkeypatch):
+    async def run() -> tuple:
+        client = await http.get_shared_http_client()
+        client._transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, text=request.url.path)
+        )
+        before = http.connection_stats.snapshot()
+        texts = [
+            await http.fetch_text("https://raw.githubusercontent.com/a"),
+            await http.fetch_text("https://x.dev/b"),
+        ]
+        same = (await http.get_shared_http_client()) is client
+        await http.close_shared_http_client()
+        return texts, same, client.is_closed, http.connection_stats.since(before)
+
+    texts, same, closed, stats = asyncio.run(run())
+    assert texts == ["/a", "/b"]
+    assert same and closed
+    assert stats.requests == 2
@@ -0,0 +1,157 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.models.public_skill_search import PublicSkillSearch
+from app.models.skill import Skill
+from app.repos.pagination import (
+    SortKey,
+    cursor_depth,
+    cursor_scope,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    order_by_keys,
+    page_count,
+)
+from app.repos.skill_repo import public_skill_sort_keys
+
+
+class _FakeRow(tuple):
+    """Tuple row exposing the labeled sort-key columns like a SQLAlchemy Row."""
+
+    def __new__(cls, values, labels):
+        row = super().__new__(cls, values)
+        row._mapping = dict(zip(labels, values))
+        return row
+
+
+def test_page_count():
+    assert page_count(0, 20) == 0
+    assert page_count(1, 20) == 1
+    assert page_count(41, 20) == 3
+
+
+def test_fetch_page_exact_uses_single_windowed_query(fake_session):
+    db = fake_session([[("skill-a", 57), ("skill-b", 57)]])
+    page_slice = asyncio.run(fetch_page(db, select(Skill.id), page=1, size=2, count_cap=0))
+    assert page_slice.total == 57
+    assert page_slice.total_estimated is False
+    assert page_slice.scalars() == ["skill-a", "skill-b"]
+    assert len(db.statements) == 1
+    assert "count(*) OVER ()" in db.statements[0]
+
+
+def test_fetch_page_capped_count_marks_estimate(fake_session):
+    db = fake_session([[("skill-a",)], [(1000,)]])
+    page_slice = asyncio.run(fetch_page(db, select(Skill.id), page=3, size=1, count_cap=1000))
+    assert page_slice.total == 1000
+    assert page_slice.total_estimated is True
+    assert "LIMIT" in db.statements[1]
+
+
+def test_fetch_page_past_last_page_falls_back_to_count(fake_session):
+    db = fake_session([[], [(12,)]])
+    page_slice = asyncio.run(fetch_page(db, select(Skill.id), page=9, size=20, count_cap=0))
+    assert page_slice.rows == []
+    assert page_slice.total == 12
+
+
+def test_cursor_roundtrip_keeps_datetime_and_uuid():
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    skill_id = uuid.uuid4()
+    cursor = encode_cursor("skills:newest", [created_at, skill_id])
+    assert decode_cursor(cursor, scope="skills:newest", arity=2) == [created_at, skill_id]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor("skills:oldest", ["x", "y"])])
+def test_decode_cursor_rejects_garbage_and_other_orderings(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, scope="skills:newest", arity=2)
+    assert exc_info.value.status_code == 422
+
+
+def test_fetch_page_cursor_seeks_without_offset_or_count(fake_session):
+    keys = [SortKey(Skill.created_at, descending=True), SortKey(Skill.id)]
+    stmt = select(Skill.id).order_by(*order_by_keys(keys))
+    created_at = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    labels = ["id", "_sort_key_0", "_sort_key_1"]
+    rows = [_FakeRow((f"skill-{i}", created_at, f"id-{i}"), labels) for i in range(3)]
+    db = fake_session([rows])
+    cursor = encode_cursor("skills:newest", [created_at, uuid.uuid4()])
+
+    page_slice = asyncio.run(
+        fetch_page(
+            db, stmt, page=1, size=2, sort_keys=keys, cursor=cursor, cursor_scope="skills:newest"
+        )
+    )
+
+    assert page_slice.total is None
+    assert page_slice.scalars() == ["skill-0", "skill-1"]
+    assert decode_cursor(page_slice.next_cursor, scope="skills:newest", arity=2)[1] == "id-1"
+    sql = db.statements[0]
+    assert len(db.statements) == 1
+    assert "OFFSET" not in sql and "OVER" not in sql
+    assert "skills.created_at <= " in sql
+    assert "skills.created_at = " in sql and "skills.id > " in sql
+
+
+@pytest.mark.parametrize("sort", ["newest", "oldest", "popularity"])
+def test_public_sort_keys_seek_with_one_row_comparison(sort, fake_session):
+    keys = public_skill_sort_keys(sort)
+    assert len({key.descending for key in keys}) == 1
+    stmt = select(PublicSkillSearch.skill_id).order_by(*order_by_keys(keys))
+    labels = ["skill_id"] + [f"_sort_key_{i}" for i in range(len(keys))]
+    created_at = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    values = {
+        "newest": [created_at, uuid.uuid4()],
+        "oldest": [created_at, uuid.uuid4()],
+        "popularity": [1.5, 2, 80.0, created_at, uuid.uuid4()],
+    }[sort]
+    db = fake_session([[_FakeRow(("skill-0", *values), labels)]])
+    cursor = encode_cursor(f"skills:{sort}", values)
+
+    scope = f"skills:{sort}"
+    asyncio.run(
+        fetch_page(db, stmt, page=1, size=2, sort_keys=keys, cursor=cursor, cursor_scope=scope)
+    )
+
+    sql = db.statements[0]
+    assert " OR " not in sql
+    assert (") < (" if keys[0].descending else ") > (") in sql
+    assert "TIMESTAMP WITH TIME ZONE" in sql
+
+
+def test_next_cursor_carries_the_served_depth(fake_session):
+    keys = [SortKey(Skill.created_at, descending=True), SortKey(Skill.id, descending=True)]
+    stmt = select(Skill.id).order_by(*order_by_keys(keys))
+    created_at = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    labels = ["id", "_sort_key_0", "_sort_key_1", "_total_count"]
+    rows = [_FakeRow((f"skill-{i}", created_at, f"id-{i}", 9), labels) for i in range(2)]
+    db = fake_session([rows])
+
+    page_slice = asyncio.run(
+        fetch_page(db, stmt, page=2, size=2, count_cap=0, sort_keys=keys, cursor_scope="s")
+    )
+    assert cursor_depth(page_slice.next_cursor) == 4
+
+    seek_rows = [_FakeRow((f"skill-{i}", created_at, f"id-{i}"), labels[:3]) for i in range(3)]
+    db = fake_session([seek_rows])
+    cursor = encode_cursor("s", [created_at, uuid.uuid4()], depth=4)
+    page_slice = asyncio.run(
+        fetch_page(db, stmt, page=1, size=2, sort_keys=keys, cursor=cursor, cursor_scope="s")
+    )
+    assert cursor_depth(page_slice.next_cursor) == 6
+    assert cursor_depth(None) == 0
+
+
+def test_cursor_scope_binds_filters():
+    assert cursor_scope("skills:newest", None, []) == "skills:newest"
+    tools = cursor_scope("skills:newest", "tools", ["k8s"])
+    assert tools.startswith("skills:newest:")
+    assert tools != cursor_scope("skills:newest", "docs", ["k8s"])
+    assert tools != cursor_scope("skills:newest", "tools", [])
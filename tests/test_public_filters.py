@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.skill import Skill
+from app.repos.public_filters import (
+    apply_public_visibility,
+    compute_is_public,
+    is_public_skill_url,
+    public_skill_conditions,
+)
+
+SKILL_URL = "https://github.com/acme/tools/blob/main/skills/lint/SKILL.md"
+
+
+def test_url_policy_matches_db_regexes():
+    assert is_public_skill_url(SKILL_URL)
+    assert is_public_skill_url(
+        "https://GitHub.com/acme/tools/blob/main/.claude/skills/lint/skill.md"
+    )
+    assert not is_public_skill_url(
+        "https://github.com/acme/tools/blob/main/docs/skills/lint/SKILL.md"
+    )
+    assert not is_public_skill_url("https://gitlab.com/acme/tools/blob/main/skills/lint/SKILL.md")
+    # `~*` anchors on the whole value; a trailing newline is not public.
+    assert not is_public_skill_url(SKILL_URL + "\n")
+    assert not is_public_skill_url(None)
+
+
+def test_visibility_is_computed_on_write():
+    skill = SimpleNamespace(is_official=True, is_verified=True, url=SKILL_URL, is_public=False)
+    assert apply_public_visibility(skill) is True and skill.is_public is True
+    skill.is_verified = False
+    assert apply_public_visibility(skill) is False and skill.is_public is False
+    assert compute_is_public(is_official=None, is_verified=True, url=SKILL_URL) is False
+
+
+def test_public_queries_filter_on_stored_flag():
+    sql = str(
+        select(Skill.id).where(*public_skill_conditions()).compile(dialect=postgresql.dialect())
+    )
+    assert "skills.is_public IS true" in sql
+    assert "~*" not in sql
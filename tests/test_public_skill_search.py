@@ -0,0 +1,141 @@
+import asyncio
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.api import packs, skills
+from app.repos import skill_repo
+from app.repos.pagination import PageSlice
+from app.repos.public_skill_search_repo import (
+    refresh_public_skill_popularity,
+    refresh_public_skill_search,
+)
+
+
+def test_refresh_upserts_public_rows_and_prunes_the_rest(fake_session):
+    db = fake_session()
+    skill_id = uuid.uuid4()
+    assert asyncio.run(refresh_public_skill_search(db, [skill_id, skill_id, None])) == 1
+    assert db.flushed == 1
+
+    upsert, prune = db.statements
+    upsert_params, prune_params = db.params
+    assert upsert.startswith("INSERT INTO public_skill_search")
+    assert "AND s.id IN" in upsert and "ON CONFLICT (skill_id) DO UPDATE SET" in upsert
+    assert prune.startswith("DELETE FROM public_skill_search AS ps WHERE NOT EXISTS")
+    assert "AND ps.skill_id IN" in prune
+    assert upsert_params["skill_ids"] == prune_params["skill_ids"] == [skill_id]
+    assert "WHERE s.is_public IS TRUE" in upsert
+    assert "repo_full_name, source_names" in upsert and "skill_sources ss" in upsert
+
+
+def test_refresh_with_no_ids_is_a_noop(fake_session):
+    db = fake_session()
+    assert asyncio.run(refresh_public_skill_search(db, [])) == 0
+    assert asyncio.run(refresh_public_skill_popularity(db, set())) == 0
+    assert db.statements == []
+
+    asyncio.run(refresh_public_skill_popularity(db))
+    (update,) = db.statements
+    (params,) = db.params
+    assert update.startswith("UPDATE public_skill_search AS ps")
+    assert "IS DISTINCT FROM" in update and params == {}
+
+
+def test_list_query_reads_only_the_projection(monkeypatch):
+    captured = []
+
+    async def fake_fetch_page(db, stmt, **kwargs):
+        captured.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return PageSlice()
+
+    monkeypatch.setattr(skills, "fetch_page", fake_fetch_page)
+    asyncio.run(
+        skills._list_skills_impl(
+            None,
+            q="kube",
+            category="tools",
+            tags=["k8s"],
+            sort="popularity",
+            page=1,
+            size=20,
+            mode="keyword",
+            weights=None,
+        )
+    )
+    sql = captured[0]
+    assert "FROM public_skill_search" in sql
+    assert "~*" not in sql and "JOIN" not in sql
+    assert "public_skill_search.tag_slugs &&" in sql
+    assert "public_skill_search.tag_text ILIKE" in sql
+
+
+def test_vector_candidates_apply_the_filters_before_the_top_k(monkeypatch, fake_session):
+    captured = []
+
+    async def fake_fetch_page(db, stmt, **kwargs):
+        captured.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return PageSlice()
+
+    async def fake_embedding(query_text, compute):
+        return [0.1] * 384
+
+    monkeypatch.setattr(skills, "fetch_page", fake_fetch_page)
+    monkeypatch.setattr(skills, "embeddings_enabled", lambda: True)
+    monkeypatch.setattr(skills.query_embedding_cache, "get_or_compute", fake_embedding)
+    db = fake_session()
+    asyncio.run(
+        skills._list_skills_impl(
+            db,
+            q="kube",
+            category="tools",
+            tags=["k8s"],
+            sort="popularity",
+            page=1,
+            size=20,
+            mode="vector",
+            weights=None,
+        )
+    )
+
+    candidates = captured[0].split("AS distance", 1)[1].split("AS vector_candidates", 1)[0]
+    assert "LIMIT" in candidates
+    assert "public_skill_search.embedding IS NOT NULL" in candidates
+    assert "public_skill_search.category_slug =" in candidates
+    assert "public_skill_search.tag_slugs &&" in candidates
+    assert "public_skill_search.trust_level" in candidates
+    assert db.statements == ["SET LOCAL hnsw.ef_search = 1000"]
+
+
+def test_plugin_and_developer_lists_read_only_the_projection(monkeypatch):
+    captured = []
+
+    async def fake_fetch_page(db, stmt, **kwargs):
+        captured.append((str(stmt.compile(dialect=postgresql.dialect())), kwargs["cursor_scope"]))
+        return PageSlice()
+
+    monkeypatch.setattr(skill_repo, "fetch_page", fake_fetch_page)
+    repo = skill_repo.SkillRepo(None)
+    query = skill_repo.SkillQuery(q="kube", category_slug="tools", tag_slugs=["k8s"], sort="newest")
+    asyncio.run(repo.list_skills(query))
+    asyncio.run(repo.list_skills_from_source_names(query, source_names=["marketplace", " "]))
+
+    (listed, list_scope), (plugins, plugin_scope) = captured
+    for sql in (listed, plugins):
+        assert "FROM public_skill_search" in sql and "JOIN" not in sql
+        assert "public_skill_search.tag_slugs &&" in sql
+        assert "public_skill_search.category_slug =" in sql
+    assert "source_names &&" in plugins and "source_names" not in listed.split("WHERE", 1)[1]
+    # Cursors are bound to the filters, not just the ordering.
+    assert list_scope.startswith("skills:newest:") and plugin_scope.startswith(
+        "skills:sources:newest:"
+    )
+
+
+def test_pack_aggregates_read_only_the_projection():
+    stmt = select(*packs._pack_columns()).group_by(packs.PublicSkillSearch.repo_full_name)
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "FROM public_skill_search" in sql and "JOIN" not in sql
+    assert "split_part" not in sql
+    assert "GROUP BY public_skill_search.repo_full_name" in sql
@@ -0,0 +1,59 @@
+import asyncio
+
+from app.cache.query_embeddings import (
+    QueryEmbeddingCache,
+    normalize_query,
+    pack_vector,
+    unpack_vector,
+)
+
+
+def test_normalize_query_collapses_case_and_whitespace():
+    assert normalize_query("  Kubernetes\tDeploy  AGENT ") == "kubernetes deploy agent"
+    assert normalize_query("ＡＰＩ") == "api"
+
+
+def test_pack_vector_is_float32_bytes():
+    raw = pack_vector([0.5, -1.25, 2.0])
+    assert len(raw) == 12
+    assert unpack_vector(raw) == [0.5, -1.25, 2.0]
+    assert unpack_vector(b"abc") is None
+
+
+def test_cache_hits_after_first_compute_and_evicts_lru():
+    cache = QueryEmbeddingCache(max_entries=2)
+    calls = []
+
+    async def compute(text):
+        calls.append(text)
+        return [float(len(text))]
+
+    async def run():
+        await cache.get_or_compute("Agent", compute)
+        await cache.get_or_compute("  agent ", compute)
+        await cache.get_or_compute("redis", compute)
+        await cache.get_or_compute("vector", compute)
+        await cache.get_or_compute("agent", compute)
+
+    asyncio.run(run())
+    assert calls == ["agent", "redis", "vector", "agent"]
+    assert cache.stats() == {"l1_hits": 1, "l2_hits": 0, "misses": 4, "l1_size": 2}
+
+
+def test_concurrent_misses_share_one_inference():
+    cache = QueryEmbeddingCache(max_entries=8)
+    calls = []
+
+    async def compute(text):
+        calls.append(text)
+        await asyncio.sleep(0.01)
+        return [1.0]
+
+    async def run():
+        return await asyncio.gather(
+            *[cache.get_or_compute("hybrid search", compute) for _ in range(5)]
+        )
+
+    results = asyncio.run(run())
+    assert results == [[1.0]] * 5
+    assert calls == ["hybrid search"]
@@ -1,4 +1,16 @@
-from app.cache.redis_l2 import build_cache_key
+import asyncio
+import time
+from types import SimpleNamespace
+
+from app.cache.redis_l2 import (
+    CATALOG_VERSION,
+    POPULARITY_VERSION,
+    RedisL2Cache,
+    RedisL2Config,
+    build_cache_key,
+    namespace_version_groups,
+    wrap_entry,
+)
 
 
 def test_build_cache_key_sorts_query_items_deterministically():
@@ -20,3 +32,135 @@ def test_build_cache_key_without_query():
     )
     assert key == "skills-marketplace:rankings:top10:/api/rankings/top10"
 
+
+
+def test_namespace_version_groups():
+    both = (CATALOG_VERSION, POPULARITY_VERSION)
+    assert namespace_version_groups("taxonomy:tags") == (CATALOG_VERSION,)
+    # Only popularity-ordered responses follow popularity bumps.
+    assert namespace_version_groups("skills:detail") == (CATALOG_VERSION,)
+    assert namespace_version_groups("rankings:top10") == both
+    assert namespace_version_groups("skills:list") == both
+    assert namespace_version_groups("skills:list", {"sort": "newest"}) == (CATALOG_VERSION,)
+    assert namespace_version_groups("skills:list", {"q": "redis"}) == (CATALOG_VERSION,)
+    assert namespace_version_groups("plugins:list", {"q": "redis"}) == both
+
+
+def test_key_for_request_embeds_namespace_versions():
+    cache = RedisL2Cache()
+    cache._config = RedisL2Config(enabled=True, url="redis://x", prefix="p", timeout_ms=150)
+    cache._versions = {CATALOG_VERSION: 7, POPULARITY_VERSION: 3}
+    request = SimpleNamespace(
+        url=SimpleNamespace(path="/api/tags"),
+        query_params=SimpleNamespace(multi_items=lambda: [("q", "db")], get=lambda k, d=None: d),
+    )
+
+    key = asyncio.run(cache.key_for_request(namespace="taxonomy:tags", request=request))
+    assert key == "p:taxonomy:tags:v7:/api/tags?q=db"
+    # Versions never move backwards (late pub/sub messages vs. newer reads).
+    cache._apply_versions({CATALOG_VERSION: "5", POPULARITY_VERSION: "4"})
+    key = asyncio.run(cache.key_for_request(namespace="skills:list", request=request))
+    assert key == "p:skills:list:v7.4:/api/tags?q=db"
+
+
+class _FakeRedis:
+    """SET NX PX / PTTL / DEL with expiry, shared like one Redis server."""
+
+    def __init__(self):
+        self.values = {}
+
+    def _live(self, key):
+        value = self.values.get(key)
+        if value is not None and value[1] <= time.monotonic():
+            del self.values[key]
+            return None
+        return value
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and self._live(key) is not None:
+            return None
+        self.values[key] = (value, time.monotonic() + px / 1000.0)
+        return True
+
+    async def pttl(self, key):
+        value = self._live(key)
+        return -2 if value is None else int((value[1] - time.monotonic()) * 1000)
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+
+def test_versions_changed_within_ignores_the_startup_read():
+    cache = RedisL2Cache()
+    cache._apply_versions({CATALOG_VERSION: 12}, announced=False)
+    assert not cache.versions_changed_within(5)
+    cache._apply_versions({CATALOG_VERSION: 13})
+    assert cache.versions_changed_within(5)
+    assert not cache.versions_changed_within(0)
+
+
+def test_popularity_bumps_are_debounced_across_processes():
+    server = _FakeRedis()
+    bumps = []
+    workers = []
+    for _ in range(3):
+        cache = RedisL2Cache()
+        cache._client = server
+
+        async def fake_bump(*groups):
+            bumps.append(groups)
+
+        cache.bump_namespaces = fake_bump
+        workers.append(cache)
+
+    async def run():
+        for _ in range(5):
+            for cache in workers:
+                await cache.bump_namespaces_debounced(POPULARITY_VERSION, window_seconds=0.05)
+        assert bumps == [(POPULARITY_VERSION,)]
+        # One trailing bump for the whole cluster, not one per process.
+        pending = [task for cache in workers for task in cache._pending_bumps.values()]
+        assert len(pending) == 1
+        await asyncio.gather(*pending)
+
+    asyncio.run(run())
+    assert bumps == [(POPULARITY_VERSION,), (POPULARITY_VERSION,)]
+
+
+class _FakePipeline:
+    def __init__(self, store):
+        self.store = store
+        self.calls = []
+
+    def hmget(self, key, fields):
+        self.calls.append((key, fields))
+
+    async def execute(self):
+        return [
+            [self.store.get(key, {}).get(field) for field in fields] for key, fields in self.calls
+        ]
+
+
+class _FakeBinaryClient:
+    def __init__(self, store):
+        self.store = store
+        self.pipelines = []
+
+    def pipeline(self, transaction=True):
+        self.pipelines.append(_FakePipeline(self.store))
+        return self.pipelines[-1]
+
+
+def test_get_entries_uses_one_pipeline():
+    store = {"k1": wrap_entry({"gzip": b"gz"}, soft_ttl_seconds=60)}
+    cache = RedisL2Cache()
+    cache._binary_client = _FakeBinaryClient(store)
+
+    entries = asyncio.run(cache.get_entries(["k1", None, "k2"], encodings=["gzip"]))
+    assert entries[0].bodies == {"gzip": b"gz"}
+    assert entries[1] is None and entries[2] is None
+    assert len(cache._binary_client.pipelines) == 1
+    assert cache._binary_client.pipelines[0].calls == [
+        ("k1", ["meta", "gzip", "identity"]),
+        ("k2", ["meta", "gzip", "identity"]),
+    ]
@@ -0,0 +1,292 @@
+import asyncio
+import time
+
+from fastapi import Response
+
+from app.api import response_cache
+from app.cache.memory_l1 import MemoryL1Cache
+from app.cache.redis_l2 import CacheEntry, unwrap_entry, wrap_entry
+from app.cache.response_body import (
+    accepted_encodings,
+    body_etag,
+    encode_body,
+    matching_entity_tag,
+    render_json,
+    select_body,
+)
+
+
+class _FakeL2:
+    def __init__(self, entry=None):
+        self.entry = entry
+        self.writes = []
+        self.published = []
+        self.etags = []
+
+    def enabled(self):
+        return True
+
+    async def key_for_request(self, *, namespace, request):
+        return f"test:{namespace}"
+
+    async def get_entry(self, key, *, encodings=()):
+        return self.entry
+
+    async def set_entry(self, key, bodies, *, soft_ttl_seconds, hard_ttl_seconds, etag=""):
+        self.writes.append((key, bodies, soft_ttl_seconds, hard_ttl_seconds))
+        self.etags.append(etag)
+
+    async def publish_invalidation(self, *, keys=(), prefixes=()):
+        self.published.extend(keys)
+
+    async def acquire_lock(self, key, ttl_ms):
+        return "token"
+
+    async def release_lock(self, key, token):
+        return None
+
+
+class _Request:
+    def __init__(self, accept_encoding="", if_none_match=None):
+        self.headers = {"accept-encoding": accept_encoding}
+        if if_none_match is not None:
+            self.headers["if-none-match"] = if_none_match
+
+
+def _call(build, *, response=None, request=None, db=None):
+    return response_cache.cached_json_response(
+        request=request,
+        response=response or Response(),
+        db=db,
+        namespace="skills:list",
+        cache_control="public",
+        ttl_seconds=30,
+        stale_seconds=120,
+        build_payload=build,
+    )
+
+
+def test_entry_envelope_soft_expiry():
+    fields = wrap_entry({"identity": b"[]"}, soft_ttl_seconds=30, now=1000.0)
+    assert unwrap_entry(fields, now=1029.0) == CacheEntry(
+        bodies={"identity": b"[]"}, stale=False, fresh_for=1.0, encodings=("identity",)
+    )
+    assert unwrap_entry(fields, now=1030.0).stale is True
+    # No metadata (missing key or foreign value): a miss.
+    assert unwrap_entry({"meta": None, "identity": b"[]"}, now=0.0) is None
+
+
+def test_body_encoding_and_selection():
+    small = render_json({"name": "검색"})
+    assert small == '{"name":"검색"}'.encode("utf-8")
+    assert encode_body(small) == {"identity": small}
+
+    large = render_json({"items": ["x" * 40] * 100})
+    bodies = encode_body(large)
+    assert "gzip" in bodies and "identity" not in bodies
+    assert select_body(bodies, ["gzip"]) == ("gzip", bodies["gzip"])
+    # Clients without gzip get the decompressed body.
+    assert select_body(bodies, []) == (None, large)
+
+    assert accepted_encodings("gzip, deflate, br;q=0") == ["gzip"]
+    assert accepted_encodings("identity") == []
+
+
+def _use_fakes(monkeypatch, fake, l1=None):
+    monkeypatch.setattr(response_cache, "redis_l2_cache", fake)
+    monkeypatch.setattr(response_cache, "response_l1_cache", l1 or MemoryL1Cache(0, 0))
+
+
+def test_concurrent_misses_are_coalesced(monkeypatch):
+    fake = _FakeL2()
+    _use_fakes(monkeypatch, fake)
+    calls = []
+
+    async def build(session):
+        calls.append(session)
+        await asyncio.sleep(0.01)
+        return {"items": [1]}
+
+    async def run():
+        return await asyncio.gather(*[_call(build) for _ in range(10)])
+
+    results = asyncio.run(run())
+    assert [r.body for r in results] == [b'{"items":[1]}'] * 10
+    assert {r.headers["X-Cache"] for r in results} == {"MISS"}
+    assert len(calls) == 1
+    assert fake.writes == [("test:skills:list", {"identity": b'{"items":[1]}'}, 30, 150)]
+    assert fake.published == ["test:skills:list"]
+    assert fake.etags == [body_etag(b'{"items":[1]}')]
+
+
+def test_miss_sends_etag_and_revalidates_to_304(monkeypatch):
+    fake = _FakeL2()
+    _use_fakes(monkeypatch, fake)
+
+    async def build(session):
+        return {"items": [1]}
+
+    first = asyncio.run(_call(build))
+    etag = first.headers["ETag"]
+    assert etag == '"%s"' % body_etag(b'{"items":[1]}')
+
+    # The next miss (e.g. after a version bump) rebuilds the same payload: 304, no body.
+    second = asyncio.run(_call(build, request=_Request(if_none_match=etag)))
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert second.body == b""
+
+
+def test_miss_without_redis_still_answers_if_none_match(monkeypatch):
+    fake = _FakeL2()
+    fake.enabled = lambda: False
+    _use_fakes(monkeypatch, fake)
+
+    async def build(session):
+        return {"items": [2]}
+
+    first = asyncio.run(_call(build))
+    second = asyncio.run(_call(build, request=_Request(if_none_match=first.headers["ETag"])))
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.status_code == 304
+    assert fake.writes == []
+
+
+def test_stale_entry_is_served_and_refreshed_in_background(monkeypatch):
+    fake = _FakeL2(entry=CacheEntry(bodies={"identity": b'{"items":["old"]}'}, stale=True))
+    _use_fakes(monkeypatch, fake)
+
+    class _Session:
+        async def __aenter__(self):
+            return "refresh-session"
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(response_cache, "ReadSessionLocal", _Session)
+    sessions = []
+
+    async def build(session):
+        sessions.append(session)
+        return {"items": ["new"]}
+
+    async def run():
+        served = await _call(build)
+        await asyncio.gather(*response_cache._refresh_tasks)
+        return served
+
+    served = asyncio.run(run())
+    assert served.headers["X-Cache"] == "STALE, redis-l2"
+    assert served.body == b'{"items":["old"]}'
+    assert sessions == ["refresh-session"]
+    assert fake.writes[0][1] == {"identity": b'{"items":["new"]}'}
+
+
+def test_l2_hit_fills_l1_within_soft_ttl(monkeypatch):
+    fake = _FakeL2(
+        entry=CacheEntry(bodies={"identity": b'{"items":[1]}'}, stale=False, fresh_for=5.0)
+    )
+    l1 = MemoryL1Cache(max_entries=8, ttl_seconds=30)
+    _use_fakes(monkeypatch, fake, l1)
+
+    async def build(session):
+        raise AssertionError("should not recompute")
+
+    first = asyncio.run(_call(build))
+    fake.entry = None
+    second = asyncio.run(_call(build))
+    assert first.headers["X-Cache"] == "HIT, redis-l2"
+    assert second.headers["X-Cache"] == "HIT, l1"
+    assert second.body == b'{"items":[1]}'
+    # Bounded by the L2 soft TTL (5s), not the L1 TTL (30s).
+    expires_at, _ = l1._entries["test:skills:list"]
+    assert expires_at - time.monotonic() <= 5.0
+
+
+def test_memory_l1_bounds_and_invalidation():
+    l1 = MemoryL1Cache(max_entries=2, ttl_seconds=10)
+    l1.set("p:skills:a", 1, ttl_seconds=60, now=0.0)
+    l1.set("p:skills:b", 2, ttl_seconds=3, now=0.0)
+    l1.set("p:packs:c", 3, ttl_seconds=60, now=0.0)
+    assert l1.get("p:skills:a", now=1.0) is None  # evicted (LRU, max 2 entries)
+    assert l1.get("p:skills:b", now=2.0) == 2
+    assert l1.get("p:skills:b", now=3.0) is None  # per-entry TTL
+    assert l1.get("p:packs:c", now=9.0) == 3
+    assert l1.get("p:packs:c", now=10.0) is None  # L1 TTL caps the requested 60s
+    l1.set("p:skills:d", 4, ttl_seconds=60, now=20.0)
+    l1.set("p:packs:e", 5, ttl_seconds=60, now=20.0)
+    assert l1.invalidate(prefixes=["p:skills:"]) == 1
+    assert l1.invalidate(keys=["p:packs:e", "missing"]) == 1
+    assert l1.stats()["size"] == 0
+
+
+def test_hit_sends_stored_compressed_bytes(monkeypatch):
+    bodies = encode_body(render_json({"items": ["x" * 40] * 100}))
+    fake = _FakeL2(entry=CacheEntry(bodies=bodies, stale=False, fresh_for=5.0))
+    _use_fakes(monkeypatch, fake)
+
+    async def build(session):
+        raise AssertionError("should not recompute")
+
+    served = asyncio.run(_call(build, request=_Request("gzip, deflate")))
+    assert served.headers["Content-Encoding"] == "gzip"
+    assert served.headers["Vary"] == "Accept-Encoding"
+    assert served.body == bodies["gzip"]
+
+
+def test_matching_entity_tag():
+    assert matching_entity_tag('"abc"', "abc") == '"abc"'
+    assert matching_entity_tag('W/"abc-gzip", "zzz"', "abc") == '"abc-gzip"'
+    assert matching_entity_tag("*", "abc") == '"abc"'
+    assert matching_entity_tag('"abd"', "abc") is None
+    assert matching_entity_tag('"abc"', "") is None
+
+
+def test_matching_if_none_match_returns_304(monkeypatch):
+    body = render_json({"items": [1]})
+    etag = body_etag(body)
+    fake = _FakeL2(
+        entry=CacheEntry(bodies={"identity": body}, stale=False, fresh_for=5.0, etag=etag)
+    )
+    _use_fakes(monkeypatch, fake)
+
+    async def build(session):
+        raise AssertionError("should not recompute")
+
+    served = asyncio.run(_call(build, request=_Request()))
+    assert served.status_code == 200
+    assert served.headers["ETag"] == f'"{etag}"'
+
+    revalidated = asyncio.run(_call(build, request=_Request(if_none_match=f'"{etag}"')))
+    assert revalidated.status_code == 304
+    assert revalidated.body == b""
+    assert revalidated.headers["ETag"] == f'"{etag}"'
+    assert revalidated.headers["Cache-Control"] == "public"
+
+
+def test_miss_right_after_a_version_bump_is_built_on_the_primary(monkeypatch):
+    fake = _FakeL2()
+    recent = [True]
+    fake.versions_changed_within = lambda seconds: recent[0]
+    _use_fakes(monkeypatch, fake)
+    monkeypatch.setattr(response_cache, "has_read_replica", lambda: True)
+
+    class _Primary:
+        async def __aenter__(self):
+            return "primary-session"
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(response_cache, "AsyncSessionLocal", _Primary)
+    sessions = []
+
+    async def build(session):
+        sessions.append(session)
+        return {"items": [len(sessions)]}
+
+    asyncio.run(_call(build, db="replica-session"))
+    recent[0] = False
+    asyncio.run(_call(build, db="replica-session"))
+    # The request's replica session is used again once the lag window has passed.
+    assert sessions == ["primary-session", "replica-session"]
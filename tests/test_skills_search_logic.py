@@ -1,10 +1,15 @@
+import pytest
 from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
 
 from app.api.skills import (
     _build_match_reason,
+    _hnsw_ef_search,
     _parse_search_weights,
     _resolve_active_mode,
+    _vector_candidate_limit,
 )
+from app.repos.search_filters import build_skill_keyword_search, prefix_tsquery_text
 
 
 def test_parse_search_weights_defaults():
@@ -43,3 +48,70 @@ def test_build_match_reason_variants():
     assert _build_match_reason("hybrid", 0.8, 0.0, False) == "hybrid: keyword-heavy"
     assert _build_match_reason("hybrid", 0.0, 0.7, False) == "hybrid: vector-heavy"
     assert _build_match_reason("hybrid", 0.9, 0.0, True) == "keyword match (vector fallback)"
+
+
+def test_vector_candidate_limit_covers_requested_page():
+    assert _vector_candidate_limit(1, 20, 200) == 200
+    assert _vector_candidate_limit(15, 20, 200) == 300
+    assert _vector_candidate_limit(1, 20, 0) == 20
+    # Cursor requests arrive with page=1; the cursor's depth keeps the crawl covered.
+    assert _vector_candidate_limit(1, 20, 200, depth=400) == 420
+    assert _vector_candidate_limit(50, 20, 200) == 1000
+    assert _vector_candidate_limit(1, 20, 5000) == 1000
+
+
+@pytest.mark.parametrize("page,depth", [(51, 0), (1, 990)])
+def test_vector_candidate_limit_rejects_pages_past_the_hnsw_ceiling(page, depth):
+    with pytest.raises(HTTPException) as exc_info:
+        _vector_candidate_limit(page, 20, 200, depth=depth)
+    assert exc_info.value.status_code == 422
+
+
+def test_hnsw_ef_search_bounds():
+    assert _hnsw_ef_search(10) == 40
+    assert _hnsw_ef_search(200) == 200
+    assert _hnsw_ef_search(5000) == 1000
+    assert _hnsw_ef_search(200, filtered=True) == 1000
+
+
+def _compiled(expr) -> str:
+    return str(expr.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_keyword_score_keeps_the_per_field_weights():
+    # Each matching field adds its weight, exactly as the former ILIKE scorer did.
+    sql = _compiled(build_skill_keyword_search("docker").score)
+    assert "ts_rank_cd" not in sql
+    terms = sql.split(" + ")
+    assert len(terms) == 6
+    expected = [
+        ("skills.name ILIKE '%%docker%%'", "'{a}'", "THEN 1.0 "),
+        ("skills.slug ILIKE '%%docker%%'", None, "THEN 0.9 "),
+        ("'{b}'", None, "THEN 0.75 "),
+        ("'{c}'", None, "THEN 0.65 "),
+        ("'{d}'", None, "THEN 0.2 "),
+        ("tags.name ILIKE '%%docker%%'", None, "THEN 0.8 "),
+    ]
+    for term, (predicate, extra, weight) in zip(terms, expected):
+        assert predicate in term and weight in term
+        if extra:
+            assert extra in term
+
+
+def test_keyword_match_covers_whole_words_prefixes_and_substrings():
+    match_sql = _compiled(build_skill_keyword_search("kub").match)
+    assert "search_vector @@ websearch_to_tsquery('simple'::regconfig, 'kub')" in match_sql
+    assert "search_vector @@ to_tsquery('simple'::regconfig, 'kub:*')" in match_sql
+    assert "skills.name ILIKE '%%kub%%'" in match_sql
+    assert "skills.content ILIKE" not in match_sql
+
+
+def test_prefix_tsquery_text_is_sanitized_and_skips_websearch_syntax():
+    assert prefix_tsquery_text("Kube ops") == "kube:* & ops:*"
+    assert prefix_tsquery_text("c++ & drop'; --") == "c:* & drop:*"
+    assert prefix_tsquery_text("pdf-tools") == "pdf:* & tools:*"
+    assert prefix_tsquery_text('"exact phrase"') is None
+    assert prefix_tsquery_text("docker -compose") is None
+    assert prefix_tsquery_text("pdf or docx") is None
+    assert prefix_tsquery_text("orchestrate") == "orchestrate:*"
+    assert prefix_tsquery_text("!!!") is None
@@ -0,0 +1,133 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.ingest import tree_index as tree_index_module
+from app.ingest.tree_index import TreeIndex, scan_options_hash
+
+
+def _candidates(tree_sha: str, blobs: dict[str, str], branch: str = "main") -> list[dict]:
+    return [
+        {
+            "path": path,
+            "url": f"https://raw.githubusercontent.com/acme/skills/{branch}/{path}",
+            "sha": sha,
+            "repo_tree_sha": tree_sha,
+            "repo_default_branch": branch,
+        }
+        for path, sha in blobs.items()
+    ]
+
+
+def _entry(tree_sha: str, blob_shas: dict[str, str], branch: str = "main", options_hash: str = ""):
+    return SimpleNamespace(
+        default_branch=branch, tree_sha=tree_sha, blob_shas=blob_shas, options_hash=options_hash
+    )
+
+
+def _index_with(
+    monkeypatch, session_factory, stored: dict, missing_urls: frozenset = frozenset()
+) -> TreeIndex:
+    async def fake_get(db, repo_full_name):
+        return stored.get(repo_full_name.lower())
+
+    async def fake_existing(db, urls):
+        return {url for url in urls if url not in missing_urls}
+
+    monkeypatch.setattr(tree_index_module, "get_tree_index", fake_get)
+    monkeypatch.setattr(tree_index_module, "get_existing_raw_external_ids", fake_existing)
+    return TreeIndex(session_factory=session_factory)
+
+
+def test_unchanged_tree_skips_the_repo(monkeypatch, fake_session):
+    stored = {"acme/skills": _entry("t1", {"a": "1", "b": "2"})}
+    index = _index_with(monkeypatch, fake_session, stored)
+    candidates = _candidates("t1", {"a": "1", "b": "2"})
+
+    assert asyncio.run(index.changed_candidates("Acme/Skills", candidates)) == []
+    index.record("Acme/Skills", candidates, set())
+    assert (index.repos_unchanged, index.files_unchanged, index.files_changed) == (1, 2, 0)
+    assert index.pending == {}
+
+
+def test_changed_tree_fetches_only_changed_blobs(monkeypatch, fake_session):
+    stored = {"acme/skills": _entry("t1", {"a": "1", "b": "2"})}
+    index = _index_with(monkeypatch, fake_session, stored)
+    candidates = _candidates("t2", {"a": "1", "b": "3", "c": "4"})
+
+    changed = asyncio.run(index.changed_candidates("acme/skills", candidates))
+    assert [c["path"] for c in changed] == ["b", "c"]
+    assert (index.files_unchanged, index.files_changed) == (1, 2)
+
+    # "c" failed to download: keep comparing blobs next time (no tree SHA), keep old SHAs.
+    index.record("acme/skills", candidates, {"b"})
+    assert index.pending["acme/skills"]["tree_sha"] == ""
+    assert index.pending["acme/skills"]["blob_shas"] == {"a": "1", "b": "3"}
+
+    index.record("acme/skills", candidates, {"b", "c"})
+    assert index.pending["acme/skills"]["tree_sha"] == "t2"
+    assert index.pending["acme/skills"]["blob_shas"] == {"a": "1", "b": "3", "c": "4"}
+
+
+def test_new_repo_or_branch_change_fetches_everything(monkeypatch, fake_session):
+    stored = {"acme/skills": _entry("t1", {"a": "1"}, branch="master")}
+    index = _index_with(monkeypatch, fake_session, stored)
+
+    moved = _candidates("t1", {"a": "1"}, branch="main")
+    assert asyncio.run(index.changed_candidates("acme/skills", moved)) == moved
+    fresh = _candidates("t9", {"x": "1"})
+    assert asyncio.run(index.changed_candidates("acme/new", fresh)) == fresh
+
+
+def test_save_persists_pending_entries(monkeypatch, fake_session):
+    saved = []
+
+    async def fake_save(db, entries):
+        saved.extend(entries)
+        return len(saved)
+
+    monkeypatch.setattr(tree_index_module, "save_tree_index", fake_save)
+    index = _index_with(monkeypatch, fake_session, {})
+    candidates = _candidates("t1", {"a": "1"})
+    asyncio.run(index.changed_candidates("acme/skills", candidates))
+    index.record("acme/skills", candidates, {"a"})
+
+    db = fake_session()
+    assert asyncio.run(index.save(db)) == 1
+    assert db.committed and index.pending == {}
+    assert saved == [
+        {
+            "repo_full_name": "acme/skills",
+            "default_branch": "main",
+            "tree_sha": "t1",
+            "blob_shas": {"a": "1"},
+            "options_hash": "",
+        }
+    ]
+
+
+def test_changed_scan_options_fetch_everything(monkeypatch, fake_session):
+    old = scan_options_hash({"allowed_path_globs": ["skills/*/SKILL.md"], "max_skill_files": 200})
+    new = scan_options_hash({"allowed_path_globs": ["skills/*/SKILL.md"], "max_skill_files": 500})
+    assert old != new
+    stored = {"acme/skills": _entry("t1", {"a": "1"}, options_hash=old)}
+    index = _index_with(monkeypatch, fake_session, stored)
+    candidates = _candidates("t1", {"a": "1", "b": "2"})
+
+    changed = asyncio.run(index.changed_candidates("acme/skills", candidates, options_hash=new))
+    assert changed == candidates
+    index.record("acme/skills", candidates, {"a", "b"}, options_hash=new)
+    assert index.pending["acme/skills"]["options_hash"] == new
+
+
+def test_unchanged_tree_refetches_deleted_raw_rows(monkeypatch, fake_session):
+    stored = {"acme/skills": _entry("t1", {"a": "1", "b": "2"})}
+    candidates = _candidates("t1", {"a": "1", "b": "2"})
+    missing_urls = frozenset({candidates[1]["url"]})
+    index = _index_with(monkeypatch, fake_session, stored, missing_urls=missing_urls)
+
+    changed = asyncio.run(index.changed_candidates("acme/skills", candidates))
+    assert [c["path"] for c in changed] == ["b"]
+    assert (index.repos_unchanged, index.files_unchanged, index.files_changed) == (0, 1, 1)
+
+    index.record("acme/skills", candidates, {"b"})
+    assert index.pending["acme/skills"]["tree_sha"] == "t1"
@@ -0,0 +1,61 @@
+import asyncio
+
+from fastapi import FastAPI, Response
+
+import app.main
+from app.cache import hit_log
+from app.workers import warm_cache
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.added = []
+
+    def enabled(self):
+        return True
+
+    async def add_hits(self, name, counts, *, keep):
+        self.added.append((name, counts, keep))
+
+
+def test_hit_log_buffers_counts_until_flush(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(hit_log, "redis_l2_cache", fake)
+    log = hit_log.HitLog("search", flush_interval_seconds=3600, keep=50)
+
+    async def run():
+        log.record("/api/skills?q=redis")
+        log.record("/api/skills?q=redis")
+        log.record("/api/skills?q=pdf")
+        assert fake.added == []
+        await log.flush()
+
+    asyncio.run(run())
+    assert fake.added == [("search", {"/api/skills?q=redis": 2, "/api/skills?q=pdf": 1}, 50)]
+
+
+def test_warm_paths_counts_computed_and_cached(monkeypatch):
+    api = FastAPI()
+    seen_headers = []
+
+    @api.get("/api/rankings/top10")
+    def top10(response: Response):
+        response.headers["X-Cache"] = "MISS"
+        return []
+
+    @api.get("/api/tags")
+    def tags(request_response: Response):
+        request_response.headers["X-Cache"] = "HIT, redis-l2"
+        return []
+
+    @api.middleware("http")
+    async def capture(request, call_next):
+        seen_headers.append(request.headers.get(hit_log.WARMER_HEADER))
+        return await call_next(request)
+
+    monkeypatch.setattr(app.main, "create_app", lambda: api)
+    stats = asyncio.run(
+        warm_cache.warm_paths(["/api/rankings/top10", "/api/tags", "/api/missing"], concurrency=2)
+    )
+    assert stats == {"requested": 3, "computed": 1, "cached": 1, "errors": 1}
+    assert seen_headers == ["1", "1", "1"]
@@ -21,6 +21,8 @@ interface CacheProfile {
 
 interface ServerCacheEntry {
     data: unknown;
+    // API validator; refreshes send it as If-None-Match and keep `data` on 304.
+    etag: string | null;
     freshUntil: number;
     staleUntil: number;
 }
@@ -91,25 +93,51 @@ function pruneServerCache(now: number): void {
     }
 }
 
-function readServerCache(key: string, now: number): { state: "fresh" | "stale"; data: unknown } | null {
+function readServerCache(
+    key: string,
+    now: number,
+): { state: "fresh" | "stale"; data: unknown; etag: string | null } | null {
     const cached = serverResponseCache.get(key);
     if (!cached) return null;
-    if (now <= cached.freshUntil) return { state: "fresh", data: cached.data };
-    if (now <= cached.staleUntil) return { state: "stale", data: cached.data };
+    if (now <= cached.freshUntil) return { state: "fresh", data: cached.data, etag: cached.etag };
+    if (now <= cached.staleUntil) return { state: "stale", data: cached.data, etag: cached.etag };
     serverResponseCache.delete(key);
     return null;
 }
 
-function writeServerCache(key: string, data: unknown, profile: CacheProfile, now: number): void {
+function writeServerCache(
+    key: string,
+    data: unknown,
+    etag: string | null,
+    profile: CacheProfile,
+    now: number,
+): void {
     serverResponseCache.set(key, {
         data,
+        etag,
         freshUntil: now + profile.ttlMs,
         staleUntil: now + profile.ttlMs + profile.staleWhileRevalidateMs,
     });
     pruneServerCache(now);
 }
 
+interface FetchResult<T> {
+    data: T | null;
+    etag: string | null;
+    notModified: boolean;
+}
+
 async function fetchJson<T>(endpoint: string, fullUrl: string, config: NextFetchInit): Promise<T> {
+    const result = await fetchJsonConditional<T>(endpoint, fullUrl, config, null);
+    return result.data as T;
+}
+
+async function fetchJsonConditional<T>(
+    endpoint: string,
+    fullUrl: string,
+    config: NextFetchInit,
+    ifNoneMatch: string | null,
+): Promise<FetchResult<T>> {
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), 8000);
     const isDev = process.env.NODE_ENV !== "production";
@@ -121,10 +149,21 @@ async function fetchJson<T>(endpoint: string, fullUrl: string, config: NextFetch
 
         const response = await fetch(fullUrl, {
             ...config,
+            ...(ifNoneMatch
+                ? {
+                      // Revalidation must reach the API; a 304 has no body for fetch's own cache.
+                      cache: "no-store" as RequestCache,
+                      headers: { ...(config.headers as Record<string, string>), "If-None-Match": ifNoneMatch },
+                  }
+                : {}),
             signal: controller.signal,
         });
         clearTimeout(timeoutId);
 
+        if (response.status === 304 && ifNoneMatch) {
+            return { data: null, etag: response.headers.get("etag") || ifNoneMatch, notModified: true };
+        }
+
         if (!response.ok) {
             if (response.status === 401) {
                 throw new ApiError(response.status, response.statusText);
@@ -135,11 +174,12 @@ async function fetchJson<T>(endpoint: string, fullUrl: string, config: NextFetch
             throw new ApiError(response.status, response.statusText);
         }
 
+        const etag = response.headers.get("etag");
         if (response.status === 204) {
-            return {} as T;
+            return { data: {} as T, etag, notModified: false };
         }
 
-        return response.json() as Promise<T>;
+        return { data: (await response.json()) as T, etag, notModified: false };
     } catch (error) {
         clearTimeout(timeoutId);
         console.error(`[API Fetch Failed] ${endpoint}:`, error);
@@ -167,9 +207,11 @@ async function fetchWithServerCache<T>(
     const runRefresh = async () => {
         const existing = inflightRefreshes.get(key);
         if (existing) return existing as Promise<T>;
-        const refresh = fetchJson<T>(endpoint, fullUrl, config)
-            .then((data) => {
-                writeServerCache(key, data, profile, Date.now());
+        // Stale entries revalidate with their ETag: an unchanged payload costs a 304.
+        const refresh = fetchJsonConditional<T>(endpoint, fullUrl, config, cached?.etag ?? null)
+            .then((result) => {
+                const data = result.notModified ? (cached?.data as T) : (result.data as T);
+                writeServerCache(key, data, result.etag, profile, Date.now());
                 return data;
             })
             .finally(() => {